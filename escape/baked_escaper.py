@@ -1,4 +1,4 @@
-from typing import List, Dict, Type, Union, Callable, Optional, Any
+from typing import List, Dict, Tuple, Type, Union, Callable, Optional, Any
 from types import TracebackType
 
 try:
@@ -6,7 +6,7 @@ try:
 except ImportError:  # pragma: no cover
     EllipsisType = type(...)  # type: ignore[misc, unused-ignore] # pragma: no cover
 
-from inspect import isclass
+from importlib import import_module
 from escape.wrapper import Wrapper
 
 
@@ -36,7 +36,7 @@ class BakedEscaper:
 
     def notify_arguments(self, *args: Union[Callable[..., Any], Type[BaseException], EllipsisType], **kwargs: Any) -> None:
         for argument in args:
-            if not (isclass(argument) and issubclass(argument, BaseException)) and not isinstance(argument, EllipsisType):
+            if not (isinstance(argument, type) and issubclass(argument, BaseException)) and not isinstance(argument, EllipsisType):
                 raise ValueError('You are using the baked escaper object for the wrong purpose.')
             self.args.append(argument)
 
@@ -50,3 +50,12 @@ class BakedEscaper:
 
     def __exit__(self, exception_type: Optional[Type[BaseException]], exception_value: Optional[BaseException], traceback: Optional[TracebackType]) -> bool:
         return self.wrapper_for_simple_contexts.__exit__(exception_type, exception_value, traceback)
+
+    def __reduce__(self) -> Tuple[Callable[..., 'BakedEscaper'], Tuple[Any, ...]]:
+        return self.restore, (self.args, self.kwargs)
+
+    @classmethod
+    def restore(cls, args: List[Union[Callable[..., Any], Type[BaseException], EllipsisType]], kwargs: Dict[str, Any]) -> 'BakedEscaper':
+        escaper = cls(import_module('escape'))
+        escaper.notify_arguments(*args, **kwargs)
+        return escaper
@@ -0,0 +1,129 @@
+import asyncio
+from collections import Counter
+from typing import List, Dict, Tuple, Callable, Awaitable, Sequence, Any
+
+from escape.message_templates import describe_counts
+from escape.wrapper import Wrapper
+
+
+class Batcher:
+    def __init__(self, batch_function: Callable[[List[Any]], Awaitable[Sequence[Any]]], wrapper: Wrapper, max_batch: int, max_delay: float) -> None:
+        self.batch_function: Callable[[List[Any]], Awaitable[Sequence[Any]]] = batch_function
+        self.wrapper: Wrapper = wrapper
+        self.max_batch: int = max_batch
+        self.max_delay: float = max_delay
+
+        self.queues: Dict[asyncio.AbstractEventLoop, List[Tuple[Any, 'asyncio.Future[Any]']]] = {}
+        self.timers: Dict[asyncio.AbstractEventLoop, asyncio.Handle] = {}
+        self.tasks: Dict['asyncio.Task[None]', None] = {}
+
+    async def __call__(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        queue = self.queues.setdefault(loop, [])
+        queue.append((item, future))
+
+        if len(queue) >= self.max_batch:
+            self.flush(loop)
+        elif len(queue) == 1:
+            if self.max_delay:
+                self.timers[loop] = loop.call_later(self.max_delay, self.flush, loop)
+            else:
+                self.timers[loop] = loop.call_soon(self.flush, loop)
+
+        return await future
+
+    def flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        timer = self.timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+
+        task = loop.create_task(self.run_batch(self.queues.pop(loop)))
+        self.tasks[task] = None
+        task.add_done_callback(self.tasks.pop)
+
+    async def run_batch(self, batch: List[Tuple[Any, 'asyncio.Future[Any]']]) -> None:
+        wrapper = self.wrapper
+        wrapped_doc = wrapper.wrapped_doc
+        function_name = getattr(self.batch_function, '__name__', repr(self.batch_function))
+
+        try:
+            wrapper.run_callback(wrapper.before)
+            results = await self.batch_function([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f'The batch function returned {len(results)} results for {len(batch)} items.')
+
+        except wrapper.exceptions as e:
+            if wrapper.error_log_message is None:
+                exception_massage = '' if not str(e) else f' ("{e}")'
+                wrapper.logger.exception(f'When executing batch function "{function_name}"{wrapped_doc} for {len(batch)} items, the exception "{type(e).__name__}"{exception_massage} was suppressed.')
+            else:
+                wrapper.logger.exception(wrapper.error_log_message)
+            for _, future in batch:
+                self.set_default(future, e)
+            wrapper.run_callback(wrapper.error_callback)
+            return
+
+        except BaseException as e:
+            if wrapper.error_log_message is None:
+                exception_massage = '' if not str(e) else f' ("{e}")'
+                wrapper.logger.error(f'When executing batch function "{function_name}"{wrapped_doc} for {len(batch)} items, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
+            else:
+                wrapper.logger.error(wrapper.error_log_message)
+            for _, future in batch:
+                self.set_exception(future, e)
+            wrapper.run_callback(wrapper.error_callback)
+            return
+
+        suppressed: 'Counter[str]' = Counter()
+        not_suppressed: 'Counter[str]' = Counter()
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, wrapper.exceptions):
+                suppressed[type(result).__name__] += 1
+                self.set_default(future, result)
+            elif isinstance(result, BaseException):
+                not_suppressed[type(result).__name__] += 1
+                self.set_exception(future, result)
+            else:
+                self.set_result(future, result)
+
+        if suppressed or not_suppressed:
+            if wrapper.error_log_message is None:
+                if suppressed:
+                    wrapper.logger.error(f'When executing batch function "{function_name}"{wrapped_doc} for {len(batch)} items, {sum(suppressed.values())} exceptions were suppressed: {describe_counts(suppressed)}.')
+                if not_suppressed:
+                    wrapper.logger.error(f'When executing batch function "{function_name}"{wrapped_doc} for {len(batch)} items, {sum(not_suppressed.values())} exceptions were not suppressed: {describe_counts(not_suppressed)}.')
+            else:
+                wrapper.logger.error(wrapper.error_log_message)
+            wrapper.run_callback(wrapper.error_callback)
+
+        else:
+            if wrapper.success_logging:
+                if wrapper.success_log_message is None:
+                    wrapper.logger.info(f'The batch function "{function_name}"{wrapped_doc} completed successfully for {len(batch)} items.')
+                else:
+                    wrapper.logger.info(wrapper.success_log_message)
+            wrapper.run_callback(wrapper.success_callback)
+
+    def set_default(self, future: 'asyncio.Future[Any]', exception: BaseException) -> None:
+        try:
+            default = self.wrapper.get_default(exception)
+        except BaseException as e:
+            self.set_exception(future, e)
+        else:
+            self.set_result(future, default)
+
+    @staticmethod
+    def set_result(future: 'asyncio.Future[Any]', result: Any) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def set_exception(future: 'asyncio.Future[Any]', exception: BaseException) -> None:
+        if not future.done():
+            if isinstance(exception, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exception)
@@ -0,0 +1,71 @@
+import sys
+from collections import Counter
+from types import TracebackType
+from typing import List, Type, Optional
+
+from escape.message_templates import describe_counts
+from escape.wrapper import Wrapper
+
+
+class ErrorCollector:
+    def __init__(self, wrapper: Wrapper, max_exceptions: int, raise_group: bool) -> None:
+        if isinstance(max_exceptions, bool) or not isinstance(max_exceptions, int) or max_exceptions < 0:
+            raise ValueError('The maximum number of collected exceptions must be a non-negative integer.')
+
+        self.wrapper: Wrapper = wrapper
+        self.max_exceptions: int = max_exceptions
+        self.raise_group: bool = raise_group and sys.version_info >= (3, 11)
+        self.depth: int = 0
+        self.exceptions: List[BaseException] = []
+        self.counter: 'Counter[str]' = Counter()
+
+    def __enter__(self) -> 'ErrorCollector':
+        self.depth += 1
+        return self
+
+    def __exit__(self, exception_type: Optional[Type[BaseException]], exception_value: Optional[BaseException], traceback: Optional[TracebackType]) -> bool:
+        result = False
+
+        if exception_value is not None:
+            if isinstance(exception_value, self.wrapper.exceptions):
+                self.counter[type(exception_value).__name__] += 1
+                if len(self.exceptions) < self.max_exceptions:
+                    self.exceptions.append(exception_value)
+                result = True
+            else:
+                self.log_not_suppressed(exception_value)
+
+        self.depth -= 1
+        if not self.depth and self.counter:
+            self.report(result or exception_value is None)
+
+        return result
+
+    @property
+    def suppressed(self) -> int:
+        return sum(self.counter.values())
+
+    def report(self, can_raise: bool) -> None:
+        wrapper = self.wrapper
+        exceptions = self.exceptions
+        message = f'When executing the code block{wrapper.wrapped_doc}, {self.suppressed} exceptions were suppressed: {describe_counts(self.counter)}.'
+
+        self.exceptions = []
+        self.counter = Counter()
+
+        if self.raise_group and can_raise and exceptions:
+            raise BaseExceptionGroup(message, exceptions)  # pragma: no cover # noqa: F821
+
+        if wrapper.error_log_message is None:
+            wrapper.logger.error(message)
+        else:
+            wrapper.logger.error(wrapper.error_log_message)
+
+    def log_not_suppressed(self, exception: BaseException) -> None:
+        wrapper = self.wrapper
+
+        if wrapper.error_log_message is None:
+            exception_massage = '' if not str(exception) else f' ("{exception}")'
+            wrapper.logger.error(f'The "{type(exception).__name__}"{exception_massage} exception was not suppressed inside the context{wrapper.wrapped_doc}.')
+        else:
+            wrapper.logger.error(wrapper.error_log_message)
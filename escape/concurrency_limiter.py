@@ -0,0 +1,55 @@
+import asyncio
+from threading import BoundedSemaphore
+from weakref import WeakKeyDictionary
+from typing import Optional, NoReturn
+
+from escape.errors import ConcurrencyLimitExceededError
+
+
+class ConcurrencyLimiter:
+    def __init__(self, max_concurrency: int, timeout: Optional[float]) -> None:
+        self.max_concurrency: int = max_concurrency
+        self.timeout: Optional[float] = timeout
+        self.semaphore: BoundedSemaphore = BoundedSemaphore(max_concurrency)
+        self.async_semaphores: 'WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = WeakKeyDictionary()
+
+    def acquire(self) -> None:
+        if self.timeout is None:
+            acquired = self.semaphore.acquire(blocking=False)
+        else:
+            acquired = self.semaphore.acquire(timeout=self.timeout)
+
+        if not acquired:
+            self.reject()
+
+    def release(self) -> None:
+        self.semaphore.release()
+
+    async def acquire_async(self) -> None:
+        semaphore = self.get_async_semaphore()
+
+        if semaphore.locked():
+            if self.timeout is None:
+                self.reject()
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.reject()
+        else:
+            await semaphore.acquire()
+
+    def release_async(self) -> None:
+        self.get_async_semaphore().release()
+
+    def get_async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self.async_semaphores.get(loop)
+
+        if semaphore is None:
+            semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+            self.async_semaphores[loop] = semaphore
+
+        return semaphore
+
+    def reject(self) -> NoReturn:
+        raise ConcurrencyLimitExceededError(f'The maximum number of concurrent calls ({self.max_concurrency}) has been reached.')
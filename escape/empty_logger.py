@@ -0,0 +1,24 @@
+from typing import Any
+
+
+class EmptyLogger:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return 'EmptyLogger()'
@@ -3,3 +3,9 @@ class SetDefaultReturnValueForContextManagerError(Exception):
 
 class SetDefaultReturnValueForGeneratorFunctionError(Exception):
     pass
+
+class ConcurrencyLimitExceededError(Exception):
+    pass
+
+class CallTimeoutError(TimeoutError):
+    pass
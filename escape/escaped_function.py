@@ -0,0 +1,29 @@
+import sys
+from functools import partial
+from types import MethodType
+from typing import Tuple, Callable, Union, Optional, Any
+
+
+class EscapedFunction(partial):  # type: ignore[type-arg]
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Union['EscapedFunction', MethodType]:
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __reduce__(self) -> Union[str, Tuple[Callable[..., Any], Tuple[Any, ...]]]:  # type: ignore[override, unused-ignore]
+        if self.is_reachable_by_name():
+            return getattr(self, '__qualname__')  # type: ignore[no-any-return] # noqa: B009
+
+        wrapper, function = self.args[:2]
+        return wrapper.__call__, (function,)
+
+    def is_reachable_by_name(self) -> bool:
+        found: Any = sys.modules.get(getattr(self, '__module__', None))  # type: ignore[arg-type]
+
+        try:
+            for name in getattr(self, '__qualname__', '<locals>').split('.'):
+                found = getattr(found, name)
+        except AttributeError:
+            return False
+
+        return found is self
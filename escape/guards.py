@@ -0,0 +1,25 @@
+from types import TracebackType
+from typing import Type, Callable, Optional, Any
+
+from escape.wrapper import Wrapper, do_nothing
+
+
+class Guard:
+    __slots__ = ('wrapper', 'before', 'is_success_silent')
+
+    def __init__(self, wrapper: Wrapper) -> None:
+        wrapper.validate_context_manager()
+
+        self.wrapper: Wrapper = wrapper
+        self.before: Optional[Callable[[], Any]] = None if wrapper.before is do_nothing else wrapper.before
+        self.is_success_silent: bool = wrapper.success_callback is do_nothing and not wrapper.success_logging and wrapper.statistics is None
+
+    def __enter__(self) -> 'Guard':
+        if self.before is not None:
+            self.wrapper.run_callback(self.before)
+        return self
+
+    def __exit__(self, exception_type: Optional[Type[BaseException]], exception_value: Optional[BaseException], traceback: Optional[TracebackType]) -> bool:
+        if exception_type is None and self.is_success_silent:
+            return False
+        return self.wrapper.__exit__(exception_type, exception_value, traceback)
@@ -0,0 +1,30 @@
+import asyncio
+from typing import Set, Callable, Awaitable, Optional, Any
+
+
+async def await_with_hedging(function: Callable[..., Awaitable[Any]], delay: float, /, *args: Any, **kwargs: Any) -> Any:
+    tasks: Set['asyncio.Future[Any]'] = {asyncio.ensure_future(function(*args, **kwargs))}
+
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tasks.add(asyncio.ensure_future(function(*args, **kwargs)))
+
+        pending = tasks
+        error: Optional[BaseException] = None
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return task.result()
+
+            for task in done:
+                error = asyncio.CancelledError() if task.cancelled() else task.exception()
+
+        raise error  # type: ignore[misc]
+
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,97 @@
+from typing import Iterable, Iterator, AsyncIterable, AsyncIterator, Optional, Any
+
+from escape.wrapper import Wrapper
+
+
+class AbstractResumingIterator:
+    def __init__(self, iterator: Any, wrapper: Wrapper, max_skips: Optional[int]) -> None:
+        if max_skips is not None and (isinstance(max_skips, bool) or not isinstance(max_skips, int) or max_skips < 0):
+            raise ValueError('The maximum number of skipped items must be a non-negative integer.')
+
+        self.wrapper: Wrapper = wrapper
+        self.max_skips: Optional[int] = max_skips
+        self.skipped: int = 0
+        self.exhausted: bool = False
+        self.name: str = getattr(iterator, '__name__', type(iterator).__name__)
+
+    def skip(self, exception: BaseException) -> bool:
+        wrapper = self.wrapper
+        self.skipped += 1
+
+        if wrapper.error_log_message is None:
+            exception_massage = '' if not str(exception) else f' ("{exception}")'
+            wrapper.logger.exception(f'When getting the next item from the iterator "{self.name}"{wrapper.wrapped_doc}, the exception "{type(exception).__name__}"{exception_massage} was suppressed.')
+        else:
+            wrapper.logger.exception(wrapper.error_log_message)
+
+        if self.max_skips is not None and self.skipped > self.max_skips:
+            wrapper.logger.error(f'The iterator "{self.name}"{wrapper.wrapped_doc} was stopped after {self.skipped} suppressed exceptions.')
+            self.exhausted = True
+            return False
+
+        return True
+
+    def log_not_suppressed(self, exception: BaseException) -> None:
+        wrapper = self.wrapper
+
+        if wrapper.error_log_message is None:
+            exception_massage = '' if not str(exception) else f' ("{exception}")'
+            wrapper.logger.error(f'When getting the next item from the iterator "{self.name}"{wrapper.wrapped_doc}, the exception "{type(exception).__name__}"{exception_massage} was not suppressed.')
+        else:
+            wrapper.logger.error(wrapper.error_log_message)
+
+
+class ResumingIterator(AbstractResumingIterator):
+    def __init__(self, iterable: Iterable[Any], wrapper: Wrapper, max_skips: Optional[int]) -> None:
+        self.iterator: Iterator[Any] = iter(iterable)
+        super().__init__(self.iterator, wrapper, max_skips)
+
+    def __iter__(self) -> 'ResumingIterator':
+        return self
+
+    def __next__(self) -> Any:
+        if self.exhausted:
+            raise StopIteration
+
+        while True:
+            try:
+                return next(self.iterator)
+
+            except StopIteration:
+                raise
+
+            except self.wrapper.exceptions as e:
+                if not self.skip(e):
+                    raise StopIteration  # noqa: B904
+
+            except BaseException as e:
+                self.log_not_suppressed(e)
+                raise
+
+
+class ResumingAsyncIterator(AbstractResumingIterator):
+    def __init__(self, iterable: AsyncIterable[Any], wrapper: Wrapper, max_skips: Optional[int]) -> None:
+        self.iterator: AsyncIterator[Any] = iterable.__aiter__()
+        super().__init__(self.iterator, wrapper, max_skips)
+
+    def __aiter__(self) -> 'ResumingAsyncIterator':
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.exhausted:
+            raise StopAsyncIteration
+
+        while True:
+            try:
+                return await self.iterator.__anext__()
+
+            except StopAsyncIteration:
+                raise
+
+            except self.wrapper.exceptions as e:
+                if not self.skip(e):
+                    raise StopAsyncIteration  # noqa: B904
+
+            except BaseException as e:
+                self.log_not_suppressed(e)
+                raise
@@ -0,0 +1,36 @@
+from functools import update_wrapper
+from importlib import import_module
+from inspect import iscoroutinefunction, isgeneratorfunction
+from typing import List, Dict, Tuple, Callable, Any
+
+from escape.escaped_function import EscapedFunction
+
+
+class LazyDecorator:
+    def __init__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        self.args: Tuple[Any, ...] = args
+        self.kwargs: Dict[str, Any] = kwargs
+
+    def __call__(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        if iscoroutinefunction(function):
+            escaped = EscapedFunction(LazyDecorator.await_escaped, self, function, [])
+        elif isgeneratorfunction(function):
+            escaped = EscapedFunction(LazyDecorator.yield_escaped, self, function, [])
+        else:
+            escaped = EscapedFunction(LazyDecorator.call_escaped, self, function, [])
+
+        return update_wrapper(escaped, function)
+
+    def build(self, function: Callable[..., Any], cache: List[Callable[..., Any]]) -> Callable[..., Any]:
+        if not cache:
+            cache.append(import_module('escape')(*(self.args), **(self.kwargs))(function))
+        return cache[0]
+
+    def call_escaped(self, function: Callable[..., Any], cache: List[Callable[..., Any]], /, *args: Any, **kwargs: Any) -> Any:
+        return (cache[0] if cache else self.build(function, cache))(*args, **kwargs)
+
+    async def await_escaped(self, function: Callable[..., Any], cache: List[Callable[..., Any]], /, *args: Any, **kwargs: Any) -> Any:
+        return await (cache[0] if cache else self.build(function, cache))(*args, **kwargs)
+
+    def yield_escaped(self, function: Callable[..., Any], cache: List[Callable[..., Any]], /, *args: Any, **kwargs: Any) -> Any:
+        return (yield from (cache[0] if cache else self.build(function, cache))(*args, **kwargs))
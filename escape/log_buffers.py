@@ -0,0 +1,95 @@
+import sys
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import TYPE_CHECKING, List, Tuple, Type, Optional, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from emptylog import LoggerProtocol
+
+
+LEVELS = ('debug', 'info', 'warning', 'error', 'exception', 'critical')
+
+current_buffer: 'ContextVar[Optional[LogBuffer]]' = ContextVar('current_buffer', default=None)
+
+
+class LogBuffer:
+    def __init__(self, logger: 'LoggerProtocol') -> None:
+        self.logger: 'LoggerProtocol' = logger
+        self.records: List[Tuple[str, str, Optional[BaseException]]] = []
+        self.parent: Optional[LogBuffer] = None
+        self.token: Optional[Token[Optional[LogBuffer]]] = None
+        self.closed: bool = False
+
+    def __enter__(self) -> 'LogBuffer':
+        if self.token is not None or self.closed:
+            raise ValueError('The log buffer can only be used once.')
+
+        self.parent = current_buffer.get()
+        self.token = current_buffer.set(self)
+        return self
+
+    def __exit__(self, exception_type: Optional[Type[BaseException]], exception_value: Optional[BaseException], traceback: Optional[TracebackType]) -> None:
+        current_buffer.reset(self.token)  # type: ignore[arg-type]
+        self.closed = True
+
+        records = self.records
+        self.records = []
+
+        if not records or (exception_type is None and all(level == 'info' for level, _, _ in records)):
+            return
+
+        level = max((level for level, _, _ in records), key=LEVELS.index)
+        log(self.logger, 'error' if level == 'exception' else level, self.describe(records))
+
+    @staticmethod
+    def describe(records: List[Tuple[str, str, Optional[BaseException]]]) -> str:
+        from traceback import format_exception
+
+        lines = [f'{len(records)} log records were buffered:']
+
+        for level, message, exception in records:
+            lines.append(f'[{level.upper()}] {message}')
+            if exception is not None:
+                lines.append(''.join(format_exception(type(exception), exception, exception.__traceback__)).rstrip())
+
+        return '\n'.join(lines)
+
+
+class ScopedLogger:
+    __slots__ = ('logger',)
+
+    def __init__(self, logger: 'LoggerProtocol') -> None:
+        self.logger: 'LoggerProtocol' = logger
+
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        log(self.logger, 'debug', message, *args, **kwargs)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        log(self.logger, 'info', message, *args, **kwargs)
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        log(self.logger, 'warning', message, *args, **kwargs)
+
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        log(self.logger, 'error', message, *args, **kwargs)
+
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
+        log(self.logger, 'exception', message, *args, **kwargs)
+
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        log(self.logger, 'critical', message, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        return repr(self.logger)
+
+
+def log(logger: 'LoggerProtocol', level: str, message: str, *args: Any, **kwargs: Any) -> None:
+    buffer = current_buffer.get()
+
+    while buffer is not None:
+        if buffer.logger is logger and not buffer.closed:
+            buffer.records.append((level, message, sys.exc_info()[1] if level == 'exception' else None))
+            return
+        buffer = buffer.parent
+
+    getattr(logger, level)(message, *args, **kwargs)
@@ -0,0 +1,84 @@
+from collections import Counter
+from threading import Lock, Timer
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Type, Optional, Any
+
+from escape.message_templates import describe_counts
+
+if TYPE_CHECKING:  # pragma: no cover
+    from emptylog import LoggerProtocol
+
+
+class LogSummarizer:
+    def __init__(self, max_logs_per_second: int, logger: 'LoggerProtocol', wrapped_doc: str) -> None:
+        if isinstance(max_logs_per_second, bool) or not isinstance(max_logs_per_second, int) or max_logs_per_second <= 0:
+            raise ValueError('The maximum number of logged exceptions per second must be a positive integer.')
+
+        self.max_logs_per_second: int = max_logs_per_second
+        self.logger: 'LoggerProtocol' = logger
+        self.wrapped_doc: str = wrapped_doc
+        self.window_start: float = monotonic()
+        self.number_in_window: int = 0
+        self.summarizing: bool = False
+        self.counter: 'Counter[str]' = Counter()
+        self.lock: Lock = Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = Lock()
+
+    def should_log(self, exception_type: Type[BaseException]) -> bool:
+        with self.lock:
+            now = monotonic()
+            summary = self.close_stale_window(now)
+
+            self.number_in_window += 1
+            if self.number_in_window > self.max_logs_per_second:
+                self.summarizing = True
+            if self.summarizing:
+                if not self.counter:
+                    self.schedule_flush(self.window_start + 1 - now)
+                self.counter[exception_type.__name__] += 1
+
+            result = not self.summarizing
+
+        if summary is not None:
+            self.logger.error(summary)
+
+        return result
+
+    def flush(self) -> None:
+        with self.lock:
+            now = monotonic()
+            summary = self.close_stale_window(now)
+            if summary is None and self.counter:
+                self.schedule_flush(self.window_start + 1 - now)
+
+        if summary is not None:
+            self.logger.error(summary)
+
+    def close_stale_window(self, now: float) -> Optional[str]:
+        summary: Optional[str] = None
+
+        if now - self.window_start >= 1:
+            if self.counter:
+                summary = self.describe(now)
+                self.counter = Counter()
+            self.summarizing = self.summarizing and self.number_in_window > self.max_logs_per_second
+            self.window_start = now
+            self.number_in_window = 0
+
+        return summary
+
+    def schedule_flush(self, delay: float) -> None:
+        timer = Timer(delay, self.flush)
+        timer.daemon = True
+        timer.start()
+
+    def describe(self, now: float) -> str:
+        return f'Exceptions were suppressed too often{self.wrapped_doc} ({self.number_in_window} per second, {now - self.window_start:.3f} seconds ago), {sum(self.counter.values())} of them were not logged separately: {describe_counts(self.counter)}.'
@@ -0,0 +1,164 @@
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import List, Set, Deque, Callable, Iterable, Iterator, AsyncIterable, AsyncIterator, Union, Optional, Any
+
+from escape.message_templates import describe_counts
+from escape.wrapper import Wrapper
+
+
+class Failure:
+    __slots__ = ('exception',)
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception: BaseException = exception
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.exception!r})'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Failure) and self.exception is other.exception
+
+    def __hash__(self) -> int:
+        return id(self.exception)
+
+
+class Mapper:
+    def __init__(self, function: Callable[[Any], Any], wrapper: Wrapper, executor: Union[str, Executor], workers: Optional[int], capture_exceptions: bool, prefetch: Optional[int] = None, ordered: bool = True) -> None:
+        if not isinstance(executor, Executor) and executor not in ('thread', 'process'):
+            raise ValueError('The executor must be "thread", "process" or an instance of concurrent.futures.Executor.')
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers <= 0):
+            raise ValueError('The number of workers must be a positive integer.')
+        if prefetch is not None and (isinstance(prefetch, bool) or not isinstance(prefetch, int) or prefetch <= 0):
+            raise ValueError('The number of prefetched items must be a positive integer.')
+
+        self.function: Callable[[Any], Any] = function
+        self.wrapper: Wrapper = wrapper
+        self.executor: Union[str, Executor] = executor
+        self.workers: Optional[int] = workers
+        self.capture_exceptions: bool = capture_exceptions
+        self.prefetch: Optional[int] = prefetch
+        self.ordered: bool = ordered
+        self.function_name: str = getattr(function, '__name__', repr(function))
+
+        self.processed: int = 0
+        self.suppressed: 'Counter[str]' = Counter()
+
+    def map(self, iterable: Iterable[Any]) -> List[Any]:
+        return list(self.imap(iterable))
+
+    def imap(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        if isinstance(self.executor, Executor):
+            yield from self.stream(self.executor, iterable)
+            return
+
+        executor_class = ThreadPoolExecutor if self.executor == 'thread' else ProcessPoolExecutor
+        with executor_class(max_workers=self.workers) as executor:
+            yield from self.stream(executor, iterable)
+
+    def stream(self, executor: Executor, iterable: Iterable[Any]) -> Iterator[Any]:
+        iterator = iter(iterable)
+        futures: Union[Deque['Future[Any]'], Set['Future[Any]']] = deque() if self.ordered else set()
+
+        def submit(number_of_items: Optional[int]) -> None:
+            for item in islice(iterator, number_of_items):
+                future = executor.submit(self.function, item)
+                if isinstance(futures, deque):
+                    futures.append(future)
+                else:
+                    futures.add(future)
+
+        try:
+            submit(self.prefetch)
+
+            while futures:
+                if isinstance(futures, deque):
+                    done: Iterable['Future[Any]'] = (futures.popleft(),)
+                else:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if self.prefetch is not None:
+                        submit(1)
+                    yield self.unpack(future)
+
+        finally:
+            for future in futures:
+                future.cancel()
+            self.log_summary()
+
+    async def aimap(self, iterable: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+        iterator: AsyncIterator[Any] = iterable.__aiter__() if isinstance(iterable, AsyncIterable) else self.to_async_iterator(iterable)
+        tasks: Union[Deque['asyncio.Future[Any]'], Set['asyncio.Future[Any]']] = deque() if self.ordered else set()
+        exhausted = False
+
+        async def submit(number_of_items: Optional[int]) -> None:
+            nonlocal exhausted
+            while not exhausted and (number_of_items is None or number_of_items > 0):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    return
+                task = asyncio.ensure_future(self.function(item))
+                if isinstance(tasks, deque):
+                    tasks.append(task)
+                else:
+                    tasks.add(task)
+                if number_of_items is not None:
+                    number_of_items -= 1
+
+        try:
+            await submit(self.prefetch)
+
+            while tasks:
+                if isinstance(tasks, deque):
+                    await asyncio.wait((tasks[0],))
+                    done: Iterable['asyncio.Future[Any]'] = (tasks.popleft(),)
+                else:
+                    done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if self.prefetch is not None:
+                        await submit(1)
+                    yield self.unpack(task)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.log_summary()
+
+    def unpack(self, future: Union['Future[Any]', 'asyncio.Future[Any]']) -> Any:
+        wrapper = self.wrapper
+        self.processed += 1
+
+        try:
+            return future.result()
+
+        except wrapper.exceptions as e:
+            self.suppressed[type(e).__name__] += 1
+            if self.capture_exceptions:
+                return Failure(e)
+            return wrapper.get_default(e)
+
+        except BaseException as e:
+            if wrapper.error_log_message is None:
+                exception_massage = '' if not str(e) else f' ("{e}")'
+                wrapper.logger.error(f'When executing function "{self.function_name}"{wrapper.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
+            else:
+                wrapper.logger.error(wrapper.error_log_message)
+            raise
+
+    def log_summary(self) -> None:
+        if self.suppressed:
+            wrapper = self.wrapper
+            if wrapper.error_log_message is None:
+                wrapper.logger.error(f'When executing function "{self.function_name}"{wrapper.wrapped_doc} for {self.processed} items, {sum(self.suppressed.values())} exceptions were suppressed: {describe_counts(self.suppressed)}.')
+            else:
+                wrapper.logger.error(wrapper.error_log_message)
+
+    @staticmethod
+    async def to_async_iterator(iterable: Iterable[Any]) -> AsyncIterator[Any]:
+        for item in iterable:
+            yield item
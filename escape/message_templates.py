@@ -0,0 +1,24 @@
+from collections import Counter
+from typing import NamedTuple, Callable, Any
+
+
+class MessageTemplates(NamedTuple):
+    failure_prefix: str
+    success: str
+    slow_call_prefix: str
+    description: str
+
+    @classmethod
+    def for_function(cls, kind: str, function: Callable[..., Any], wrapped_doc: str) -> 'MessageTemplates':
+        name = getattr(function, '__name__', repr(function))
+
+        return cls(
+            f'When executing {kind} "{name}"{wrapped_doc}, the exception "',
+            f'The {kind} "{name}"{wrapped_doc} completed successfully.',
+            f'The {kind} "{name}"{wrapped_doc} took ',
+            f'{kind} "{name}"{wrapped_doc}',
+        )
+
+
+def describe_counts(counter: 'Counter[str]') -> str:
+    return ', '.join(f'"{name}" ({number})' for name, number in counter.most_common())
@@ -0,0 +1,8 @@
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class StatisticsProtocol(Protocol):
+    def record_success(self) -> None: ...  # pragma: no cover
+    def record_suppressed(self) -> None: ...  # pragma: no cover
+    def record_not_suppressed(self) -> None: ...  # pragma: no cover
@@ -1,18 +1,33 @@
 import sys
-from typing import Type, Tuple, Callable, Union, Optional, Any
+from typing import TYPE_CHECKING, Type, Tuple, List, Dict, Callable, Awaitable, Sequence, Iterable, Iterator, AsyncIterable, AsyncIterator, Union, Optional, Any
 from types import TracebackType, ModuleType
-from inspect import isclass
+from os import cpu_count
 from itertools import chain
+from math import nan
 
 try:
     from types import EllipsisType  # type: ignore[attr-defined, unused-ignore]
 except ImportError:  # pragma: no cover
     EllipsisType = type(...)  # type: ignore[misc, unused-ignore] # pragma: no cover
 
-from emptylog import LoggerProtocol, EmptyLogger
-
-from escape.wrapper import Wrapper
+from escape.wrapper import Wrapper, do_nothing
+from escape.errors import ConcurrencyLimitExceededError, CallTimeoutError
+from escape.empty_logger import EmptyLogger
+from escape.protocols import StatisticsProtocol
 from escape.baked_escaper import BakedEscaper
+from escape.iterators import ResumingIterator, ResumingAsyncIterator
+from escape.collector import ErrorCollector
+from escape.guards import Guard
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+    from emptylog import LoggerProtocol
+
+    from escape.vectorizer import Vectorizer
+    from escape.lazy_decorator import LazyDecorator
+    from escape.watchdogs import Watchdog
+    from escape.log_buffers import LogBuffer
 
 
 if sys.version_info < (3, 11):
@@ -21,28 +36,37 @@ else:
     muted_by_default_exceptions = (Exception, BaseExceptionGroup)  # pragma: no cover # noqa: F821
 
 class ProxyModule(sys.modules[__name__].__class__):  # type: ignore[misc]
-    def __call__(self, *args: Union[Callable[..., Any], Type[BaseException], EllipsisType], default: Any = None, logger: LoggerProtocol = EmptyLogger(), success_callback: Callable[[], Any] = lambda: None, error_callback: Callable[[], Any] = lambda: None, before: Callable[[], Any] = lambda: None, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None) -> Union[Callable[..., Any], Callable[[Callable[..., Any]], Callable[..., Any]]]:
+    def __call__(self, *args: Union[Callable[..., Any], Type[BaseException], EllipsisType], default: Any = None, logger: 'LoggerProtocol' = EmptyLogger(), success_callback: Callable[[], Any] = do_nothing, error_callback: Callable[[], Any] = do_nothing, before: Callable[[], Any] = do_nothing, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None, default_factory: Optional[Callable[..., Any]] = None, max_concurrency: Optional[int] = None, max_concurrency_timeout: Optional[float] = None, timeout: Optional[float] = None, hedge_after: Optional[float] = None, single_flight: bool = False, statistics: Optional[StatisticsProtocol] = None, slow_threshold: Optional[float] = None, watchdog: Optional['Watchdog'] = None, max_logs_per_second: Optional[int] = None) -> Union[Callable[..., Any], Callable[[Callable[..., Any]], Callable[..., Any]]]:
         """
         https://docs.python.org/3/library/exceptions.html#exception-hierarchy
         """
+        defaults_by_exception_type: Optional[Dict[Type[BaseException], Any]] = None
+
         if self.are_it_function(args):
             exceptions: Tuple[Type[BaseException], ...] = muted_by_default_exceptions
-        else:
+        elif self.is_it_mapping(args):
+            if default is not None or default_factory is not None:
+                raise ValueError('You cannot set a default value when the defaults are passed as a dictionary.')
+            defaults_by_exception_type = self.unpack_mapping(args[0])  # type: ignore[arg-type]
+            exceptions = tuple(defaults_by_exception_type)
+            if timeout is not None and not issubclass(CallTimeoutError, exceptions):
+                raise ValueError('When the defaults are passed as a dictionary together with a timeout, the dictionary must contain a default for "CallTimeoutError".')
+            if max_concurrency is not None and not issubclass(ConcurrencyLimitExceededError, exceptions):
+                raise ValueError('When the defaults are passed as a dictionary together with the maximum number of concurrent calls, the dictionary must contain a default for "ConcurrencyLimitExceededError".')
+        elif self.are_it_exceptions(args):
             if self.is_there_ellipsis(args):
                 exceptions = tuple(chain((x for x in args if x is not Ellipsis), muted_by_default_exceptions))  # type: ignore[misc]
             else:
                 exceptions = args  # type: ignore[assignment]
+        else:
+            raise ValueError('You are using the decorator for the wrong purpose.')
 
-        wrapper_of_wrappers = Wrapper(default, exceptions, logger, success_callback, before, error_log_message, success_logging, success_log_message, error_callback, doc)
-
-        if self.are_it_exceptions(args):
-            return wrapper_of_wrappers
+        wrapper_of_wrappers = Wrapper(default, exceptions, logger, success_callback, before, error_log_message, success_logging, success_log_message, error_callback, doc, default_factory=default_factory, defaults_by_exception_type=defaults_by_exception_type, max_concurrency=max_concurrency, max_concurrency_timeout=max_concurrency_timeout, timeout=timeout, hedge_after=hedge_after, single_flight=single_flight, statistics=statistics, slow_threshold=slow_threshold, watchdog=watchdog, max_logs_per_second=max_logs_per_second)
 
-        elif self.are_it_function(args):
+        if self.are_it_function(args):
             return wrapper_of_wrappers(args[0])  # type: ignore[arg-type, unused-ignore]
 
-        else:
-            raise ValueError('You are using the decorator for the wrong purpose.')
+        return wrapper_of_wrappers
 
     def __enter__(self) -> 'ProxyModule':
         return self
@@ -61,13 +85,27 @@ class ProxyModule(sys.modules[__name__].__class__):  # type: ignore[misc]
 
     @staticmethod
     def are_it_exceptions(args: Tuple[Union[Type[BaseException], Callable[..., Any], EllipsisType], ...]) -> bool:
-        return all((x is Ellipsis) or (isclass(x) and issubclass(x, BaseException)) for x in args)
+        return all((x is Ellipsis) or (isinstance(x, type) and issubclass(x, BaseException)) for x in args)
+
+    @staticmethod
+    def is_it_mapping(args: Tuple[Union[Type[BaseException], Callable[..., Any], EllipsisType], ...]) -> bool:
+        return len(args) == 1 and isinstance(args[0], dict) and all((x is Ellipsis) or (isinstance(x, type) and issubclass(x, BaseException)) for x in args[0])
+
+    @staticmethod
+    def unpack_mapping(defaults: Dict[Union[Type[BaseException], EllipsisType], Any]) -> Dict[Type[BaseException], Any]:
+        result: Dict[Type[BaseException], Any] = {exception_type: value for exception_type, value in defaults.items() if exception_type is not Ellipsis}  # type: ignore[misc, unused-ignore]
+
+        if Ellipsis in defaults:
+            for exception_type in muted_by_default_exceptions:
+                result.setdefault(exception_type, defaults[Ellipsis])
+
+        return result
 
     @staticmethod
     def are_it_function(args: Tuple[Union[Type[BaseException], Callable[..., Any], EllipsisType], ...]) -> bool:
-        return len(args) == 1 and callable(args[0]) and not (isclass(args[0]) and issubclass(args[0], BaseException))
+        return len(args) == 1 and callable(args[0]) and not (isinstance(args[0], type) and issubclass(args[0], BaseException))
 
-    def bake(self, *args: Union[Callable[..., Any], Type[BaseException], EllipsisType], default: Any = None, logger: LoggerProtocol = EmptyLogger(), success_callback: Callable[[], Any] = lambda: None, error_callback: Callable[[], Any] = lambda: None, before: Callable[[], Any] = lambda: None, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None) -> Callable[..., Union[Callable[..., Any], Callable[[Callable[..., Any]], Callable[..., Any]]]]:
+    def bake(self, *args: Union[Callable[..., Any], Type[BaseException], EllipsisType], default: Any = None, logger: 'LoggerProtocol' = EmptyLogger(), success_callback: Callable[[], Any] = do_nothing, error_callback: Callable[[], Any] = do_nothing, before: Callable[[], Any] = do_nothing, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None, default_factory: Optional[Callable[..., Any]] = None, max_concurrency: Optional[int] = None, max_concurrency_timeout: Optional[float] = None, timeout: Optional[float] = None, hedge_after: Optional[float] = None, single_flight: bool = False, statistics: Optional[StatisticsProtocol] = None, slow_threshold: Optional[float] = None, watchdog: Optional['Watchdog'] = None, max_logs_per_second: Optional[int] = None) -> Callable[..., Union[Callable[..., Any], Callable[[Callable[..., Any]], Callable[..., Any]]]]:
         escaper = BakedEscaper(self)
         escaper.notify_arguments(
             *args,
@@ -80,9 +118,139 @@ class ProxyModule(sys.modules[__name__].__class__):  # type: ignore[misc]
             success_log_message=success_log_message,
             success_logging=success_logging,
             doc=doc,
+            default_factory=default_factory,
+            max_concurrency=max_concurrency,
+            max_concurrency_timeout=max_concurrency_timeout,
+            timeout=timeout,
+            hedge_after=hedge_after,
+            single_flight=single_flight,
+            statistics=statistics,
+            slow_threshold=slow_threshold,
+            watchdog=watchdog,
+            max_logs_per_second=max_logs_per_second,
         )
         return escaper
 
+    def lazy(self, *args: Union[Callable[..., Any], Type[BaseException], EllipsisType], **kwargs: Any) -> Union[Callable[..., Any], 'LazyDecorator']:
+        from escape.lazy_decorator import LazyDecorator
+
+        if self.are_it_function(args):
+            return LazyDecorator((...,), kwargs)(args[0])  # type: ignore[arg-type]
+
+        return LazyDecorator(args, kwargs)
+
+    def batched(self, batch_function: Callable[[List[Any]], Awaitable[Sequence[Any]]], *args: Union[Type[BaseException], EllipsisType], max_batch: int = 100, max_delay: float = 0.0, default: Any = None, default_factory: Optional[Callable[..., Any]] = None, logger: 'LoggerProtocol' = EmptyLogger(), success_callback: Callable[[], Any] = do_nothing, error_callback: Callable[[], Any] = do_nothing, before: Callable[[], Any] = do_nothing, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None) -> Callable[[Any], Awaitable[Any]]:
+        from inspect import iscoroutinefunction
+        from escape.batcher import Batcher
+
+        if not iscoroutinefunction(batch_function):
+            raise ValueError('The batch function must be a coroutine function.')
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the batcher for the wrong purpose.')
+        if isinstance(max_batch, bool) or not isinstance(max_batch, int) or max_batch <= 0:
+            raise ValueError('The maximum batch size must be a positive integer.')
+        if isinstance(max_delay, bool) or not isinstance(max_delay, (int, float)) or max_delay < 0:
+            raise ValueError('The maximum delay must be a non-negative number.')
+
+        wrapper = self(*(args or (...,)), default=default, default_factory=default_factory, logger=logger, success_callback=success_callback, error_callback=error_callback, before=before, error_log_message=error_log_message, success_log_message=success_log_message, success_logging=success_logging, doc=doc)
+
+        return Batcher(batch_function, wrapper, max_batch, max_delay)  # type: ignore[arg-type]
+
+    def map(self, function: Callable[[Any], Any], iterable: Iterable[Any], *args: Union[Type[BaseException], EllipsisType], executor: Union[str, 'Executor'] = 'thread', workers: Optional[int] = None, default: Any = None, default_factory: Optional[Callable[..., Any]] = None, capture_exceptions: bool = False, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> List[Any]:
+        from escape.mapping import Mapper
+
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the map function for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), default=default, default_factory=default_factory, logger=logger, error_log_message=error_log_message, doc=doc)
+
+        return Mapper(function, wrapper, executor, workers, capture_exceptions).map(iterable)  # type: ignore[arg-type]
+
+    def imap(self, function: Callable[[Any], Any], iterable: Iterable[Any], *args: Union[Type[BaseException], EllipsisType], executor: Union[str, 'Executor'] = 'thread', workers: Optional[int] = None, prefetch: Optional[int] = None, ordered: bool = True, default: Any = None, default_factory: Optional[Callable[..., Any]] = None, capture_exceptions: bool = False, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> Iterator[Any]:
+        from escape.mapping import Mapper
+
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the map function for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), default=default, default_factory=default_factory, logger=logger, error_log_message=error_log_message, doc=doc)
+        if prefetch is None:
+            prefetch = 2 * (workers or cpu_count() or 1)
+
+        return Mapper(function, wrapper, executor, workers, capture_exceptions, prefetch=prefetch, ordered=ordered).imap(iterable)  # type: ignore[arg-type]
+
+    def aimap(self, function: Callable[[Any], Awaitable[Any]], iterable: Union[Iterable[Any], AsyncIterable[Any]], *args: Union[Type[BaseException], EllipsisType], prefetch: int = 100, ordered: bool = True, default: Any = None, default_factory: Optional[Callable[..., Any]] = None, capture_exceptions: bool = False, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> AsyncIterator[Any]:
+        from inspect import iscoroutinefunction
+        from escape.mapping import Mapper
+
+        if not iscoroutinefunction(function):
+            raise ValueError('The mapped function must be a coroutine function.')
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the map function for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), default=default, default_factory=default_factory, logger=logger, error_log_message=error_log_message, doc=doc)
+
+        return Mapper(function, wrapper, 'thread', None, capture_exceptions, prefetch=prefetch, ordered=ordered).aimap(iterable)  # type: ignore[arg-type]
+
+    def vectorize(self, function: Callable[[Any], Any], *args: Union[Type[BaseException], EllipsisType], default: Any = None, default_factory: Optional[Callable[..., Any]] = None, dtype: Any = float, chunk_size: int = 4096, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> 'Vectorizer':
+        from escape.vectorizer import Vectorizer
+
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the vectorizer for the wrong purpose.')
+
+        if default is None and default_factory is None:
+            default = nan
+
+        wrapper = self(*(args or (...,)), default=default, default_factory=default_factory, logger=logger, error_log_message=error_log_message, doc=doc)
+
+        return Vectorizer(function, wrapper, dtype, chunk_size)  # type: ignore[arg-type]
+
+    def iter(self, iterable: Iterable[Any], *args: Union[Type[BaseException], EllipsisType], max_skips: Optional[int] = None, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> ResumingIterator:
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the iterator for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), logger=logger, error_log_message=error_log_message, doc=doc)
+
+        return ResumingIterator(iterable, wrapper, max_skips)  # type: ignore[arg-type]
+
+    def aiter(self, iterable: AsyncIterable[Any], *args: Union[Type[BaseException], EllipsisType], max_skips: Optional[int] = None, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> ResumingAsyncIterator:
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the iterator for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), logger=logger, error_log_message=error_log_message, doc=doc)
+
+        return ResumingAsyncIterator(iterable, wrapper, max_skips)  # type: ignore[arg-type]
+
+    def guard(self, *args: Union[Type[BaseException], EllipsisType], logger: 'LoggerProtocol' = EmptyLogger(), success_callback: Callable[[], Any] = do_nothing, error_callback: Callable[[], Any] = do_nothing, before: Callable[[], Any] = do_nothing, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None, statistics: Optional[StatisticsProtocol] = None, max_logs_per_second: Optional[int] = None) -> Guard:
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the guard for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), logger=logger, success_callback=success_callback, error_callback=error_callback, before=before, error_log_message=error_log_message, success_log_message=success_log_message, success_logging=success_logging, doc=doc, statistics=statistics, max_logs_per_second=max_logs_per_second)
+
+        return Guard(wrapper)  # type: ignore[arg-type]
+
+    def each(self, iterable: Iterable[Any], *args: Union[Type[BaseException], EllipsisType], logger: 'LoggerProtocol' = EmptyLogger(), success_callback: Callable[[], Any] = do_nothing, error_callback: Callable[[], Any] = do_nothing, before: Callable[[], Any] = do_nothing, error_log_message: Optional[str] = None, success_log_message: Optional[str] = None, success_logging: bool = False, doc: Optional[str] = None, statistics: Optional[StatisticsProtocol] = None, max_logs_per_second: Optional[int] = None) -> Iterator[Tuple[Any, Guard]]:
+        guard = self.guard(*args, logger=logger, success_callback=success_callback, error_callback=error_callback, before=before, error_log_message=error_log_message, success_log_message=success_log_message, success_logging=success_logging, doc=doc, statistics=statistics, max_logs_per_second=max_logs_per_second)
+
+        return ((item, guard) for item in iterable)
+
+    def collect(self, *args: Union[Type[BaseException], EllipsisType], max_exceptions: int = 100, raise_group: bool = False, logger: 'LoggerProtocol' = EmptyLogger(), error_log_message: Optional[str] = None, doc: Optional[str] = None) -> ErrorCollector:
+        if not self.are_it_exceptions(args):
+            raise ValueError('You are using the collector for the wrong purpose.')
+
+        wrapper = self(*(args or (...,)), logger=logger, error_log_message=error_log_message, doc=doc)
+
+        return ErrorCollector(wrapper, max_exceptions, raise_group)  # type: ignore[arg-type]
+
+    def watchdog(self, threshold: float, interval: Optional[float] = None, logger: 'LoggerProtocol' = EmptyLogger()) -> 'Watchdog':
+        from escape.watchdogs import Watchdog
+
+        return Watchdog(threshold, interval, logger)
+
+    def buffered_logs(self, logger: 'LoggerProtocol') -> 'LogBuffer':
+        from escape.log_buffers import LogBuffer
+
+        return LogBuffer(logger)
+
     @property
     def escape(self) -> ModuleType:
         return self
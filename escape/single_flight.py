@@ -0,0 +1,75 @@
+import asyncio
+from threading import Lock, Event
+from typing import Dict, Tuple, Callable, Awaitable, Hashable, Optional, Any
+
+
+class Flight:
+    def __init__(self) -> None:
+        self.event: Event = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self.lock: Lock = Lock()
+        self.flights: Dict[Hashable, Flight] = {}
+        self.tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], 'asyncio.Future[Any]'] = {}
+
+    def call(self, function: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        key = self.make_key(args, kwargs)
+        if key is None:
+            return function(*args, **kwargs)
+
+        with self.lock:
+            flight = self.flights.get(key)
+            is_leader = flight is None
+            if flight is None:
+                flight = Flight()
+                self.flights[key] = flight
+
+        if not is_leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = function(*args, **kwargs)
+            return flight.result
+
+        except BaseException as e:
+            flight.error = e
+            raise
+
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.event.set()
+
+    async def call_async(self, function: Callable[..., Awaitable[Any]], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        key = self.make_key(args, kwargs)
+        if key is None:
+            return await function(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self.tasks.get(task_key)
+
+        if task is None:
+            task = asyncio.ensure_future(function(*args, **kwargs))
+            self.tasks[task_key] = task
+            task.add_done_callback(lambda _: self.tasks.pop(task_key, None))
+
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        key = (args, tuple(type(argument) for argument in args), tuple(sorted((name, type(value), value) for name, value in kwargs.items())))
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
@@ -0,0 +1,56 @@
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Awaitable, Generator, Optional, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from emptylog import LoggerProtocol
+
+
+def call_with_slow_call_detection(function: Callable[..., Any], threshold: float, logger: 'LoggerProtocol', message_prefix: str, /, *args: Any, **kwargs: Any) -> Any:
+    start = monotonic()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        report_slow_call(monotonic() - start, threshold, logger, message_prefix)
+
+async def await_with_slow_call_detection(function: Callable[..., Awaitable[Any]], threshold: float, logger: 'LoggerProtocol', message_prefix: str, /, *args: Any, **kwargs: Any) -> Any:
+    start = monotonic()
+    try:
+        return await function(*args, **kwargs)
+    finally:
+        report_slow_call(monotonic() - start, threshold, logger, message_prefix)
+
+def yield_with_slow_call_detection(function: Callable[..., Generator[Any, Any, Any]], threshold: float, logger: 'LoggerProtocol', message_prefix: str, /, *args: Any, **kwargs: Any) -> Any:
+    generator = function(*args, **kwargs)
+    # Only the time spent inside the generator is counted, not the time the consumer spends between the items.
+    duration = 0.0
+    sent: Any = None
+    error: Optional[BaseException] = None
+
+    try:
+        while True:
+            start = monotonic()
+            try:
+                value = generator.send(sent) if error is None else generator.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                duration += monotonic() - start
+
+            sent, error = None, None
+            try:
+                sent = yield value
+            except GeneratorExit:
+                start = monotonic()
+                try:
+                    generator.close()
+                finally:
+                    duration += monotonic() - start
+                raise
+            except BaseException as exception:
+                error = exception
+    finally:
+        report_slow_call(duration, threshold, logger, message_prefix)
+
+def report_slow_call(duration: float, threshold: float, logger: 'LoggerProtocol', message_prefix: str) -> None:
+    if duration > threshold:
+        logger.warning(f'{message_prefix}{duration:.3f} seconds, which is longer than the threshold of {threshold} seconds.')
@@ -0,0 +1,220 @@
+import os
+import sys
+import struct
+from multiprocessing import resource_tracker, parent_process
+from multiprocessing.shared_memory import SharedMemory
+from tempfile import gettempdir
+from threading import Lock as ThreadLock
+from typing import List, Dict, Tuple, Callable, Sequence, Optional, Any
+from weakref import WeakSet
+
+if sys.platform == 'win32':  # pragma: no cover
+    import msvcrt
+
+    def try_lock_byte(descriptor: int, position: int) -> bool:
+        os.lseek(descriptor, position, os.SEEK_SET)
+        try:
+            msvcrt.locking(descriptor, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+else:  # pragma: no cover
+    import fcntl
+
+    def try_lock_byte(descriptor: int, position: int) -> bool:
+        try:
+            fcntl.lockf(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, position)
+        except OSError:
+            return False
+        return True
+
+
+HEADER = struct.Struct('<4sII4x')
+NAME = struct.Struct('<64s')
+MAGIC = b'ESC2'
+OUTCOMES = ('success', 'suppressed', 'not_suppressed')
+
+claim_lock = ThreadLock()
+instances: 'WeakSet[SharedStatistics]' = WeakSet()
+attached: 'Dict[Tuple[int, str], SharedStatistics]' = {}
+
+
+def forget_rows() -> None:
+    global claim_lock
+
+    # Row locks are not inherited by forked processes, so a forked process claims a row of its own.
+    claim_lock = ThreadLock()
+    for statistics in instances:
+        statistics.counters = None
+        statistics.lock = ThreadLock()
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=forget_rows)
+
+
+class StatisticsSlot:
+    def __init__(self, statistics: 'SharedStatistics', index: int) -> None:
+        self.statistics: SharedStatistics = statistics
+        self.index: int = index
+        self.position: int = index * len(OUTCOMES)
+
+    def record_success(self) -> None:
+        self.statistics.increment(self.position)
+
+    def record_suppressed(self) -> None:
+        self.statistics.increment(self.position + 1)
+
+    def record_not_suppressed(self) -> None:
+        self.statistics.increment(self.position + 2)
+
+    def __reduce__(self) -> Tuple[Callable[..., 'StatisticsSlot'], Tuple[Any, ...]]:
+        return StatisticsSlot, (self.statistics, self.index)
+
+
+class SharedStatistics:
+    def __init__(self, memory: SharedMemory) -> None:
+        self.memory: SharedMemory = memory
+
+        magic, number_of_slots, self.max_processes = HEADER.unpack_from(self.memory.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f'The shared memory segment "{self.memory.name}" does not contain escape statistics.')
+
+        self.policies: List[str] = [NAME.unpack_from(self.memory.buf, HEADER.size + index * NAME.size)[0].rstrip(b'\x00').decode('utf-8') for index in range(number_of_slots)]
+        self.row_size: int = number_of_slots * len(OUTCOMES)
+
+        start = HEADER.size + number_of_slots * NAME.size
+        # Each process writes only to its own row of counters, so increments do not need an inter-process lock.
+        self.rows: memoryview = self.memory.buf[start:start + self.max_processes * self.row_size * 8].cast('Q')
+        self.counters: Optional[memoryview] = None
+        self.descriptor: int = -1
+        self.lock: ThreadLock = ThreadLock()
+        instances.add(self)
+
+    @classmethod
+    def create(cls, policies: Sequence[str], name: Optional[str] = None, max_processes: int = 256) -> 'SharedStatistics':
+        encoded_policies = [policy.encode('utf-8') for policy in policies]
+        if len(set(encoded_policies)) != len(encoded_policies):
+            raise ValueError('The names of the policies must be unique.')
+        if any(not policy or len(policy) > 64 for policy in encoded_policies):
+            raise ValueError('The name of a policy must contain from 1 to 64 bytes in UTF-8.')
+        if isinstance(max_processes, bool) or not isinstance(max_processes, int) or max_processes <= 0:
+            raise ValueError('The maximum number of processes must be a positive integer.')
+
+        memory = SharedMemory(name=name, create=True, size=HEADER.size + NAME.size * len(encoded_policies) + 8 * len(OUTCOMES) * len(encoded_policies) * max_processes)
+        HEADER.pack_into(memory.buf, 0, MAGIC, len(encoded_policies), max_processes)
+        for index, policy in enumerate(encoded_policies):
+            NAME.pack_into(memory.buf, HEADER.size + index * NAME.size, policy)
+
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedStatistics':
+        if sys.version_info >= (3, 13):
+            memory = SharedMemory(name=name, track=False)  # pragma: no cover
+        else:
+            memory = SharedMemory(name=name)  # pragma: no cover
+            # The attached segment belongs to the process that created it, so it must not be destroyed when this process exits.
+            # Processes started by multiprocessing share the resource tracker of their parent, where the segment is already registered.
+            if os.name == 'posix' and parent_process() is None:  # pragma: no cover
+                resource_tracker.unregister(memory._name, 'shared_memory')  # type: ignore[attr-defined, unused-ignore]
+
+        return cls(memory)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    @property
+    def rows_path(self) -> str:
+        return os.path.join(gettempdir(), f'escape-{self.name.lstrip("/")}.rows')
+
+    def slot(self, policy: str) -> StatisticsSlot:
+        try:
+            return StatisticsSlot(self, self.policies.index(policy))
+        except ValueError:
+            raise KeyError(f'The policy "{policy}" is not registered.') from None
+
+    def increment(self, position: int) -> None:
+        counters = self.counters
+        if counters is None:
+            counters = self.claim_row()
+
+        with self.lock:
+            counters[position] += 1
+
+    def claim_row(self) -> memoryview:
+        with claim_lock:
+            if self.counters is not None:
+                return self.counters
+
+            # A row is owned by the process that holds the lock on its byte of the rows file, and the lock is released by the OS when the process exits.
+            if self.descriptor >= 0:
+                os.close(self.descriptor)
+                self.descriptor = -1
+            descriptor = os.open(self.rows_path, os.O_RDWR | os.O_CREAT)
+            for row in range(self.max_processes):
+                if try_lock_byte(descriptor, row):
+                    break
+            else:
+                os.close(descriptor)
+                raise RuntimeError(f'All {self.max_processes} rows of the shared memory segment "{self.name}" are used by other processes.')
+
+            self.descriptor = descriptor
+            self.counters = self.rows[row * self.row_size:(row + 1) * self.row_size]
+            return self.counters
+
+    def totals(self) -> Dict[str, Dict[str, int]]:
+        counters = self.rows.tolist()
+        sums = [sum(counters[position::self.row_size]) for position in range(self.row_size)]
+
+        return {policy: dict(zip(OUTCOMES, sums[index * len(OUTCOMES):(index + 1) * len(OUTCOMES)])) for index, policy in enumerate(self.policies)}
+
+    def close(self) -> None:
+        if attached.get((os.getpid(), self.name)) is self:
+            del attached[(os.getpid(), self.name)]
+        if self.counters is not None:
+            self.counters.release()
+            self.counters = None
+        if self.descriptor >= 0:
+            os.close(self.descriptor)
+            self.descriptor = -1
+        self.rows.release()
+        self.memory.close()
+
+    def unlink(self) -> None:
+        self.memory.unlink()
+        try:
+            os.remove(self.rows_path)
+        except OSError:
+            pass
+
+    def __reduce__(self) -> Tuple[Callable[..., 'SharedStatistics'], Tuple[Any, ...]]:
+        attached.setdefault((os.getpid(), self.name), self)
+        return restore_statistics, (self.name,)
+
+
+def restore_statistics(name: str) -> SharedStatistics:
+    # Each unpickled slot (for example, an argument of every task in a pool) would otherwise map the segment once more.
+    statistics = attached.get((os.getpid(), name))
+
+    if statistics is None:
+        statistics = SharedStatistics.attach(name)
+        attached[(os.getpid(), name)] = statistics
+
+    return statistics
+
+
+def main(arguments: Sequence[str]) -> None:
+    for name in arguments:
+        statistics = SharedStatistics.attach(name)
+        try:
+            for policy, counters in statistics.totals().items():
+                print(policy, *(f'{outcome}={number}' for outcome, number in counters.items()))
+        finally:
+            statistics.close()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv[1:])
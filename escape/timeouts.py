@@ -0,0 +1,49 @@
+import asyncio
+from concurrent.futures import Executor, wait
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Callable, Awaitable, Optional, Any, NoReturn
+
+from escape.errors import CallTimeoutError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from escape.concurrency_limiter import ConcurrencyLimiter
+
+
+def call_with_timeout(executor: Executor, limiter: Optional['ConcurrencyLimiter'], function: Callable[..., Any], timeout: float, /, *args: Any, **kwargs: Any) -> Any:
+    if limiter is None:
+        future = executor.submit(copy_context().run, function, *args, **kwargs)
+    else:
+        limiter.acquire()
+        try:
+            future = executor.submit(copy_context().run, function, *args, **kwargs)
+        except BaseException:
+            limiter.release()
+            raise
+        # The slot is held until the call really ends, not until the caller stops waiting for it.
+        future.add_done_callback(lambda _: limiter.release())
+    done, _ = wait((future,), timeout=timeout)
+
+    if not done:
+        future.cancel()
+        expire(timeout)
+
+    return future.result()
+
+async def await_with_timeout(function: Callable[..., Awaitable[Any]], timeout: float, /, *args: Any, **kwargs: Any) -> Any:
+    task = asyncio.ensure_future(function(*args, **kwargs))
+
+    try:
+        done, _ = await asyncio.wait((task,), timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+    if not done:
+        task.cancel()
+        await asyncio.wait((task,))
+        expire(timeout)
+
+    return task.result()
+
+def expire(timeout: float) -> NoReturn:
+    raise CallTimeoutError(f'The call did not complete within {timeout} seconds.')
@@ -0,0 +1,92 @@
+from collections import Counter
+from importlib import import_module
+from math import isnan
+from typing import NamedTuple, List, Dict, Tuple, Type, Callable, Any
+
+from escape.message_templates import describe_counts
+from escape.wrapper import Wrapper
+
+
+class VectorizedResult(NamedTuple):
+    values: Any
+    failed: Any
+    exceptions: Dict[Type[BaseException], int]
+
+
+def import_numpy() -> Any:
+    try:
+        return import_module('numpy')
+    except ImportError as e:
+        raise ImportError('NumPy is required for escape.vectorize, install it with "pip install escaping[numpy]".') from e
+
+
+class Vectorizer:
+    def __init__(self, function: Callable[[Any], Any], wrapper: Wrapper, dtype: Any, chunk_size: int) -> None:
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError('The chunk size must be a positive integer.')
+
+        self.numpy: Any = import_numpy()
+        dtype = self.numpy.dtype(dtype)
+        if dtype.kind not in 'fcO' and wrapper.default_factory is None and isinstance(wrapper.default, float) and isnan(wrapper.default):
+            raise ValueError(f'Failed elements cannot be filled with NaN in an array of type "{dtype}", pass default or default_factory.')
+
+        self.function: Callable[[Any], Any] = function
+        self.wrapper: Wrapper = wrapper
+        self.dtype: Any = dtype
+        self.chunk_size: int = chunk_size
+        self.function_name: str = getattr(function, '__name__', repr(function))
+
+    def __call__(self, array: Any) -> VectorizedResult:
+        numpy = self.numpy
+        array = numpy.asarray(array)
+        items = array.reshape(-1)
+        values = numpy.empty(items.size, dtype=self.dtype)
+        failed = numpy.zeros(items.size, dtype=bool)
+
+        suppressed: 'Counter[Type[BaseException]]' = Counter()
+
+        for start in range(0, items.size, self.chunk_size):
+            suppressed.update(self.run_chunk(items, values, failed, start, min(start + self.chunk_size, items.size)))
+
+        self.log_summary(items.size, suppressed)
+
+        return VectorizedResult(values.reshape(array.shape), failed.reshape(array.shape), dict(suppressed.most_common()))
+
+    def run_chunk(self, items: Any, values: Any, failed: Any, start: int, stop: int) -> 'Counter[Type[BaseException]]':
+        function = self.function
+        wrapper = self.wrapper
+        exceptions = wrapper.exceptions
+
+        results: List[Any] = []
+        failures: List[Tuple[int, BaseException]] = []
+
+        for index, item in enumerate(items[start:stop].tolist(), start):
+            try:
+                results.append(function(item))
+
+            except exceptions as e:
+                failures.append((index, e))
+                results.append(wrapper.get_default(e))
+
+            except BaseException as e:
+                if wrapper.error_log_message is None:
+                    exception_massage = '' if not str(e) else f' ("{e}")'
+                    wrapper.logger.error(f'When executing function "{self.function_name}"{wrapper.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
+                else:
+                    wrapper.logger.error(wrapper.error_log_message)
+                raise
+
+        values[start:stop] = results
+        for index, _ in failures:
+            failed[index] = True
+
+        return Counter(type(exception) for _, exception in failures)
+
+    def log_summary(self, processed: int, suppressed: 'Counter[Type[BaseException]]') -> None:
+        if suppressed:
+            wrapper = self.wrapper
+            if wrapper.error_log_message is None:
+                description = describe_counts(Counter({exception_type.__name__: number for exception_type, number in suppressed.items()}))
+                wrapper.logger.error(f'When executing function "{self.function_name}"{wrapper.wrapped_doc} for {processed} items, {sum(suppressed.values())} exceptions were suppressed: {description}.')
+            else:
+                wrapper.logger.error(wrapper.error_log_message)
@@ -0,0 +1,129 @@
+import sys
+from asyncio import Task, current_task
+from itertools import count
+from os import getpid
+from threading import Thread, Event, Lock, get_ident, enumerate as enumerate_threads
+from time import monotonic
+from traceback import StackSummary
+from types import FrameType, TracebackType
+from typing import TYPE_CHECKING, Callable, Awaitable, Iterator, Dict, List, Set, Tuple, Type, Optional, Any
+from uuid import uuid4
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:  # pragma: no cover
+    from emptylog import LoggerProtocol
+
+
+watchdogs: 'WeakValueDictionary[Tuple[int, str], Watchdog]' = WeakValueDictionary()
+
+
+class Watchdog:
+    def __init__(self, threshold: float, interval: Optional[float], logger: 'LoggerProtocol') -> None:
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or threshold <= 0:
+            raise ValueError('The watchdog threshold must be a positive number.')
+        if interval is not None and (isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0):
+            raise ValueError('The watchdog interval must be a positive number.')
+
+        self.threshold: float = threshold
+        self.interval: float = threshold if interval is None else interval
+        self.logger: 'LoggerProtocol' = logger
+        self.calls: Dict[int, Tuple[float, int, Optional['Task[Any]'], str]] = {}
+        self.reported: Set[int] = set()
+        self.tokens: Iterator[int] = count()
+        self.thread: Optional[Thread] = None
+        self.stopped: Event = Event()
+        self.lock: Lock = Lock()
+        self.identifier: str = uuid4().hex
+
+    def __reduce__(self) -> Tuple[Callable[..., 'Watchdog'], Tuple[str, float, float, 'LoggerProtocol', bool]]:
+        watchdogs[(getpid(), self.identifier)] = self
+        return restore_watchdog, (self.identifier, self.threshold, self.interval, self.logger, self.thread is not None)
+
+    def __enter__(self) -> 'Watchdog':
+        return self.start()
+
+    def __exit__(self, exception_type: Optional[Type[BaseException]], exception_value: Optional[BaseException], traceback: Optional[TracebackType]) -> None:
+        self.stop()
+
+    def start(self) -> 'Watchdog':
+        with self.lock:
+            if self.thread is None:
+                self.stopped.clear()
+                self.thread = Thread(target=self.run, name='escape-watchdog', daemon=True)
+                self.thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+            self.stopped.set()
+
+        if thread is not None:
+            thread.join()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def call(self, function: Callable[..., Any], description: str, /, *args: Any, **kwargs: Any) -> Any:
+        token = next(self.tokens)
+        self.calls[token] = (monotonic(), get_ident(), None, description)
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            del self.calls[token]
+
+    async def await_call(self, function: Callable[..., Awaitable[Any]], description: str, /, *args: Any, **kwargs: Any) -> Any:
+        token = next(self.tokens)
+        self.calls[token] = (monotonic(), get_ident(), current_task(), description)
+
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            del self.calls[token]
+
+    def check(self) -> None:
+        now = monotonic()
+        calls = self.calls.copy()
+        self.reported.intersection_update(calls)
+
+        for token, (start, thread_id, task, description) in calls.items():
+            if token not in self.reported and now - start > self.threshold:
+                self.reported.add(token)
+                self.logger.warning(f'The {description} has been running for {now - start:.3f} seconds, which is longer than the threshold of {self.threshold} seconds. {self.describe_stack(thread_id, task)}')
+
+    def describe_stack(self, thread_id: int, task: Optional['Task[Any]']) -> str:
+        frames: List[FrameType] = []
+
+        if task is not None:
+            header = f'The stack of the task "{task.get_name()}":'
+            awaited: Any = task.get_coro()
+            while getattr(awaited, 'cr_frame', None) is not None:
+                frames.append(awaited.cr_frame)
+                awaited = awaited.cr_await
+        else:
+            names = {thread.ident: thread.name for thread in enumerate_threads()}
+            header = f'The stack of the thread "{names.get(thread_id, thread_id)}":'
+            frame = sys._current_frames().get(thread_id)
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            frames.reverse()
+
+        return header + '\n' + ''.join(StackSummary.extract((frame, frame.f_lineno) for frame in frames).format()).rstrip()
+
+
+def restore_watchdog(identifier: str, threshold: float, interval: float, logger: 'LoggerProtocol', running: bool) -> Watchdog:
+    watchdog = watchdogs.get((getpid(), identifier))
+
+    if watchdog is None:
+        watchdog = Watchdog(threshold, interval, logger)
+        watchdog.identifier = identifier
+        watchdogs[(getpid(), identifier)] = watchdog
+        if running:
+            watchdog.start()
+
+    return watchdog
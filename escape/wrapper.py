@@ -1,18 +1,52 @@
-from typing import Type, Callable, Tuple, Optional, Any
-from inspect import iscoroutinefunction, isgeneratorfunction
-from functools import wraps
+from typing import TYPE_CHECKING, Type, Callable, Tuple, Dict, Optional, Any
+from functools import partial, update_wrapper
 from types import TracebackType
 
-from emptylog import LoggerProtocol
+from escape.errors import SetDefaultReturnValueForContextManagerError, SetDefaultReturnValueForGeneratorFunctionError, ConcurrencyLimitExceededError, CallTimeoutError
+from escape.escaped_function import EscapedFunction
+from escape.message_templates import MessageTemplates
+from escape.log_buffers import ScopedLogger
+from escape.protocols import StatisticsProtocol
 
-from escape.errors import SetDefaultReturnValueForContextManagerError, SetDefaultReturnValueForGeneratorFunctionError
+if TYPE_CHECKING:  # pragma: no cover
+    from emptylog import LoggerProtocol
 
+    from escape.concurrency_limiter import ConcurrencyLimiter
+    from escape.single_flight import SingleFlight
+    from escape.watchdogs import Watchdog
+    from escape.log_summaries import LogSummarizer
+
+
+def do_nothing() -> None:
+    pass
 
 class Wrapper:
-    def __init__(self, default: Any, exceptions: Tuple[Type[BaseException], ...], logger: LoggerProtocol, success_callback: Callable[[], Any], before: Callable[[], Any], error_log_message: Optional[str], success_logging: bool, success_log_message: Optional[str], error_callback: Callable[[], Any], doc: Optional[str] = None) -> None:
+    def __init__(self, default: Any, exceptions: Tuple[Type[BaseException], ...], logger: 'LoggerProtocol', success_callback: Callable[[], Any], before: Callable[[], Any], error_log_message: Optional[str], success_logging: bool, success_log_message: Optional[str], error_callback: Callable[[], Any], doc: Optional[str] = None, default_factory: Optional[Callable[..., Any]] = None, defaults_by_exception_type: Optional[Dict[Type[BaseException], Any]] = None, max_concurrency: Optional[int] = None, max_concurrency_timeout: Optional[float] = None, timeout: Optional[float] = None, hedge_after: Optional[float] = None, single_flight: bool = False, statistics: Optional[StatisticsProtocol] = None, slow_threshold: Optional[float] = None, watchdog: Optional['Watchdog'] = None, max_logs_per_second: Optional[int] = None) -> None:
+        if default is not None and default_factory is not None:
+            raise ValueError('You cannot set both a default value and a default factory.')
+        if max_concurrency is not None and (isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int) or max_concurrency <= 0):
+            raise ValueError('The maximum number of concurrent calls must be a positive integer.')
+        if max_concurrency is None and max_concurrency_timeout is not None:
+            raise ValueError('You cannot set a timeout for waiting for a free slot without setting the maximum number of concurrent calls.')
+        if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise ValueError('The timeout must be a positive number.')
+        if hedge_after is not None and (isinstance(hedge_after, bool) or not isinstance(hedge_after, (int, float)) or hedge_after < 0):
+            raise ValueError('The hedging delay must be a non-negative number.')
+        if slow_threshold is not None and (isinstance(slow_threshold, bool) or not isinstance(slow_threshold, (int, float)) or slow_threshold <= 0):
+            raise ValueError('The slow call threshold must be a positive number.')
+
+        if max_concurrency is not None:
+            exceptions = (*exceptions, ConcurrencyLimitExceededError)
+        if timeout is not None:
+            exceptions = (*exceptions, CallTimeoutError)
+
         self.default: Any = default
-        self.exceptions: Tuple[Type[BaseException], ...] = exceptions
-        self.logger: LoggerProtocol = logger
+        self.default_factory: Optional[Callable[..., Any]] = default_factory
+        self.is_default_factory_expects_exception: bool = self.does_factory_expect_exception(default_factory)
+        self.defaults_by_exception_type: Optional[Dict[Type[BaseException], Any]] = defaults_by_exception_type
+        self.resolved_defaults_cache: Dict[Type[BaseException], Any] = {}
+        self.exceptions: Tuple[Type[BaseException], ...] = self.normalize_exceptions(exceptions)
+        self.logger: 'LoggerProtocol' = ScopedLogger(logger)
         self.success_callback: Callable[[], Any] = success_callback
         self.error_callback: Callable[[], Any] = error_callback
         self.before: Callable[[], Any] = before
@@ -21,165 +55,411 @@ class Wrapper:
         self.success_logging: bool = success_logging
         self.doc: Optional[str] = doc
         self.wrapped_doc = '' if self.doc is None else f' ({self.doc})'
+        self.max_concurrency: Optional[int] = max_concurrency
+        self.max_concurrency_timeout: Optional[float] = max_concurrency_timeout
+        self.timeout: Optional[float] = timeout
+        self.hedge_after: Optional[float] = hedge_after
+        self.single_flight: bool = single_flight
+        self.statistics: Optional[StatisticsProtocol] = statistics
+        self.slow_threshold: Optional[float] = slow_threshold
+        self.watchdog: Optional['Watchdog'] = watchdog
+        self.log_summarizer: Optional['LogSummarizer'] = None
+        if max_logs_per_second is not None:
+            from escape.log_summaries import LogSummarizer
+            self.log_summarizer = LogSummarizer(max_logs_per_second, self.logger, self.wrapped_doc)
 
     def __call__(self, function: Callable[..., Any]) -> Callable[..., Any]:
-        @wraps(function)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            self.run_callback(self.before)
+        from inspect import iscoroutinefunction, isgeneratorfunction
+
+        limiter = None
+        if self.max_concurrency is not None:
+            from escape.concurrency_limiter import ConcurrencyLimiter
+            limiter = ConcurrencyLimiter(self.max_concurrency, self.max_concurrency_timeout)
+
+        call: Callable[..., Any] = function
+        if self.hedge_after is not None:
+            if not iscoroutinefunction(function):
+                raise ValueError('You cannot hedge calls of the function. This is only possible for coroutine functions.')
+            from escape.hedging import await_with_hedging
+            call = partial(await_with_hedging, call, self.hedge_after)
+        if self.timeout is not None:
+            from escape.timeouts import call_with_timeout, await_with_timeout
+            if iscoroutinefunction(function):
+                call = partial(await_with_timeout, call, self.timeout)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                call = partial(call_with_timeout, ThreadPoolExecutor(thread_name_prefix='escape'), limiter, call, self.timeout)
+                limiter = None
 
-            result = None
-            success_flag = False
+        flattened = self.flatten(function)
+        if flattened is not None:
+            return update_wrapper(flattened, function)
 
-            try:
-                result = function(*args, **kwargs)
-                success_flag = True
+        if iscoroutinefunction(function):
+            templates = MessageTemplates.for_function('coroutine function', function, self.wrapped_doc)
+            if self.slow_threshold is not None:
+                from escape.slow_calls import await_with_slow_call_detection
+                call = partial(await_with_slow_call_detection, call, self.slow_threshold, self.logger, templates.slow_call_prefix)
+            if self.watchdog is not None:
+                call = partial(self.watchdog.await_call, call, templates.description)
+            escaped = EscapedFunction(Wrapper.run_coroutine_function, self, function, call, limiter, templates)
+            if self.single_flight:
+                from escape.single_flight import SingleFlight
+                escaped = EscapedFunction(Wrapper.run_single_flight_coroutine_function, self, function, SingleFlight(), escaped)
+        elif isgeneratorfunction(function):
+            if self.has_default():
+                raise SetDefaultReturnValueForGeneratorFunctionError('You cannot set the default return value for the generator function. This is only possible for normal and coroutine functions.')
+            if self.max_concurrency is not None:
+                raise ValueError('You cannot limit the concurrency for the generator function. This is only possible for normal and coroutine functions.')
+            if self.timeout is not None:
+                raise ValueError('You cannot set a timeout for the generator function. This is only possible for normal and coroutine functions.')
+            if self.single_flight:
+                raise ValueError('You cannot deduplicate calls of the generator function. This is only possible for normal and coroutine functions.')
+            if self.watchdog is not None:
+                raise ValueError('You cannot watch calls of the generator function. This is only possible for normal and coroutine functions.')
+            templates = MessageTemplates.for_function('generator function', function, self.wrapped_doc)
+            if self.slow_threshold is not None:
+                from escape.slow_calls import yield_with_slow_call_detection
+                call = partial(yield_with_slow_call_detection, call, self.slow_threshold, self.logger, templates.slow_call_prefix)
+            escaped = EscapedFunction(Wrapper.run_generator_function, self, function, call, templates)
+        else:
+            templates = MessageTemplates.for_function('function', function, self.wrapped_doc)
+            if self.slow_threshold is not None:
+                from escape.slow_calls import call_with_slow_call_detection
+                call = partial(call_with_slow_call_detection, call, self.slow_threshold, self.logger, templates.slow_call_prefix)
+            if self.watchdog is not None:
+                call = partial(self.watchdog.call, call, templates.description)
+            escaped = EscapedFunction(Wrapper.run_function, self, function, call, limiter, templates)
+            if self.single_flight:
+                from escape.single_flight import SingleFlight
+                escaped = EscapedFunction(Wrapper.run_single_flight_function, self, function, SingleFlight(), escaped)
+
+        return update_wrapper(escaped, function)
+
+    def run_function(self, function: Callable[..., Any], call: Callable[..., Any], limiter: Optional['ConcurrencyLimiter'], templates: MessageTemplates, /, *args: Any, **kwargs: Any) -> Any:
+        self.run_callback(self.before)
 
-            except self.exceptions as e:
-                if self.error_log_message is None:
-                    exception_massage = '' if not str(e) else f' ("{e}")'
-                    self.logger.exception(f'When executing function "{function.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was suppressed.')
-                else:
-                    self.logger.exception(self.error_log_message)
-                result = self.default
+        result = None
+        success_flag = False
+
+        try:
+            if limiter is None:
+                result = call(*args, **kwargs)
+            else:
+                limiter.acquire()
+                try:
+                    result = call(*args, **kwargs)
+                finally:
+                    limiter.release()
+            success_flag = True
 
-            except BaseException as e:
+        except self.exceptions as e:
+            if self.statistics is not None:
+                self.statistics.record_suppressed()
+            if self.log_summarizer is None or self.log_summarizer.should_log(type(e)):
                 if self.error_log_message is None:
                     exception_massage = '' if not str(e) else f' ("{e}")'
-                    self.logger.error(f'When executing function "{function.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
+                    self.logger.exception(f'{templates.failure_prefix}{type(e).__name__}"{exception_massage} was suppressed.')
                 else:
-                    self.logger.error(self.error_log_message)
-                self.run_callback(self.error_callback)
-                raise e
+                    self.logger.exception(self.error_log_message)
+            result = self.get_default(e)
 
-            if success_flag:
-                if self.success_logging:
-                    if self.success_log_message is None:
-                        self.logger.info(f'The function "{function.__name__}"{self.wrapped_doc} completed successfully.')
-                    else:
-                        self.logger.info(self.success_log_message)
+        except BaseException as e:
+            if self.statistics is not None:
+                self.statistics.record_not_suppressed()
+            if self.error_log_message is None:
+                exception_massage = '' if not str(e) else f' ("{e}")'
+                self.logger.error(f'{templates.failure_prefix}{type(e).__name__}"{exception_massage} was not suppressed.')
+            else:
+                self.logger.error(self.error_log_message)
+            self.run_callback(self.error_callback)
+            raise
 
-                self.run_callback(self.success_callback)
+        if success_flag:
+            if self.statistics is not None:
+                self.statistics.record_success()
+            if self.success_logging:
+                if self.success_log_message is None:
+                    self.logger.info(templates.success)
+                else:
+                    self.logger.info(self.success_log_message)
 
-            else:
-                self.run_callback(self.error_callback)
+            self.run_callback(self.success_callback)
 
-            return result
+        else:
+            self.run_callback(self.error_callback)
 
+        return result
 
-        @wraps(function)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            self.run_callback(self.before)
+    async def run_coroutine_function(self, function: Callable[..., Any], call: Callable[..., Any], limiter: Optional['ConcurrencyLimiter'], templates: MessageTemplates, /, *args: Any, **kwargs: Any) -> Any:
+        self.run_callback(self.before)
 
-            result = None
-            success_flag = False
+        result = None
+        success_flag = False
 
-            try:
-                result = await function(*args, **kwargs)
-                success_flag = True
+        try:
+            if limiter is None:
+                result = await call(*args, **kwargs)
+            else:
+                await limiter.acquire_async()
+                try:
+                    result = await call(*args, **kwargs)
+                finally:
+                    limiter.release_async()
+            success_flag = True
 
-            except self.exceptions as e:
+        except self.exceptions as e:
+            if self.statistics is not None:
+                self.statistics.record_suppressed()
+            if self.log_summarizer is None or self.log_summarizer.should_log(type(e)):
                 if self.error_log_message is None:
                     exception_massage = '' if not str(e) else f' ("{e}")'
-                    self.logger.exception(f'When executing coroutine function "{function.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was suppressed.')
+                    self.logger.exception(f'{templates.failure_prefix}{type(e).__name__}"{exception_massage} was suppressed.')
                 else:
                     self.logger.exception(self.error_log_message)
-                result = self.default
+            result = self.get_default(e)
 
-            except BaseException as e:
-                if self.error_log_message is None:
-                    exception_massage = '' if not str(e) else f' ("{e}")'
-                    self.logger.error(f'When executing coroutine function "{function.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
-                else:
-                    self.logger.error(self.error_log_message)
-                self.run_callback(self.error_callback)
-                raise e
+        except BaseException as e:
+            if self.statistics is not None:
+                self.statistics.record_not_suppressed()
+            if self.error_log_message is None:
+                exception_massage = '' if not str(e) else f' ("{e}")'
+                self.logger.error(f'{templates.failure_prefix}{type(e).__name__}"{exception_massage} was not suppressed.')
+            else:
+                self.logger.error(self.error_log_message)
+            self.run_callback(self.error_callback)
+            raise
 
-            if success_flag:
-                if self.success_logging:
-                    if self.success_log_message is None:
-                        self.logger.info(f'The coroutine function "{function.__name__}"{self.wrapped_doc} completed successfully.')
-                    else:
-                        self.logger.info(self.success_log_message)
+        if success_flag:
+            if self.statistics is not None:
+                self.statistics.record_success()
+            if self.success_logging:
+                if self.success_log_message is None:
+                    self.logger.info(templates.success)
+                else:
+                    self.logger.info(self.success_log_message)
 
-                self.run_callback(self.success_callback)
+            self.run_callback(self.success_callback)
 
-            else:
-                self.run_callback(self.error_callback)
+        else:
+            self.run_callback(self.error_callback)
 
-            return result
+        return result
 
-        @wraps(function)
-        def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
-            self.run_callback(self.before)
+    def run_generator_function(self, function: Callable[..., Any], call: Callable[..., Any], templates: MessageTemplates, /, *args: Any, **kwargs: Any) -> Any:
+        self.run_callback(self.before)
 
-            result = None
-            success_flag = False
+        result = None
+        success_flag = False
 
-            try:
-                yield from function(*args, **kwargs)
-                success_flag = True
+        try:
+            yield from call(*args, **kwargs)
+            success_flag = True
 
-            except self.exceptions as e:
+        except self.exceptions as e:
+            if self.statistics is not None:
+                self.statistics.record_suppressed()
+            if self.log_summarizer is None or self.log_summarizer.should_log(type(e)):
                 if self.error_log_message is None:
                     exception_massage = '' if not str(e) else f' ("{e}")'
-                    self.logger.exception(f'When executing generator function "{function.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was suppressed.')
+                    self.logger.exception(f'{templates.failure_prefix}{type(e).__name__}"{exception_massage} was suppressed.')
                 else:
                     self.logger.exception(self.error_log_message)
-                result = self.default
+            result = self.get_default(e)
 
-            except BaseException as e:
-                if self.error_log_message is None:
-                    exception_massage = '' if not str(e) else f' ("{e}")'
-                    self.logger.error(f'When executing generator function "{function.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
+        except BaseException as e:
+            if self.statistics is not None:
+                self.statistics.record_not_suppressed()
+            if self.error_log_message is None:
+                exception_massage = '' if not str(e) else f' ("{e}")'
+                self.logger.error(f'{templates.failure_prefix}{type(e).__name__}"{exception_massage} was not suppressed.')
+            else:
+                self.logger.error(self.error_log_message)
+            self.run_callback(self.error_callback)
+            raise
+
+        if success_flag:
+            if self.statistics is not None:
+                self.statistics.record_success()
+            if self.success_logging:
+                if self.success_log_message is None:
+                    self.logger.info(templates.success)
                 else:
-                    self.logger.error(self.error_log_message)
-                self.run_callback(self.error_callback)
-                raise e
+                    self.logger.info(self.success_log_message)
 
-            if success_flag:
-                if self.success_logging:
-                    if self.success_log_message is None:
-                        self.logger.info(f'The generator function "{function.__name__}"{self.wrapped_doc} completed successfully.')
-                    else:
-                        self.logger.info(self.success_log_message)
+            self.run_callback(self.success_callback)
 
-                self.run_callback(self.success_callback)
+        else:
+            self.run_callback(self.error_callback)
 
-            else:
-                self.run_callback(self.error_callback)
+        return result
 
-            return result
+    def run_single_flight_function(self, function: Callable[..., Any], flights: 'SingleFlight', escaped: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        return flights.call(escaped, args, kwargs)
+
+    async def run_single_flight_coroutine_function(self, function: Callable[..., Any], flights: 'SingleFlight', escaped: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        return await flights.call_async(escaped, args, kwargs)
+
+    def flatten(self, function: Callable[..., Any]) -> Optional[EscapedFunction]:
+        if not isinstance(function, EscapedFunction) or not self.is_flattenable():
+            return None
+
+        if function.func is Wrapper.run_function or function.func is Wrapper.run_coroutine_function:
+            inner_wrapper, original_function = function.args[:2]
+            if not inner_wrapper.is_flattenable():
+                return None
+            layers: Tuple[Wrapper, ...] = (self, inner_wrapper)
+            inner_templates: Tuple[MessageTemplates, ...] = (function.args[4],)
+        elif function.func is Wrapper.run_flattened_function or function.func is Wrapper.run_flattened_coroutine_function:
+            original_function, inner_layers, inner_templates = function.args[2:5]
+            layers = (self, *inner_layers)
+        else:
+            return None
 
+        if function.func is Wrapper.run_function or function.func is Wrapper.run_flattened_function:
+            templates = (MessageTemplates.for_function('function', original_function, self.wrapped_doc), *inner_templates)
+            return EscapedFunction(Wrapper.run_flattened_function, self, function, original_function, layers, templates)
+        templates = (MessageTemplates.for_function('coroutine function', original_function, self.wrapped_doc), *inner_templates)
+        return EscapedFunction(Wrapper.run_flattened_coroutine_function, self, function, original_function, layers, templates)
 
-        if iscoroutinefunction(function):
-            return async_wrapper
-        elif isgeneratorfunction(function):
-            if self.default is not None:
-                raise SetDefaultReturnValueForGeneratorFunctionError('You cannot set the default return value for the generator function. This is only possible for normal and coroutine functions.')
-            return generator_wrapper
-        return wrapper
+    def is_flattenable(self) -> bool:
+        return self.max_concurrency is None and self.timeout is None and self.hedge_after is None and not self.single_flight and self.slow_threshold is None and self.watchdog is None
 
-    def __enter__(self) -> 'Wrapper':
-        if self.default is not None:
-            raise SetDefaultReturnValueForContextManagerError('You cannot set a default value for the context manager. This is only possible for the decorator.')
+    def run_flattened_function(self, escaped: Callable[..., Any], function: Callable[..., Any], layers: Tuple['Wrapper', ...], templates: Tuple[MessageTemplates, ...], /, *args: Any, **kwargs: Any) -> Any:
+        entered = 0
+
+        try:
+            for layer in layers:
+                if layer.before is not do_nothing:
+                    layer.run_callback(layer.before)
+                entered += 1
+            result = function(*args, **kwargs)
+
+        except BaseException as e:
+            result, entered = self.unwind_layers(layers[:entered], templates, e)
+
+        return self.complete_layers(layers[:entered], templates, result)
+
+    async def run_flattened_coroutine_function(self, escaped: Callable[..., Any], function: Callable[..., Any], layers: Tuple['Wrapper', ...], templates: Tuple[MessageTemplates, ...], /, *args: Any, **kwargs: Any) -> Any:
+        entered = 0
+
+        try:
+            for layer in layers:
+                if layer.before is not do_nothing:
+                    layer.run_callback(layer.before)
+                entered += 1
+            result = await function(*args, **kwargs)
+
+        except BaseException as e:
+            result, entered = self.unwind_layers(layers[:entered], templates, e)
+
+        return self.complete_layers(layers[:entered], templates, result)
+
+    def unwind_layers(self, layers: Tuple['Wrapper', ...], templates: Tuple[MessageTemplates, ...], exception: BaseException) -> Tuple[Any, int]:
+        index = len(layers)
+
+        while index:
+            index -= 1
+            layer = layers[index]
+
+            if isinstance(exception, layer.exceptions):
+                if layer.statistics is not None:
+                    layer.statistics.record_suppressed()
+                if layer.log_summarizer is None or layer.log_summarizer.should_log(type(exception)):
+                    if layer.error_log_message is None:
+                        exception_massage = '' if not str(exception) else f' ("{exception}")'
+                        layer.logger.exception(f'{templates[index].failure_prefix}{type(exception).__name__}"{exception_massage} was suppressed.')
+                    else:
+                        layer.logger.exception(layer.error_log_message)
+                try:
+                    result = layer.get_default(exception)
+                except BaseException as e:
+                    return self.unwind_layers(layers[:index], templates, e)
+                if layer.error_callback is not do_nothing:
+                    try:
+                        layer.run_callback(layer.error_callback)
+                    except BaseException as e:
+                        return self.unwind_layers(layers[:index], templates, e)
+                return result, index
+
+            if layer.statistics is not None:
+                layer.statistics.record_not_suppressed()
+            if layer.error_log_message is None:
+                exception_massage = '' if not str(exception) else f' ("{exception}")'
+                layer.logger.error(f'{templates[index].failure_prefix}{type(exception).__name__}"{exception_massage} was not suppressed.')
+            else:
+                layer.logger.error(layer.error_log_message)
+            if layer.error_callback is not do_nothing:
+                try:
+                    layer.run_callback(layer.error_callback)
+                except BaseException as e:
+                    return self.unwind_layers(layers[:index], templates, e)
+
+        raise
+
+    def complete_layers(self, layers: Tuple['Wrapper', ...], templates: Tuple[MessageTemplates, ...], result: Any) -> Any:
+        index = len(layers)
+
+        while index:
+            index -= 1
+            layer = layers[index]
+
+            if layer.statistics is not None:
+                layer.statistics.record_success()
+            if layer.success_logging:
+                if layer.success_log_message is None:
+                    layer.logger.info(templates[index].success)
+                else:
+                    layer.logger.info(layer.success_log_message)
+            if layer.success_callback is not do_nothing:
+                try:
+                    layer.run_callback(layer.success_callback)
+                except BaseException as e:
+                    result, index = self.unwind_layers(layers[:index], templates, e)
 
+        return result
+
+    def __enter__(self) -> 'Wrapper':
+        self.validate_context_manager()
         self.run_callback(self.before)
 
         return self
 
+    def validate_context_manager(self) -> None:
+        if self.has_default():
+            raise SetDefaultReturnValueForContextManagerError('You cannot set a default value for the context manager. This is only possible for the decorator.')
+        if self.max_concurrency is not None:
+            raise ValueError('You cannot limit the concurrency for the context manager. This is only possible for the decorator.')
+        if self.timeout is not None:
+            raise ValueError('You cannot set a timeout for the context manager. This is only possible for the decorator.')
+        if self.hedge_after is not None:
+            raise ValueError('You cannot hedge calls inside the context manager. This is only possible for coroutine functions.')
+        if self.single_flight:
+            raise ValueError('You cannot deduplicate calls inside the context manager. This is only possible for the decorator.')
+        if self.slow_threshold is not None:
+            raise ValueError('You cannot set a slow call threshold for the context manager. This is only possible for the decorator.')
+        if self.watchdog is not None:
+            raise ValueError('You cannot watch calls inside the context manager. This is only possible for the decorator.')
+
     def __exit__(self, exception_type: Optional[Type[BaseException]], exception_value: Optional[BaseException], traceback: Optional[TracebackType]) -> bool:
         result = False
 
         if exception_type is not None:
             exception_massage = '' if not str(exception_value) else f' ("{exception_value}")'
 
-            for muted_exception_type in self.exceptions:
-                if issubclass(exception_type, muted_exception_type):
+            if issubclass(exception_type, self.exceptions):
+                if self.log_summarizer is None or self.log_summarizer.should_log(exception_type):
                     if self.error_log_message is None:
                         self.logger.exception(f'The "{exception_type.__name__}"{exception_massage} exception was suppressed inside the context{self.wrapped_doc}.')
                     else:
                         self.logger.exception(self.error_log_message)
-                    result = True
+                result = True
+
+            if self.statistics is not None:
+                if result:
+                    self.statistics.record_suppressed()
+                else:
+                    self.statistics.record_not_suppressed()
 
             if not result:
                 if self.error_log_message is None:
@@ -190,6 +470,8 @@ class Wrapper:
             self.run_callback(self.error_callback)
 
         else:
+            if self.statistics is not None:
+                self.statistics.record_success()
             if self.success_logging:
                 if self.success_log_message is None:
                     self.logger.info(f'The code block{self.wrapped_doc} was executed successfully.')
@@ -200,6 +482,16 @@ class Wrapper:
 
         return result
 
+    @staticmethod
+    def normalize_exceptions(exceptions: Tuple[Type[BaseException], ...]) -> Tuple[Type[BaseException], ...]:
+        if len(exceptions) < 2:
+            return exceptions
+
+        unique = set(exceptions)
+        covered = {exception for exception in unique if any(exception is not parent and issubclass(exception, parent) for parent in unique)}
+
+        return tuple(sorted(unique - covered, key=lambda exception: (exception.__module__, exception.__qualname__)))
+
     def run_callback(self, callback: Callable[[], Any]) -> None:
         try:
             callback()
@@ -211,4 +503,44 @@ class Wrapper:
         except BaseException as e:
             exception_massage = '' if not str(e) else f' ("{e}")'
             self.logger.error(f'When executing the callback "{callback.__name__}"{self.wrapped_doc}, the exception "{type(e).__name__}"{exception_massage} was not suppressed.')
-            raise e
+            raise
+
+    def has_default(self) -> bool:
+        if self.defaults_by_exception_type is not None and any(value is not None for value in self.defaults_by_exception_type.values()):
+            return True
+
+        return self.default is not None or self.default_factory is not None
+
+    def get_default(self, exception: BaseException) -> Any:
+        if self.defaults_by_exception_type is not None:
+            exception_type = type(exception)
+            try:
+                return self.resolved_defaults_cache[exception_type]
+            except KeyError:
+                for base_type in exception_type.__mro__:
+                    if base_type in self.defaults_by_exception_type:
+                        value = self.defaults_by_exception_type[base_type]
+                        self.resolved_defaults_cache[exception_type] = value
+                        return value
+
+        if self.default_factory is None:
+            return self.default
+
+        elif self.is_default_factory_expects_exception:
+            return self.default_factory(exception)
+
+        return self.default_factory()
+
+    @staticmethod
+    def does_factory_expect_exception(factory: Optional[Callable[..., Any]]) -> bool:
+        if factory is None:
+            return False
+
+        from inspect import signature, Parameter
+
+        try:
+            parameters = signature(factory).parameters.values()
+        except (ValueError, TypeError):
+            return False
+
+        return any(parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD) and parameter.default is Parameter.empty for parameter in parameters)
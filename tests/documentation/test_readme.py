@@ -1,6 +1,8 @@
 import asyncio
 from contextlib import redirect_stdout
 from io import StringIO
+from threading import Thread, Event
+from time import sleep, monotonic
 
 import pytest
 import full_match
@@ -49,6 +51,31 @@ def test_example_decorator_mode_default_value():
     assert function() == 'some value'  # It's going to work.
 
 
+def test_example_decorator_mode_default_factory():
+    @escape(ValueError, default_factory=dict)
+    def function():
+        raise ValueError
+
+    assert function() == {}
+    assert function() is not function()
+
+
+def test_example_decorator_mode_default_factory_with_exception():
+    @escape(ValueError, default_factory=lambda exception: f'failed: {exception}')
+    def function():
+        raise ValueError('oh!')
+
+    assert function() == 'failed: oh!'
+
+
+def test_example_decorator_mode_defaults_by_exception_type():
+    @escape({TimeoutError: 'cached value', KeyError: {}, ...: None})
+    def function():
+        raise KeyError
+
+    assert function() == {}
+
+
 def test_example_decorator_mode_with_empty_breackets():
     @escape
     def function():
@@ -139,3 +166,166 @@ def test_get_escaper():
     escaper = escape.bake(ValueError)
 
     assert isinstance(escaper, BakedEscaper)
+
+
+def test_example_batching():
+    async def fetch_many(keys):
+        return [f'value for {key}' for key in keys]
+
+    fetch = escape.batched(fetch_many, ValueError, max_batch=100, max_delay=0.005)
+
+    async def main():
+        return await asyncio.gather(fetch(1), fetch(2), fetch(3))
+
+    assert asyncio.run(main()) == ['value for 1', 'value for 2', 'value for 3']
+
+
+def test_example_vectorize():
+    numpy = pytest.importorskip('numpy')
+
+    reciprocal = escape.vectorize(lambda number: 1 / number, ZeroDivisionError)
+    values, failed, exceptions = reciprocal(numpy.array([1, 0, 4]))
+
+    buffer = StringIO()
+    with redirect_stdout(buffer):
+        print(values)
+        print(failed)
+        print(exceptions)
+
+    assert buffer.getvalue() == "[1.    nan 0.25]\n[False  True False]\n{<class 'ZeroDivisionError'>: 1}\n"
+
+
+def test_example_collect():
+    logger = MemoryLogger()
+
+    def validate(record):
+        if record < 0:
+            raise ValueError
+
+    with escape.collect(ValueError, logger=logger, doc='validation') as bag:
+        for record in [-1, 2, -3, -4]:
+            with bag:
+                validate(record)
+
+    assert logger.data.error[0].message == 'When executing the code block (validation), 3 exceptions were suppressed: "ValueError" (3).'
+
+
+def test_example_guard():
+    logger = MemoryLogger()
+    parsed = []
+
+    def parse(line):
+        parsed.append(int(line))
+
+    guard = escape.guard(ValueError, logger=logger)
+
+    for line in ['1', 'kek', '2']:
+        with guard:
+            parse(line)
+
+    for line, guard in escape.each(['3', 'lol'], ValueError, logger=logger):
+        with guard:
+            parse(line)
+
+    assert parsed == [1, 2, 3]
+    assert len(logger.data.exception) == 2
+
+
+def test_example_stacked_decorators():
+    @escape(ValueError, default='outer')
+    @escape(ZeroDivisionError, default='inner')
+    def function(exception):
+        raise exception
+
+    assert function(ZeroDivisionError) == 'inner'
+    assert function(ValueError) == 'outer'
+
+
+def test_example_lazy_decoration():
+    logger = MemoryLogger()
+
+    @escape.lazy(ValueError, default='default', logger=logger)
+    def function():
+        raise ValueError
+
+    assert len(logger.data) == 0
+    assert function() == 'default'
+    assert len(logger.data) == 1
+
+
+def test_example_slow_threshold(monkeypatch):
+    logger = MemoryLogger()
+    readings = [10.0, 10.734]
+    monkeypatch.setattr('escape.slow_calls.monotonic', lambda: readings.pop(0))
+
+    @escape(default='fallback', slow_threshold=0.5, logger=logger, doc='database')
+    def function():
+        return 'result'
+
+    assert function() == 'result'
+    assert logger.data.warning[0].message == 'The function "function" (database) took 0.734 seconds, which is longer than the threshold of 0.5 seconds.'
+
+
+def test_example_watchdog():
+    logger = MemoryLogger()
+    release = Event()
+    watchdog = escape.watchdog(0.01, logger=logger).start()  # type: ignore[attr-defined]
+
+    @escape(default='fallback', watchdog=watchdog)
+    def function():
+        release.wait()
+        return 'result'
+
+    thread = Thread(target=function)
+    thread.start()
+    deadline = monotonic() + 5
+    while not logger.data.warning and monotonic() < deadline:
+        sleep(0.001)
+    release.set()
+    thread.join()
+    watchdog.stop()
+
+    assert logger.data.warning[0].message.startswith('The function "function" has been running for ')
+
+
+def test_example_max_logs_per_second(monkeypatch):
+    logger = MemoryLogger()
+    now = [100.0]
+    monkeypatch.setattr('escape.log_summaries.monotonic', lambda: now[0])
+    monkeypatch.setattr('escape.log_summaries.LogSummarizer.schedule_flush', lambda self, delay: None)
+
+    @escape(ValueError, max_logs_per_second=10, logger=logger)
+    def function():
+        raise ValueError
+
+    for _ in range(1000):
+        function()
+    now[0] += 1
+    function()
+
+    assert len(logger.data.exception) == 10
+    assert logger.data.error[0].message == 'Exceptions were suppressed too often (1000 per second, 1.000 seconds ago), 990 of them were not logged separately: "ValueError" (990).'
+
+
+def test_example_buffered_logs():
+    logger = MemoryLogger()
+
+    @escape(success_logging=True, logger=logger)
+    def fetch():
+        return 'data'
+
+    @escape(ValueError, logger=logger)
+    def parse(data):
+        raise ValueError
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        fetch()
+
+    assert len(logger.data) == 0
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        parse(fetch())
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message.startswith('2 log records were buffered:\n[INFO] The function "fetch" completed successfully.\n[EXCEPTION] When executing function "parse", the exception "ValueError" was suppressed.\nTraceback (most recent call last):\n')
+    assert logger.data.error[0].message.endswith('\nValueError')
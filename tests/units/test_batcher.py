@@ -0,0 +1,320 @@
+import asyncio
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.batcher import Batcher
+
+
+def test_batched_returns_batcher():
+    async def batch_function(items):
+        return items
+
+    assert isinstance(escape.batched(batch_function), Batcher)
+
+
+def test_calls_within_one_tick_are_coalesced():
+    batches = []
+
+    async def batch_function(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    load = escape.batched(batch_function)
+
+    async def main():
+        return await asyncio.gather(*(load(number) for number in range(5)))
+
+    assert asyncio.run(main()) == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+
+def test_max_batch():
+    batches = []
+
+    async def batch_function(items):
+        batches.append(items)
+        return items
+
+    load = escape.batched(batch_function, max_batch=2)
+
+    async def main():
+        return await asyncio.gather(*(load(number) for number in range(5)))
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_max_delay():
+    batches = []
+
+    async def batch_function(items):
+        batches.append(items)
+        return items
+
+    load = escape.batched(batch_function, max_delay=0.01)
+
+    async def delayed_load(item, delay):
+        await asyncio.sleep(delay)
+        return await load(item)
+
+    async def main():
+        return await asyncio.gather(delayed_load(1, 0), delayed_load(2, 0.001), delayed_load(3, 0.1))
+
+    assert asyncio.run(main()) == [1, 2, 3]
+    assert batches == [[1, 2], [3]]
+
+
+def test_suppressed_exception_of_batch_is_logged_once():
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        raise ValueError('message')
+
+    load = escape.batched(batch_function, ValueError, default='default', logger=logger, doc='some doc')
+
+    async def main():
+        return await asyncio.gather(*(load(number) for number in range(3)))
+
+    assert asyncio.run(main()) == ['default', 'default', 'default']
+    assert len(logger.data) == 1
+    assert logger.data.exception[0].message == 'When executing batch function "batch_function" (some doc) for 3 items, the exception "ValueError" ("message") was suppressed.'
+
+
+def test_not_suppressed_exception_of_batch_is_raised_for_each_caller():
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        raise ZeroDivisionError
+
+    load = escape.batched(batch_function, ValueError, logger=logger)
+
+    async def main():
+        return await asyncio.gather(*(load(number) for number in range(2)), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert [type(result) for result in results] == [ZeroDivisionError, ZeroDivisionError]
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing batch function "batch_function" for 2 items, the exception "ZeroDivisionError" was not suppressed.'
+
+
+def test_per_item_exceptions():
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        return [item if item % 2 else ValueError(str(item)) for item in items]
+
+    load = escape.batched(batch_function, ValueError, default_factory=lambda exception: f'error {exception}', logger=logger)
+
+    async def main():
+        return await asyncio.gather(*(load(number) for number in range(5)))
+
+    assert asyncio.run(main()) == ['error 0', 1, 'error 2', 3, 'error 4']
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing batch function "batch_function" for 5 items, 3 exceptions were suppressed: "ValueError" (3).'
+
+
+def test_per_item_not_suppressed_exceptions():
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        return [ZeroDivisionError() if item else item for item in items]
+
+    load = escape.batched(batch_function, ValueError, logger=logger)
+
+    async def main():
+        return await asyncio.gather(load(0), load(1), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert results[0] == 0
+    assert isinstance(results[1], ZeroDivisionError)
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing batch function "batch_function" for 2 items, 1 exceptions were not suppressed: "ZeroDivisionError" (1).'
+
+
+@pytest.mark.parametrize('per_item', [True, False])
+def test_failing_default_factory_resolves_every_caller(per_item):
+    async def batch_function(items):
+        if per_item:
+            return [ValueError() for _ in items]
+        raise ValueError
+
+    def default_factory(exception):
+        raise KeyError('no default')
+
+    load = escape.batched(batch_function, ValueError, default_factory=default_factory)
+
+    async def main():
+        return await asyncio.wait_for(asyncio.gather(load(1), load(2), return_exceptions=True), 1)
+
+    results = asyncio.run(main())
+
+    assert len(results) == 2
+    assert all(isinstance(result, KeyError) for result in results)
+
+
+def test_wrong_number_of_results():
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        return []
+
+    load = escape.batched(batch_function, logger=logger)
+
+    assert asyncio.run(load(1)) is None
+    assert logger.data.exception[0].message == 'When executing batch function "batch_function" for 1 items, the exception "ValueError" ("The batch function returned 0 results for 1 items.") was suppressed.'
+
+
+def test_success_logging_and_callbacks():
+    logger = MemoryLogger()
+    calls = []
+
+    async def batch_function(items):
+        return items
+
+    load = escape.batched(batch_function, logger=logger, success_logging=True, before=lambda: calls.append('before'), success_callback=lambda: calls.append('success'))
+
+    assert asyncio.run(load(1)) == 1
+    assert calls == ['before', 'success']
+    assert logger.data.info[0].message == 'The batch function "batch_function" completed successfully for 1 items.'
+
+
+def test_not_coroutine_batch_function():
+    with pytest.raises(ValueError, match=full_match('The batch function must be a coroutine function.')):
+        escape.batched(lambda items: items)
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'message'),
+    [
+        ((1,), 'You are using the batcher for the wrong purpose.'),
+        ((), 'The maximum batch size must be a positive integer.', ),
+    ],
+)
+def test_wrong_arguments(arguments, message):
+    async def batch_function(items):
+        return items
+
+    with pytest.raises(ValueError, match=full_match(message)):
+        escape.batched(batch_function, *arguments, max_batch=0)
+
+
+@pytest.mark.parametrize(
+    'max_delay',
+    [
+        -1,
+        'kek',
+    ],
+)
+def test_wrong_max_delay(max_delay):
+    async def batch_function(items):
+        return items
+
+    with pytest.raises(ValueError, match=full_match('The maximum delay must be a non-negative number.')):
+        escape.batched(batch_function, max_delay=max_delay)
+
+
+def test_max_batch_of_one_item():
+    batches = []
+
+    async def batch_function(items):
+        batches.append(items)
+        return items
+
+    load = escape.batched(batch_function, max_batch=1)
+
+    async def main():
+        return await asyncio.gather(load(1), load(2))
+
+    assert asyncio.run(main()) == [1, 2]
+    assert batches == [[1], [2]]
+
+
+@pytest.mark.parametrize(
+    ('batch_function_result', 'expected_result', 'log_level'),
+    [
+        (ValueError(), None, 'exception'),
+        (ZeroDivisionError(), ZeroDivisionError, 'error'),
+        ([ValueError()], None, 'error'),
+        ([ZeroDivisionError()], ZeroDivisionError, 'error'),
+    ],
+)
+def test_own_error_log_message(batch_function_result, expected_result, log_level):
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        if isinstance(batch_function_result, BaseException):
+            raise batch_function_result
+        return batch_function_result
+
+    load = escape.batched(batch_function, ValueError, logger=logger, error_log_message='kek')
+
+    async def main():
+        return await asyncio.gather(load(1), return_exceptions=True)
+
+    result = asyncio.run(main())[0]
+
+    if expected_result is None:
+        assert result is None
+    else:
+        assert isinstance(result, expected_result)
+    assert len(logger.data) == 1
+    assert getattr(logger.data, log_level)[0].message == 'kek'
+
+
+def test_own_success_log_message():
+    logger = MemoryLogger()
+
+    async def batch_function(items):
+        return items
+
+    load = escape.batched(batch_function, logger=logger, success_logging=True, success_log_message='kek')
+
+    assert asyncio.run(load(1)) == 1
+    assert logger.data.info[0].message == 'kek'
+
+
+@pytest.mark.parametrize(
+    'batch_function_result',
+    [
+        [1],
+        [ZeroDivisionError()],
+    ],
+)
+def test_results_for_cancelled_callers_are_dropped(batch_function_result):
+    started = []
+
+    async def batch_function(items):
+        started.append(items)
+        await asyncio.sleep(0.01)
+        return batch_function_result
+
+    load = escape.batched(batch_function, ValueError)
+
+    async def main():
+        task = asyncio.ensure_future(load(1))
+        while not started:
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0.02)
+        return task.cancelled()
+
+    assert asyncio.run(main())
+
+
+def test_cancelled_error_as_result_of_item_cancels_caller():
+    async def batch_function(items):
+        return [asyncio.CancelledError()]
+
+    load = escape.batched(batch_function, ValueError)
+
+    async def main():
+        task = asyncio.ensure_future(load(1))
+        await asyncio.gather(task, return_exceptions=True)
+        return task.cancelled()
+
+    assert asyncio.run(main())
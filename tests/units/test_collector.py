@@ -0,0 +1,196 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.collector import ErrorCollector
+
+
+def validate(number):
+    if number < 0:
+        raise ValueError(f'{number} is negative')
+    if number == 0:
+        raise ZeroDivisionError
+
+
+def test_collect_returns_collector():
+    assert isinstance(escape.collect(), ErrorCollector)
+
+
+def test_exceptions_are_collected_and_logged_once():
+    logger = MemoryLogger()
+
+    with escape.collect(ValueError, ZeroDivisionError, logger=logger, doc='validation') as bag:
+        for number in [1, -1, 0, -2, 3]:
+            with bag:
+                validate(number)
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing the code block (validation), 3 exceptions were suppressed: "ValueError" (2), "ZeroDivisionError" (1).'
+    assert bag.exceptions == []
+    assert bag.suppressed == 0
+
+
+def test_exceptions_are_available_before_the_end():
+    with escape.collect(ValueError) as bag:
+        for number in [-1, -2]:
+            with bag:
+                validate(number)
+
+        assert [str(exception) for exception in bag.exceptions] == ['-1 is negative', '-2 is negative']
+        assert bag.suppressed == 2
+
+
+def test_exception_in_outer_block_is_collected():
+    logger = MemoryLogger()
+
+    with escape.collect(ValueError, logger=logger):
+        validate(-1)
+
+    assert logger.data.error[0].message == 'When executing the code block, 1 exceptions were suppressed: "ValueError" (1).'
+
+
+def test_nothing_is_logged_without_exceptions():
+    logger = MemoryLogger()
+
+    with escape.collect(logger=logger) as bag:
+        with bag:
+            validate(1)
+
+    assert len(logger.data) == 0
+
+
+def test_default_exceptions():
+    logger = MemoryLogger()
+
+    with escape.collect(logger=logger) as bag:
+        with bag:
+            validate(0)
+
+    assert logger.data.error[0].message == 'When executing the code block, 1 exceptions were suppressed: "ZeroDivisionError" (1).'
+
+
+def test_buffer_is_bounded():
+    logger = MemoryLogger()
+
+    with escape.collect(ValueError, max_exceptions=2, logger=logger) as bag:
+        for number in range(-5, 0):
+            with bag:
+                validate(number)
+
+        assert len(bag.exceptions) == 2
+        assert bag.suppressed == 5
+
+    assert logger.data.error[0].message == 'When executing the code block, 5 exceptions were suppressed: "ValueError" (5).'
+
+
+def test_not_suppressed_exception():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError):
+        with escape.collect(ValueError, logger=logger) as bag:
+            for number in [-1, 0, 1]:
+                with bag:
+                    validate(number)
+
+    assert len(logger.data) == 3
+    assert logger.data.error[0].message == 'The "ZeroDivisionError" exception was not suppressed inside the context.'
+    assert logger.data.error[1].message == 'The "ZeroDivisionError" exception was not suppressed inside the context.'
+    assert logger.data.error[2].message == 'When executing the code block, 1 exceptions were suppressed: "ValueError" (1).'
+
+
+def test_not_suppressed_exception_with_message():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError), escape.collect(ValueError, logger=logger, doc='validation'):
+        raise ZeroDivisionError('oh!')
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'The "ZeroDivisionError" ("oh!") exception was not suppressed inside the context (validation).'
+
+
+def test_own_error_log_message():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError), escape.collect(ValueError, logger=logger, error_log_message='Oh my God!') as bag:
+        with bag:
+            validate(-1)
+        validate(0)
+
+    assert [record.message for record in logger.data.error] == ['Oh my God!', 'Oh my God!']
+
+
+def test_collector_can_be_reused():
+    logger = MemoryLogger()
+    bag = escape.collect(ValueError, logger=logger)
+
+    for _ in range(2):
+        with bag:
+            validate(-1)
+
+    assert len(logger.data) == 2
+    assert bag.suppressed == 0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason='Exception groups are available since Python 3.11.')
+def test_raise_group():
+    logger = MemoryLogger()
+
+    with pytest.raises(ExceptionGroup) as exception_info:  # noqa: F821
+        with escape.collect(ValueError, raise_group=True, logger=logger, doc='validation') as bag:
+            for number in [-1, 1, -2]:
+                with bag:
+                    validate(number)
+
+    group = exception_info.value
+    assert group.message == 'When executing the code block (validation), 2 exceptions were suppressed: "ValueError" (2).'
+    assert [str(exception) for exception in group.exceptions] == ['-1 is negative', '-2 is negative']
+    assert len(logger.data) == 0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason='Exception groups are available since Python 3.11.')
+def test_group_is_not_raised_over_not_suppressed_exception_or_without_stored_exceptions():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError), escape.collect(ValueError, raise_group=True, logger=logger) as bag:
+        with bag:
+            validate(-1)
+        validate(0)
+
+    with escape.collect(ValueError, raise_group=True, max_exceptions=0, logger=logger):
+        validate(-1)
+
+    assert logger.data.error[1].message == 'When executing the code block, 1 exceptions were suppressed: "ValueError" (1).'
+    assert logger.data.error[2].message == 'When executing the code block, 1 exceptions were suppressed: "ValueError" (1).'
+
+
+def test_raise_group_on_old_python(monkeypatch):
+    monkeypatch.setattr('escape.collector.sys', SimpleNamespace(version_info=(3, 10, 0)))
+    logger = MemoryLogger()
+
+    with escape.collect(ValueError, raise_group=True, logger=logger) as bag:
+        with bag:
+            validate(-1)
+
+    assert logger.data.error[0].message == 'When executing the code block, 1 exceptions were suppressed: "ValueError" (1).'
+
+
+def test_wrong_arguments():
+    with pytest.raises(ValueError, match=full_match('You are using the collector for the wrong purpose.')):
+        escape.collect('kek')
+
+
+@pytest.mark.parametrize(
+    'max_exceptions',
+    [
+        -1,
+        1.5,
+        True,
+    ],
+)
+def test_wrong_max_exceptions(max_exceptions):
+    with pytest.raises(ValueError, match=full_match('The maximum number of collected exceptions must be a non-negative integer.')):
+        escape.collect(max_exceptions=max_exceptions)
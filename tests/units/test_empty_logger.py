@@ -0,0 +1,22 @@
+import pytest
+
+from escape.empty_logger import EmptyLogger
+
+
+@pytest.mark.parametrize(
+    'method_name',
+    [
+        'debug',
+        'info',
+        'warning',
+        'error',
+        'exception',
+        'critical',
+    ],
+)
+def test_methods_do_nothing(method_name):
+    assert getattr(EmptyLogger(), method_name)('message', 1, extra={'key': 'value'}) is None
+
+
+def test_repr():
+    assert repr(EmptyLogger()) == 'EmptyLogger()'
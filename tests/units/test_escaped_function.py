@@ -0,0 +1,122 @@
+import asyncio
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from inspect import iscoroutinefunction, isgeneratorfunction
+
+import escape
+from escape.escaped_function import EscapedFunction
+from escape.baked_escaper import BakedEscaper
+from escape.wrapper import Wrapper
+
+
+@escape(ZeroDivisionError, default=0.0)
+def reciprocal(number):
+    return 1 / number
+
+
+def raw_reciprocal(number):
+    return 1 / number
+
+
+@escape(ZeroDivisionError, default=0.0)
+async def async_reciprocal(number):
+    return 1 / number
+
+
+@escape
+def generator_function(number):
+    yield 1 / number
+
+
+class SomeClass:
+    def __init__(self, number):
+        self.number = number
+
+    @escape(ZeroDivisionError, default=0.0)
+    def reciprocal(self):
+        return 1 / self.number
+
+
+def test_escaped_functions_are_escaped_function_objects():
+    assert isinstance(reciprocal, EscapedFunction)
+    assert isinstance(async_reciprocal, EscapedFunction)
+    assert isinstance(generator_function, EscapedFunction)
+
+    assert iscoroutinefunction(async_reciprocal)
+    assert isgeneratorfunction(generator_function)
+    assert not iscoroutinefunction(reciprocal)
+
+
+def test_escaped_method():
+    assert SomeClass(2).reciprocal() == 0.5
+    assert SomeClass(0).reciprocal() == 0.0
+    assert SomeClass.reciprocal is SomeClass.__dict__['reciprocal']
+
+
+def test_pickle_escaped_function():
+    functions = [
+        reciprocal,
+        escape(ZeroDivisionError, default=0.0)(raw_reciprocal),
+        escape.bake(ZeroDivisionError, default=0.0)(raw_reciprocal),
+    ]
+
+    for function in functions:
+        copy = pickle.loads(pickle.dumps(function))
+
+        assert copy(2) == 0.5
+        assert copy(0) == 0.0
+
+
+def test_escaped_function_reachable_by_name_is_pickled_by_reference():
+    assert pickle.loads(pickle.dumps(reciprocal)) is reciprocal
+    assert pickle.loads(pickle.dumps(async_reciprocal)) is async_reciprocal
+    assert pickle.loads(pickle.dumps(SomeClass.reciprocal)) is SomeClass.reciprocal
+
+
+def test_local_escaped_function_is_not_reachable_by_name():
+    @escape(ZeroDivisionError, default=0.0)
+    def local_reciprocal(number):
+        return 1 / number
+
+    assert reciprocal.is_reachable_by_name()
+    assert not local_reciprocal.is_reachable_by_name()
+
+
+def test_pickle_escaped_coroutine_function_and_generator_function():
+    assert asyncio.run(pickle.loads(pickle.dumps(async_reciprocal))(0)) == 0.0
+    assert list(pickle.loads(pickle.dumps(generator_function))(0)) == []
+
+
+def test_pickle_bound_escaped_method():
+    method = pickle.loads(pickle.dumps(SomeClass(4).reciprocal))
+
+    assert method() == 0.25
+
+
+def test_pickle_wrapper_and_baked_escaper():
+    wrapper = pickle.loads(pickle.dumps(escape(ZeroDivisionError, default=0.0)))
+    escaper = pickle.loads(pickle.dumps(escape.bake(ZeroDivisionError)))
+
+    assert isinstance(wrapper, Wrapper)
+    assert isinstance(escaper, BakedEscaper)
+
+    assert wrapper(raw_reciprocal)(0) == 0.0
+    assert escaper(raw_reciprocal)(0) is None
+    assert escaper.args == [ZeroDivisionError]
+
+    with escaper:
+        raise ZeroDivisionError
+
+
+def test_pickle_escaped_function_with_concurrency_state():
+    function = escape(ZeroDivisionError, default=0.0, max_concurrency=1, single_flight=True)(raw_reciprocal)
+    copy = pickle.loads(pickle.dumps(function))
+
+    assert copy(0) == 0.0
+    assert copy(4) == 0.25
+
+
+def test_escaped_functions_in_process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(reciprocal, [1, 0, 2])) == [1.0, 0.0, 0.5]
+        assert list(executor.map(escape(ZeroDivisionError, default=0.0)(raw_reciprocal), [0, 4])) == [0.0, 0.25]
@@ -0,0 +1,248 @@
+import asyncio
+import pickle
+from itertools import product
+from traceback import walk_tb
+
+import pytest
+
+import escape
+from escape.wrapper import Wrapper
+
+
+class RecordingLogger:
+    def __init__(self, records):
+        self.records = records
+
+    def debug(self, message, *args, **kwargs):
+        self.records.append(('debug', message))  # pragma: no cover
+
+    def info(self, message, *args, **kwargs):
+        self.records.append(('info', message))
+
+    def warning(self, message, *args, **kwargs):
+        self.records.append(('warning', message))  # pragma: no cover
+
+    def error(self, message, *args, **kwargs):
+        self.records.append(('error', message))
+
+    def exception(self, message, *args, **kwargs):
+        self.records.append(('exception', message))
+
+    def critical(self, message, *args, **kwargs):
+        self.records.append(('critical', message))  # pragma: no cover
+
+
+class RecordingStatistics:
+    def __init__(self, records, name):
+        self.records = records
+        self.name = name
+
+    def record_success(self):
+        self.records.append((self.name, 'success'))
+
+    def record_suppressed(self):
+        self.records.append((self.name, 'suppressed'))
+
+    def record_not_suppressed(self):
+        self.records.append((self.name, 'not_suppressed'))
+
+
+LAYERS = [
+    ('outer', ValueError, {'default': 'outer default'}),
+    ('middle', KeyError, {'default_factory': lambda exception: f'middle default for {type(exception).__name__}'}),
+    ('inner', ZeroDivisionError, {'success_logging': True, 'doc': 'inner doc'}),
+]
+
+FAILING_CALLBACKS = [
+    None,
+    ('inner', 'before', KeyError),
+    ('inner', 'before', TypeError),
+    ('middle', 'before', ValueError),
+    ('inner', 'success_callback', ValueError),
+    ('middle', 'success_callback', TypeError),
+    ('inner', 'error_callback', KeyError),
+    ('middle', 'error_callback', ZeroDivisionError),
+    ('outer', 'error_callback', TypeError),
+    ('middle', 'default_factory', ValueError),
+]
+
+RAISED_EXCEPTIONS = [None, ValueError, KeyError, ZeroDivisionError, TypeError]
+
+
+def make_stack(records, failing_callback, is_coroutine):
+    def make_callback(name, callback_name):
+        def callback(*args):
+            records.append((name, callback_name))
+            if failing_callback is not None and failing_callback[:2] == (name, callback_name):
+                raise failing_callback[2]('from callback')
+            if callback_name == 'default_factory':
+                return f'{name} default'
+            return None
+        return callback
+
+    decorators = []
+    for name, exception, kwargs in LAYERS:
+        kwargs = dict(kwargs)
+        if failing_callback is not None and failing_callback[:2] == (name, 'default_factory'):
+            kwargs.pop('default', None)
+            kwargs['default_factory'] = make_callback(name, 'default_factory')
+        decorators.append(escape(
+            exception,
+            logger=RecordingLogger(records),
+            statistics=RecordingStatistics(records, name),
+            before=make_callback(name, 'before'),
+            success_callback=make_callback(name, 'success_callback'),
+            error_callback=make_callback(name, 'error_callback'),
+            **kwargs,
+        ))
+
+    def body(exception):
+        records.append(('function', exception))
+        if exception is not None:
+            raise exception('from function')
+        return 'result'
+
+    if is_coroutine:
+        async def function(exception):
+            return body(exception)
+    else:
+        def function(exception):
+            return body(exception)
+
+    for decorator in reversed(decorators):
+        function = decorator(function)
+
+    return function
+
+
+def run(function, exception, is_coroutine):
+    try:
+        if is_coroutine:
+            return 'returned', asyncio.run(function(exception))
+        return 'returned', function(exception)
+    except BaseException as e:
+        return 'raised', type(e), str(e)
+
+
+@pytest.mark.parametrize(
+    ('failing_callback', 'raised_exception', 'is_coroutine'),
+    list(product(FAILING_CALLBACKS, RAISED_EXCEPTIONS, [False, True])),
+)
+def test_flattened_stack_behaves_like_nested_wrappers(failing_callback, raised_exception, is_coroutine, monkeypatch):
+    flattened_records = []
+    flattened_function = make_stack(flattened_records, failing_callback, is_coroutine)
+    flattened_result = run(flattened_function, raised_exception, is_coroutine)
+
+    monkeypatch.setattr(Wrapper, 'flatten', lambda self, function: None)
+    nested_records = []
+    nested_function = make_stack(nested_records, failing_callback, is_coroutine)
+    nested_result = run(nested_function, raised_exception, is_coroutine)
+
+    assert flattened_function.func in (Wrapper.run_flattened_function, Wrapper.run_flattened_coroutine_function)
+    assert nested_function.func in (Wrapper.run_function, Wrapper.run_coroutine_function)
+    assert flattened_result == nested_result
+    assert flattened_records == nested_records
+
+
+def test_stacked_decorators_are_flattened_into_one_layer():
+    @escape(ValueError, default=1)
+    @escape.bake(KeyError)
+    @escape(ZeroDivisionError, default=2)
+    def function(exception):
+        raise exception
+
+    assert function.func is Wrapper.run_flattened_function
+    assert [layer.exceptions for layer in function.args[3]] == [(ValueError,), (KeyError,), (ZeroDivisionError,)]
+    assert function.__name__ == 'function'
+    assert function(ValueError) == 1
+    assert function(KeyError) is None
+    assert function(ZeroDivisionError) == 2
+
+
+def test_flattened_function_has_one_frame_of_the_library_for_each_call():
+    @escape(ValueError)
+    @escape(KeyError)
+    @escape(IndexError)
+    def function():
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError) as exception_info:
+        function()
+
+    assert sum(frame.f_code.co_name == 'run_flattened_function' for frame, _ in walk_tb(exception_info.value.__traceback__)) <= 2
+    assert not any(frame.f_code.co_name == 'run_function' for frame, _ in walk_tb(exception_info.value.__traceback__))
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'max_concurrency': 1},
+        {'timeout': 1},
+        {'single_flight': True},
+    ],
+)
+def test_wrappers_with_own_state_are_not_flattened(kwargs):
+    def function():
+        return 1
+
+    assert escape(ValueError)(escape(KeyError, **kwargs)(function)).func is Wrapper.run_function
+    assert escape(ValueError, **kwargs)(escape(KeyError)(function)).func is not Wrapper.run_flattened_function
+
+
+def test_hedged_coroutine_functions_are_not_flattened():
+    async def function():
+        return 1
+
+    assert escape(ValueError)(escape(KeyError, hedge_after=1)(function)).func is Wrapper.run_coroutine_function
+
+
+def test_generator_functions_are_not_flattened():
+    def function():
+        yield 1
+
+    assert escape(ValueError)(escape(KeyError)(function)).func is Wrapper.run_generator_function
+
+
+def test_pickle_flattened_function():
+    function = pickle.loads(pickle.dumps(escape(ValueError, default=1)(escape(ZeroDivisionError, default=2)(reciprocal))))
+
+    assert function.func is Wrapper.run_flattened_function
+    assert function(0) == 2
+
+
+def test_flattened_method():
+    class SomeClass:
+        @escape(ValueError, default=1)
+        @escape(ZeroDivisionError, default=2)
+        def method(self, number):
+            return 1 / number
+
+    assert SomeClass().method(0) == 2
+    assert SomeClass().method(2) == 0.5
+
+
+def reciprocal(number):
+    return 1 / number
+
+
+def test_own_log_messages_in_flattened_stack():
+    records = []
+    logger = RecordingLogger(records)
+
+    @escape(ValueError, logger=logger, error_log_message='outer error', success_logging=True, success_log_message='outer success')
+    @escape(KeyError, logger=logger, error_log_message='inner error')
+    def function(exception):
+        if exception is not None:
+            raise exception
+
+    function(None)
+    function(KeyError)
+    function(ValueError)
+
+    assert records == [
+        ('info', 'outer success'),
+        ('exception', 'inner error'),
+        ('info', 'outer success'),
+        ('error', 'inner error'),
+        ('exception', 'outer error'),
+    ]
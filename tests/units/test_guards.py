@@ -0,0 +1,135 @@
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.guards import Guard
+
+
+def test_guard_returns_guard():
+    guard = escape.guard(ValueError)
+
+    assert isinstance(guard, Guard)
+
+    with guard as entered:
+        pass
+
+    assert entered is guard
+
+
+def test_guard_suppresses_exceptions_many_times():
+    logger = MemoryLogger()
+    guard = escape.guard(ValueError, logger=logger)
+    results = []
+
+    for number in [1, -1, 2, -2]:
+        with guard:
+            if number < 0:
+                raise ValueError('negative')
+            results.append(number)
+
+    assert results == [1, 2]
+    assert len(logger.data) == 2
+    assert [record.message for record in logger.data.exception] == ['The "ValueError" ("negative") exception was suppressed inside the context.'] * 2
+
+
+def test_guard_with_default_exceptions():
+    with escape.guard():
+        raise ValueError
+
+
+def test_guard_does_not_suppress_other_exceptions():
+    logger = MemoryLogger()
+    guard = escape.guard(ValueError, logger=logger, doc='some doc')
+
+    with pytest.raises(ZeroDivisionError), guard:
+        raise ZeroDivisionError
+
+    assert logger.data.error[0].message == 'The "ZeroDivisionError" exception was not suppressed inside the context (some doc).'
+
+
+def test_success_path_does_not_touch_wrapper(monkeypatch):
+    guard = escape.guard(ValueError)
+
+    def fail(*args):
+        raise AssertionError  # pragma: no cover
+
+    monkeypatch.setattr(guard.wrapper, '__exit__', fail)
+    monkeypatch.setattr(guard.wrapper, 'run_callback', fail)
+
+    for _ in range(3):
+        with guard:
+            pass
+
+
+def test_callbacks_and_success_logging():
+    logger = MemoryLogger()
+    calls = []
+
+    guard = escape.guard(
+        ValueError,
+        logger=logger,
+        before=lambda: calls.append('before'),
+        success_callback=lambda: calls.append('success'),
+        error_callback=lambda: calls.append('error'),
+        success_logging=True,
+        doc='some doc',
+    )
+
+    with guard:
+        pass
+    with guard:
+        raise ValueError
+
+    assert calls == ['before', 'success', 'before', 'error']
+    assert logger.data.info[0].message == 'The code block (some doc) was executed successfully.'
+
+
+def test_guard_with_statistics():
+    class Statistics:
+        def __init__(self):
+            self.outcomes = []
+
+        def record_success(self):
+            self.outcomes.append('success')
+
+        def record_suppressed(self):
+            self.outcomes.append('suppressed')
+
+        def record_not_suppressed(self):
+            self.outcomes.append('not_suppressed')  # pragma: no cover
+
+    statistics = Statistics()
+    guard = escape.guard(ValueError, statistics=statistics)
+
+    with guard:
+        pass
+    with guard:
+        raise ValueError
+
+    assert statistics.outcomes == ['success', 'suppressed']
+
+
+def test_each():
+    logger = MemoryLogger()
+    results = []
+    guards = set()
+
+    for item, guard in escape.each([1, 0, 2], ZeroDivisionError, logger=logger):
+        guards.add(guard)
+        with guard:
+            results.append(1 / item)
+
+    assert results == [1.0, 0.5]
+    assert len(guards) == 1
+    assert len(logger.data) == 1
+
+
+def test_each_checks_arguments_immediately():
+    with pytest.raises(ValueError, match=full_match('You are using the guard for the wrong purpose.')):
+        escape.each([], 'kek')
+
+
+def test_wrong_arguments():
+    with pytest.raises(ValueError, match=full_match('You are using the guard for the wrong purpose.')):
+        escape.guard(lambda: None)
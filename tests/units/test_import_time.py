@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def get_imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=Path(__file__).parent.parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return {line.split('|')[-1].strip() for line in result.stderr.splitlines() if line.startswith('import time:')}
+
+
+def test_heavy_modules_are_not_imported_with_escape():
+    imported_modules = get_imported_modules('import escape') - get_imported_modules('pass')
+
+    assert 'escape' in imported_modules
+    assert not imported_modules & {
+        'asyncio',
+        'concurrent.futures',
+        'multiprocessing',
+        'inspect',
+        'logging',
+        'traceback',
+        'emptylog',
+        'escape.batcher',
+        'escape.mapping',
+        'escape.vectorizer',
+        'escape.timeouts',
+        'escape.hedging',
+        'escape.single_flight',
+        'escape.concurrency_limiter',
+        'escape.slow_calls',
+        'escape.watchdogs',
+        'escape.log_summaries',
+        'escape.lazy_decorator',
+    }
+
+
+def test_heavy_modules_are_imported_on_first_use():
+    imported_modules = get_imported_modules('import escape; escape(ValueError, timeout=1)(lambda: None)')
+
+    assert 'escape.timeouts' in imported_modules
+    assert 'inspect' in imported_modules
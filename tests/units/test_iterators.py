@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.iterators import ResumingIterator, ResumingAsyncIterator
+
+
+class FlakyIterator:
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.items:
+            raise StopIteration
+        item = self.items.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+
+class FlakyAsyncIterator:
+    def __init__(self, items):
+        self.iterator = FlakyIterator(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration  # noqa: B904
+
+
+def test_iter_skips_suppressed_exceptions():
+    logger = MemoryLogger()
+    iterator = escape.iter(FlakyIterator([1, ValueError('message'), 2, ValueError(), 3]), ValueError, logger=logger)
+
+    assert isinstance(iterator, ResumingIterator)
+    assert list(iterator) == [1, 2, 3]
+    assert iterator.skipped == 2
+
+    assert len(logger.data) == 2
+    assert logger.data.exception[0].message == 'When getting the next item from the iterator "FlakyIterator", the exception "ValueError" ("message") was suppressed.'
+    assert logger.data.exception[1].message == 'When getting the next item from the iterator "FlakyIterator", the exception "ValueError" was suppressed.'
+
+
+def test_iter_with_not_suppressed_exception():
+    logger = MemoryLogger()
+    iterator = escape.iter(FlakyIterator([1, ZeroDivisionError(), 2]), ValueError, logger=logger, doc='some doc')
+
+    assert next(iterator) == 1
+    with pytest.raises(ZeroDivisionError):
+        next(iterator)
+    assert next(iterator) == 2
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When getting the next item from the iterator "FlakyIterator" (some doc), the exception "ZeroDivisionError" was not suppressed.'
+
+
+def test_iter_with_default_exceptions():
+    assert list(escape.iter(FlakyIterator([ValueError(), 1]))) == [1]
+
+    with pytest.raises(KeyboardInterrupt):
+        list(escape.iter(FlakyIterator([KeyboardInterrupt(), 1])))
+
+
+def test_iter_with_generator_stops_after_first_exception():
+    logger = MemoryLogger()
+
+    def generator():
+        yield 1
+        raise ValueError
+        yield 2
+
+    assert list(escape.iter(generator(), logger=logger)) == [1]
+    assert logger.data.exception[0].message == 'When getting the next item from the iterator "generator", the exception "ValueError" was suppressed.'
+
+
+def test_iter_with_max_skips():
+    logger = MemoryLogger()
+    iterator = escape.iter(FlakyIterator([1, ValueError(), 2, ValueError(), 3, ValueError(), 4]), max_skips=1, logger=logger)
+
+    assert list(iterator) == [1, 2]
+    assert iterator.skipped == 2
+
+    assert len(logger.data) == 3
+    assert logger.data.error[0].message == 'The iterator "FlakyIterator" was stopped after 2 suppressed exceptions.'
+
+
+def test_iter_stays_stopped_after_max_skips():
+    iterator = escape.iter(FlakyIterator([1, ValueError(), 2, 3]), max_skips=0)
+
+    assert list(iterator) == [1]
+    assert list(iterator) == []
+    assert list(iterator) == []
+
+
+def test_aiter_stays_stopped_after_max_skips():
+    iterator = escape.aiter(FlakyAsyncIterator([1, ValueError(), 2, 3]), ValueError, max_skips=0)
+
+    async def main():
+        return [item async for item in iterator]
+
+    assert asyncio.run(main()) == [1]
+    assert asyncio.run(main()) == []
+
+
+def test_iter_with_own_error_log_message():
+    logger = MemoryLogger()
+
+    assert list(escape.iter(FlakyIterator([ValueError()]), logger=logger, error_log_message='Oh my God!')) == []
+    assert logger.data.exception[0].message == 'Oh my God!'
+
+    with pytest.raises(ZeroDivisionError):
+        list(escape.iter(FlakyIterator([ZeroDivisionError()]), ValueError, logger=logger, error_log_message='Oh my God!'))
+    assert logger.data.error[0].message == 'Oh my God!'
+
+
+def test_aiter_skips_suppressed_exceptions():
+    logger = MemoryLogger()
+    iterator = escape.aiter(FlakyAsyncIterator([1, ValueError(), 2]), ValueError, logger=logger)
+
+    async def main():
+        return [item async for item in iterator]
+
+    assert isinstance(iterator, ResumingAsyncIterator)
+    assert asyncio.run(main()) == [1, 2]
+    assert iterator.skipped == 1
+    assert logger.data.exception[0].message == 'When getting the next item from the iterator "FlakyAsyncIterator", the exception "ValueError" was suppressed.'
+
+
+def test_aiter_with_max_skips_and_not_suppressed_exception():
+    async def main(items, max_skips):
+        return [item async for item in escape.aiter(FlakyAsyncIterator(items), ValueError, max_skips=max_skips)]
+
+    assert asyncio.run(main([1, ValueError(), 2], 0)) == [1]
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(main([1, ZeroDivisionError(), 2], None))
+
+
+@pytest.mark.parametrize(
+    'max_skips',
+    [
+        -1,
+        True,
+        1.5,
+    ],
+)
+def test_wrong_max_skips(max_skips):
+    with pytest.raises(ValueError, match=full_match('The maximum number of skipped items must be a non-negative integer.')):
+        escape.iter([], max_skips=max_skips)
+
+
+def test_wrong_exceptions_for_iter():
+    with pytest.raises(ValueError, match=full_match('You are using the iterator for the wrong purpose.')):
+        escape.iter([], 'kek')
+
+    with pytest.raises(ValueError, match=full_match('You are using the iterator for the wrong purpose.')):
+        escape.aiter(FlakyAsyncIterator([]), 'kek')
@@ -0,0 +1,145 @@
+import asyncio
+import pickle
+from inspect import iscoroutinefunction, isgeneratorfunction, signature
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.errors import SetDefaultReturnValueForGeneratorFunctionError
+from escape.lazy_decorator import LazyDecorator
+
+
+@escape.lazy(ZeroDivisionError, default=0.0)  # type: ignore[attr-defined]
+def reciprocal(number):
+    """Returns the reciprocal of a number."""
+    return 1 / number
+
+
+def raw_reciprocal(number):
+    return 1 / number
+
+
+def test_lazy_returns_lazy_decorator():
+    assert isinstance(escape.lazy(ValueError), LazyDecorator)
+
+
+def test_escaped_function_is_built_on_first_call(monkeypatch):
+    built = []
+    original_build = LazyDecorator.build
+
+    def build(self, function, cache):
+        built.append(function)
+        return original_build(self, function, cache)
+
+    monkeypatch.setattr(LazyDecorator, 'build', build)
+
+    @escape.lazy(ZeroDivisionError, default=0.0)
+    def function(number):
+        return 1 / number
+
+    assert built == []
+    assert function(0) == 0.0
+    assert function(2) == 0.5
+    assert len(built) == 1
+
+
+def test_lazy_function_looks_like_original():
+    assert reciprocal.__name__ == 'reciprocal'
+    assert reciprocal.__doc__ == 'Returns the reciprocal of a number.'
+    assert signature(reciprocal) == signature(reciprocal.__wrapped__)
+    assert not iscoroutinefunction(reciprocal)
+    assert not isgeneratorfunction(reciprocal)
+
+
+def test_lazy_function_without_parentheses():
+    @escape.lazy
+    def function():
+        raise ValueError
+
+    assert function() is None
+
+
+def test_lazy_function_called_directly_with_arguments():
+    logger = MemoryLogger()
+
+    def function():
+        raise ValueError
+
+    assert escape.lazy(function, default=1, logger=logger)() == 1
+    assert logger.data.exception[0].message == 'When executing function "function", the exception "ValueError" was suppressed.'
+
+
+def test_lazy_coroutine_function():
+    @escape.lazy(ZeroDivisionError, default=0.0)
+    async def function(number):
+        return 1 / number
+
+    assert iscoroutinefunction(function)
+    assert asyncio.run(function(0)) == 0.0
+    assert asyncio.run(function(4)) == 0.25
+
+
+def test_lazy_generator_function():
+    @escape.lazy(ZeroDivisionError)
+    def function(number):
+        yield 1
+        yield 1 / number
+
+    assert isgeneratorfunction(function)
+    assert list(function(0)) == [1]
+    assert list(function(2)) == [1, 0.5]
+
+
+def test_lazy_method():
+    class SomeClass:
+        def __init__(self, number):
+            self.number = number
+
+        @escape.lazy(ZeroDivisionError, default=0.0)
+        def reciprocal(self):
+            return 1 / self.number
+
+    assert SomeClass(0).reciprocal() == 0.0
+    assert SomeClass(2).reciprocal() == 0.5
+
+
+def test_wrong_arguments_are_reported_on_first_call():
+    function = escape.lazy('kek')(lambda: None)
+
+    with pytest.raises(ValueError, match=full_match('You are using the decorator for the wrong purpose.')):
+        function()
+
+
+def test_wrong_settings_for_generator_function_are_reported_on_first_call():
+    @escape.lazy(default=1)
+    def function():
+        yield  # pragma: no cover
+
+    with pytest.raises(SetDefaultReturnValueForGeneratorFunctionError):
+        list(function())
+
+
+def test_pickle_lazy_function():
+    assert pickle.loads(pickle.dumps(reciprocal)) is reciprocal
+
+    function = pickle.loads(pickle.dumps(escape.lazy(ZeroDivisionError, default=0.0)(raw_reciprocal)))
+
+    assert function(0) == 0.0
+
+
+def test_pickle_lazy_decorator():
+    decorator = pickle.loads(pickle.dumps(escape.lazy(ZeroDivisionError, default=0.0)))
+
+    assert decorator(raw_reciprocal)(0) == 0.0
+
+
+def test_function_is_built_once():
+    decorator = escape.lazy(ZeroDivisionError)
+    cache = []
+
+    escaped = decorator.build(raw_reciprocal, cache)
+
+    assert decorator.build(raw_reciprocal, cache) is escaped
+    assert cache == [escaped]
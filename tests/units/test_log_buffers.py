@@ -0,0 +1,183 @@
+import asyncio
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.log_buffers import LogBuffer, ScopedLogger, current_buffer
+
+
+def test_buffered_logs_returns_log_buffer():
+    logger = MemoryLogger()
+    buffer = escape.buffered_logs(logger)  # type: ignore[attr-defined]
+
+    assert isinstance(buffer, LogBuffer)
+    assert buffer.logger is logger
+
+
+def test_only_success_records_are_dropped():
+    logger = MemoryLogger()
+
+    @escape(success_logging=True, logger=logger)
+    def function():
+        return 1
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        for _ in range(10):
+            assert function() == 1
+
+    assert len(logger.data) == 0
+
+
+def test_records_are_emitted_as_one_record():
+    logger = MemoryLogger()
+
+    @escape(ValueError, success_logging=True, logger=logger)
+    def function(number):
+        if number < 0:
+            raise ValueError('oh!')
+        return number
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        assert function(1) == 1
+        assert function(-1) is None
+        assert len(logger.data) == 0
+
+    assert len(logger.data) == 1
+    message = logger.data.error[0].message
+    assert message.startswith('2 log records were buffered:\n[INFO] The function "function" completed successfully.\n[EXCEPTION] When executing function "function", the exception "ValueError" ("oh!") was suppressed.\nTraceback (most recent call last):\n')
+    assert message.endswith('\nValueError: oh!')
+
+
+def test_success_records_are_emitted_if_the_scope_failed():
+    logger = MemoryLogger()
+
+    with pytest.raises(KeyError), escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        with escape(success_logging=True, logger=logger):
+            pass
+        raise KeyError
+
+    assert len(logger.data) == 1
+    assert logger.data.info[0].message == '1 log records were buffered:\n[INFO] The code block was executed successfully.'
+
+
+def test_nothing_is_emitted_without_records():
+    logger = MemoryLogger()
+
+    with pytest.raises(KeyError), escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        raise KeyError
+
+    assert len(logger.data) == 0
+
+
+def test_level_of_the_record_is_the_highest_level():
+    logger = MemoryLogger()
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        escape(logger=logger).logger.info('first')
+        escape(logger=logger).logger.warning('second')
+        escape(logger=logger).logger.debug('third')
+
+    assert logger.data.warning[0].message == '3 log records were buffered:\n[INFO] first\n[WARNING] second\n[DEBUG] third'
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        escape(logger=logger).logger.critical('fourth')
+        escape(logger=logger).logger.error('fifth')
+
+    assert logger.data.critical[0].message == '2 log records were buffered:\n[CRITICAL] fourth\n[ERROR] fifth'
+
+
+def test_records_for_other_loggers_are_not_buffered():
+    logger = MemoryLogger()
+    other_logger = MemoryLogger()
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        with escape(..., logger=other_logger):
+            raise ValueError
+
+        assert len(other_logger.data) == 1
+
+    assert len(logger.data) == 0
+
+
+def test_nested_buffers():
+    logger = MemoryLogger()
+    other_logger = MemoryLogger()
+
+    with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+        with escape.buffered_logs(other_logger):  # type: ignore[attr-defined]
+            with escape(..., logger=logger):
+                raise ValueError
+            with escape(..., logger=other_logger):
+                raise ValueError
+            with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+                with escape(..., logger=logger):
+                    raise KeyError
+
+        assert len(other_logger.data) == 1
+        assert len(logger.data) == 0
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message.startswith('2 log records were buffered:\n[EXCEPTION] The "ValueError" exception was suppressed inside the context.\n')
+    assert '\n[ERROR] 1 log records were buffered:\n[EXCEPTION] The "KeyError" exception was suppressed inside the context.\n' in logger.data.error[0].message
+
+
+def test_buffers_of_concurrent_tasks_are_separate():
+    logger = MemoryLogger()
+
+    @escape(ValueError, logger=logger)
+    async def function(number):
+        await asyncio.sleep(0)
+        raise ValueError(number)
+
+    async def handle(number):
+        with escape.buffered_logs(logger):  # type: ignore[attr-defined]
+            for _ in range(3):
+                await function(number)
+
+    async def main():
+        await asyncio.gather(handle(1), handle(2))
+
+    asyncio.run(main())
+
+    assert len(logger.data) == 2
+    for record in logger.data.error:
+        assert record.message.startswith('3 log records were buffered:\n')
+        assert record.message.count('("1")') in (0, 3)
+
+
+def test_records_after_the_end_of_the_scope_are_not_buffered():
+    logger = MemoryLogger()
+
+    with escape.buffered_logs(logger) as buffer:  # type: ignore[attr-defined]
+        pass
+
+    token = current_buffer.set(buffer)
+    try:
+        escape(logger=logger).logger.error('message')
+    finally:
+        current_buffer.reset(token)
+
+    assert logger.data.error[0].message == 'message'
+
+
+def test_buffer_can_only_be_used_once():
+    buffer = escape.buffered_logs(MemoryLogger())  # type: ignore[attr-defined]
+
+    with buffer, pytest.raises(ValueError, match=full_match('The log buffer can only be used once.')), buffer:
+        pass  # pragma: no cover
+
+    with pytest.raises(ValueError, match=full_match('The log buffer can only be used once.')), buffer:
+        pass  # pragma: no cover
+
+
+def test_scoped_logger_passes_arguments():
+    logger = MemoryLogger()
+    scoped_logger = ScopedLogger(logger)
+
+    scoped_logger.info('message', 1, key='value')
+
+    assert logger.data.info[0].args == (1,)
+    assert logger.data.info[0].kwargs == {'key': 'value'}
+    assert repr(scoped_logger) == repr(logger)
@@ -0,0 +1,305 @@
+import asyncio
+import pickle
+from threading import Lock
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.log_summaries import LogSummarizer
+
+
+@pytest.fixture
+def timers(monkeypatch):
+    started = []
+
+    class Timer:
+        def __init__(self, interval, function):
+            self.interval = interval
+            self.function = function
+            self.daemon = False
+
+        def start(self):
+            started.append(self)
+
+    monkeypatch.setattr('escape.log_summaries.Timer', Timer)
+    return started
+
+
+@pytest.fixture
+def clock(monkeypatch, timers):
+    now = [100.0]
+    monkeypatch.setattr('escape.log_summaries.monotonic', lambda: now[0])
+    return now
+
+
+def test_exceptions_are_logged_separately_below_the_limit(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=3, logger=logger)
+    def function():
+        raise ValueError
+
+    for _ in range(3):
+        function()
+
+    assert len(logger.data) == 3
+    assert len(logger.data.exception) == 3
+
+
+def test_switch_to_summaries_and_back(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, KeyError, max_logs_per_second=2, logger=logger, doc='database')
+    def function(exception):
+        raise exception
+
+    for exception in [ValueError, ValueError, KeyError, ValueError, KeyError]:
+        function(exception)
+
+    assert len(logger.data) == 2
+    assert len(logger.data.exception) == 2
+
+    clock[0] += 1
+    for exception in [ValueError, ValueError]:
+        function(exception)
+
+    assert len(logger.data) == 3
+    assert logger.data.error[0].message == 'Exceptions were suppressed too often (database) (5 per second, 1.000 seconds ago), 3 of them were not logged separately: "KeyError" (2), "ValueError" (1).'
+
+    clock[0] += 1.5
+    function(KeyError)
+    function(KeyError)
+
+    assert len(logger.data) == 6
+    assert logger.data.error[1].message == 'Exceptions were suppressed too often (database) (2 per second, 1.500 seconds ago), 2 of them were not logged separately: "ValueError" (2).'
+    assert len(logger.data.exception) == 4
+
+    clock[0] += 1
+    function(ValueError)
+
+    assert len(logger.data) == 7
+    assert len(logger.data.error) == 2
+
+
+def test_statistics_and_defaults_are_not_affected(clock):
+    class Statistics:
+        suppressed = 0
+
+        def record_success(self):
+            pass  # pragma: no cover
+
+        def record_suppressed(self):
+            self.suppressed += 1
+
+        def record_not_suppressed(self):
+            pass  # pragma: no cover
+
+    statistics = Statistics()
+
+    @escape(ValueError, default=1, max_logs_per_second=1, statistics=statistics)
+    def function():
+        raise ValueError
+
+    assert [function() for _ in range(5)] == [1] * 5
+    assert statistics.suppressed == 5
+
+
+def test_not_suppressed_exceptions_are_always_logged(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=1, logger=logger)
+    def function():
+        raise KeyError
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            function()
+
+    assert len(logger.data.error) == 3
+
+
+def test_own_error_log_message(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=1, logger=logger, error_log_message='oh!')
+    def function():
+        raise ValueError
+
+    function()
+    function()
+
+    assert [record.message for record in logger.data.exception] == ['oh!']
+
+
+def test_coroutine_function(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=1, logger=logger)
+    async def function():
+        raise ValueError
+
+    asyncio.run(function())
+    asyncio.run(function())
+
+    assert len(logger.data) == 1
+
+
+def test_generator_function(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=1, logger=logger)
+    def function():
+        yield 1
+        raise ValueError
+
+    assert list(function()) == [1]
+    assert list(function()) == [1]
+
+    assert len(logger.data) == 1
+
+
+def test_flattened_stack(clock):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=1, logger=logger, doc='outer')
+    @escape(KeyError, max_logs_per_second=1, logger=logger, doc='inner')
+    def function(exception):
+        raise exception
+
+    for exception in [ValueError, KeyError, ValueError, KeyError]:
+        function(exception)
+
+    clock[0] += 1
+    function(ValueError)
+    clock[0] += 1
+    function(KeyError)
+
+    assert [record.message for record in logger.data.exception] == [
+        'When executing function "function" (outer), the exception "ValueError" was suppressed.',
+        'When executing function "function" (inner), the exception "KeyError" was suppressed.',
+    ]
+    assert [record.message for record in logger.data.error if record.message.startswith('Exceptions')] == [
+        'Exceptions were suppressed too often (outer) (2 per second, 1.000 seconds ago), 1 of them were not logged separately: "ValueError" (1).',
+        'Exceptions were suppressed too often (inner) (2 per second, 2.000 seconds ago), 1 of them were not logged separately: "KeyError" (1).',
+    ]
+
+
+def test_context_manager(clock):
+    logger = MemoryLogger()
+    guard = escape.guard(ValueError, max_logs_per_second=1, logger=logger)  # type: ignore[attr-defined]
+
+    for _ in range(3):
+        with escape(ValueError, max_logs_per_second=1, logger=logger), guard:
+            raise ValueError
+
+    assert len(logger.data) == 1
+
+
+def test_summarizer_belongs_to_the_policy():
+    assert escape(max_logs_per_second=1).log_summarizer.max_logs_per_second == 1
+    assert escape().log_summarizer is None
+
+
+@pytest.mark.parametrize(
+    'max_logs_per_second',
+    [
+        0,
+        -1,
+        1.5,
+        True,
+        'kek',
+    ],
+)
+def test_wrong_max_logs_per_second(max_logs_per_second):
+    with pytest.raises(ValueError, match=full_match('The maximum number of logged exceptions per second must be a positive integer.')):
+        escape(max_logs_per_second=max_logs_per_second)
+
+
+def test_summarizer_without_wrapper(clock):
+    logger = MemoryLogger()
+    summarizer = LogSummarizer(1, logger, '')
+
+    assert summarizer.should_log(ValueError)
+    assert not summarizer.should_log(ValueError)
+    clock[0] += 1
+    assert not summarizer.should_log(ValueError)
+    clock[0] += 1
+    assert summarizer.should_log(ValueError)
+    assert [record.message for record in logger.data.error] == [
+        'Exceptions were suppressed too often (2 per second, 1.000 seconds ago), 1 of them were not logged separately: "ValueError" (1).',
+        'Exceptions were suppressed too often (1 per second, 1.000 seconds ago), 1 of them were not logged separately: "ValueError" (1).',
+    ]
+
+
+def test_summary_is_flushed_without_a_later_exception(clock, timers):
+    logger = MemoryLogger()
+
+    @escape(ValueError, max_logs_per_second=2, logger=logger)
+    def function():
+        raise ValueError
+
+    clock[0] += 0.25
+    for _ in range(5):
+        function()
+
+    assert len(timers) == 1
+    assert timers[0].interval == 0.75
+    assert timers[0].daemon
+
+    clock[0] += 0.75
+    timers.pop().function()
+
+    assert logger.data.error[0].message == 'Exceptions were suppressed too often (5 per second, 1.000 seconds ago), 3 of them were not logged separately: "ValueError" (3).'
+
+    clock[0] += 5
+    function()
+    clock[0] += 1
+    function()
+
+    assert len(logger.data.error) == 1
+    assert len(logger.data.exception) == 4
+    assert not timers
+
+
+def test_early_flush_is_rescheduled(clock, timers):
+    logger = MemoryLogger()
+    summarizer = LogSummarizer(1, logger, '')
+
+    summarizer.should_log(ValueError)
+    summarizer.should_log(ValueError)
+    clock[0] += 0.5
+    timers.pop().function()
+
+    assert len(logger.data) == 0
+    assert timers[0].interval == 0.5
+
+    clock[0] += 0.5
+    timers.pop().function()
+    summarizer.flush()
+
+    assert len(logger.data.error) == 1
+    assert not timers
+
+
+def test_summarizer_can_be_pickled(clock):
+    summarizer = LogSummarizer(1, MemoryLogger(), ' (doc)')
+    summarizer.should_log(ValueError)
+    summarizer.should_log(KeyError)
+
+    copy = pickle.loads(pickle.dumps(summarizer))
+
+    assert isinstance(copy.lock, type(Lock()))
+    assert copy.lock is not summarizer.lock
+    assert copy.counter == summarizer.counter
+    assert copy.number_in_window == 2
+    assert copy.summarizing
+    assert not copy.should_log(ValueError)
+    assert 'lock' in summarizer.__dict__
+
+
+def test_policy_with_summarizer_can_be_pickled():
+    policy = pickle.loads(pickle.dumps(escape(ValueError, max_logs_per_second=1)))
+
+    assert policy.log_summarizer.max_logs_per_second == 1
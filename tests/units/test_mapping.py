@@ -0,0 +1,279 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import Event
+from inspect import isgenerator
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.mapping import Failure, Mapper
+
+
+def reciprocal(number):
+    if number == 13:
+        raise ZeroDivisionError('unlucky')
+    return 1 / number
+
+
+@pytest.mark.parametrize(
+    'executor',
+    [
+        'thread',
+        'process',
+    ],
+)
+def test_map_returns_results_in_order(executor):
+    assert escape.map(reciprocal, [1, 2, 4], executor=executor, workers=2) == [1, 0.5, 0.25]
+
+
+@pytest.mark.parametrize(
+    'executor',
+    [
+        'thread',
+        'process',
+    ],
+)
+def test_map_with_suppressed_exceptions_and_default(executor):
+    logger = MemoryLogger()
+
+    assert escape.map(reciprocal, [1, 0, 2, 0, 13], ZeroDivisionError, default='default', executor=executor, logger=logger) == [1, 'default', 0.5, 'default', 'default']
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing function "reciprocal" for 5 items, 3 exceptions were suppressed: "ZeroDivisionError" (3).'
+
+
+def test_map_with_default_factory():
+    assert escape.map(reciprocal, [0, 13], default_factory=lambda exception: str(exception)) == ['division by zero', 'unlucky']
+
+
+def test_map_with_captured_exceptions():
+    results = escape.map(reciprocal, [1, 0], capture_exceptions=True)
+
+    assert results[0] == 1
+    assert isinstance(results[1], Failure)
+    assert isinstance(results[1].exception, ZeroDivisionError)
+    assert repr(results[1]) == "Failure(ZeroDivisionError('division by zero'))"
+    assert results[1] == Failure(results[1].exception)
+    assert results[1] != Failure(ZeroDivisionError('division by zero'))
+    assert results[1] != results[1].exception
+    assert hash(results[1]) == hash(Failure(results[1].exception))
+
+
+def test_map_with_not_suppressed_exception():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError):
+        escape.map(reciprocal, [1, 'kek', 0], TypeError, logger=logger, doc='some doc')
+
+    assert len(logger.data) == 2
+    assert logger.data.error[0].message == 'When executing function "reciprocal" (some doc), the exception "ZeroDivisionError" ("division by zero") was not suppressed.'
+    assert logger.data.error[1].message == 'When executing function "reciprocal" (some doc) for 3 items, 1 exceptions were suppressed: "TypeError" (1).'
+
+
+def test_map_with_own_error_log_message():
+    logger = MemoryLogger()
+
+    escape.map(reciprocal, [0, 0], logger=logger, error_log_message='Oh my God!')
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'Oh my God!'
+
+
+def test_map_with_existing_executor():
+    with ThreadPoolExecutor() as executor:
+        assert escape.map(reciprocal, [1, 0], executor=executor, default=0) == [1, 0]
+        assert escape.map(reciprocal, [2], executor=executor) == [0.5]
+
+
+def test_map_with_empty_iterable():
+    assert escape.map(reciprocal, []) == []
+
+
+def test_wrong_arguments_for_map():
+    with pytest.raises(ValueError, match=full_match('You are using the map function for the wrong purpose.')):
+        escape.map(reciprocal, [], 'kek')
+
+    with pytest.raises(ValueError, match=full_match('The executor must be "thread", "process" or an instance of concurrent.futures.Executor.')):
+        escape.map(reciprocal, [], executor='kek')
+
+    with pytest.raises(ValueError, match=full_match('You are using the map function for the wrong purpose.')):
+        escape.imap(reciprocal, [], 'kek')
+
+    with pytest.raises(ValueError, match=full_match('You are using the map function for the wrong purpose.')):
+        escape.aimap(async_reciprocal, [], 'kek')
+
+
+@pytest.mark.parametrize(
+    'workers',
+    [
+        0,
+        -1,
+        1.5,
+        True,
+    ],
+)
+def test_wrong_number_of_workers_for_map(workers):
+    with pytest.raises(ValueError, match=full_match('The number of workers must be a positive integer.')):
+        escape.map(reciprocal, [], workers=workers)
+
+
+@pytest.mark.parametrize(
+    'executor',
+    [
+        'thread',
+        'process',
+    ],
+)
+def test_imap_is_lazy_and_ordered(executor):
+    logger = MemoryLogger()
+    results = escape.imap(reciprocal, [1, 0, 2, 4], ZeroDivisionError, executor=executor, workers=2, default=0, logger=logger)
+
+    assert isgenerator(results)
+    assert list(results) == [1, 0, 0.5, 0.25]
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing function "reciprocal" for 4 items, 1 exceptions were suppressed: "ZeroDivisionError" (1).'
+
+
+def test_imap_with_infinite_iterable_keeps_bounded_window():
+    submitted = []
+
+    def items():
+        for number in count(1):
+            submitted.append(number)
+            yield number
+
+    results = escape.imap(reciprocal, items(), prefetch=3, workers=1)
+
+    assert next(results) == 1
+    assert next(results) == 0.5
+    assert len(submitted) <= 5
+
+    results.close()
+
+
+def test_imap_unordered():
+    release = Event()
+
+    def function(number):
+        if number == 1:
+            release.wait()
+        return number
+
+    results = escape.imap(function, [1, 2], workers=2, ordered=False)
+
+    assert next(results) == 2
+    release.set()
+    assert list(results) == [1]
+
+
+def test_imap_with_existing_executor_and_captured_exceptions():
+    with ThreadPoolExecutor() as executor:
+        results = list(escape.imap(reciprocal, [0, 1], executor=executor, capture_exceptions=True, ordered=False))
+
+    assert len(results) == 2
+    assert 1 in results
+    assert [type(result.exception) for result in results if isinstance(result, Failure)] == [ZeroDivisionError]
+
+
+def test_imap_with_not_suppressed_exception():
+    results = escape.imap(reciprocal, [1, 0, 2], ValueError)
+
+    assert next(results) == 1
+    with pytest.raises(ZeroDivisionError):
+        next(results)
+
+
+@pytest.mark.parametrize(
+    'prefetch',
+    [
+        0,
+        -1,
+        True,
+    ],
+)
+def test_wrong_prefetch_for_imap(prefetch):
+    with pytest.raises(ValueError, match=full_match('The number of prefetched items must be a positive integer.')):
+        escape.imap(reciprocal, [], prefetch=prefetch)
+
+
+async def async_reciprocal(number):
+    await asyncio.sleep(0)
+    return reciprocal(number)
+
+
+def test_aimap_ordered():
+    logger = MemoryLogger()
+
+    async def main():
+        return [result async for result in escape.aimap(async_reciprocal, [1, 0, 2], ZeroDivisionError, default=0, prefetch=2, logger=logger)]
+
+    assert asyncio.run(main()) == [1, 0, 0.5]
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing function "async_reciprocal" for 3 items, 1 exceptions were suppressed: "ZeroDivisionError" (1).'
+
+
+def test_aimap_unordered_with_async_iterable():
+    async def function(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    async def items():
+        yield 0.05
+        yield 0
+
+    async def main():
+        return [result async for result in escape.aimap(function, items(), ordered=False)]
+
+    assert asyncio.run(main()) == [0, 0.05]
+
+
+def test_aimap_with_infinite_iterable_keeps_bounded_window():
+    submitted = []
+
+    async def items():
+        for number in count(1):
+            submitted.append(number)
+            yield number
+
+    async def main():
+        results = escape.aimap(async_reciprocal, items(), prefetch=3)
+        first = await results.__anext__()
+        await results.aclose()
+        return first
+
+    assert asyncio.run(main()) == 1
+    assert len(submitted) <= 4
+
+
+def test_aimap_with_not_suppressed_exception():
+    async def main():
+        return [result async for result in escape.aimap(async_reciprocal, [1, 0], ValueError)]
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(main())
+
+
+def test_aimap_with_not_coroutine_function():
+    with pytest.raises(ValueError, match=full_match('The mapped function must be a coroutine function.')):
+        escape.aimap(reciprocal, [])
+
+
+def test_aimap_with_unbounded_prefetch():
+    mapper = Mapper(async_reciprocal, escape(ZeroDivisionError, default=0), 'thread', None, False)
+
+    async def main():
+        return [result async for result in mapper.aimap([1, 0, 2])]
+
+    assert asyncio.run(main()) == [1, 0, 0.5]
+
+
+def test_imap_with_own_error_log_message_for_not_suppressed_exception():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError):
+        list(escape.imap(reciprocal, [0], ValueError, logger=logger, error_log_message='Oh my God!'))
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'Oh my God!'
@@ -0,0 +1,62 @@
+from collections import Counter
+from functools import partial
+
+import pytest
+from emptylog import MemoryLogger
+
+import escape
+from escape.message_templates import MessageTemplates, describe_counts
+
+
+def function():
+    pass  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    ('kind', 'wrapped_doc', 'failure_prefix', 'success'),
+    [
+        ('function', '', 'When executing function "function", the exception "', 'The function "function" completed successfully.'),
+        ('coroutine function', ' (doc)', 'When executing coroutine function "function" (doc), the exception "', 'The coroutine function "function" (doc) completed successfully.'),
+        ('generator function', ' ({doc})', 'When executing generator function "function" ({doc}), the exception "', 'The generator function "function" ({doc}) completed successfully.'),
+    ],
+)
+def test_templates_for_function(kind, wrapped_doc, failure_prefix, success):
+    templates = MessageTemplates.for_function(kind, function, wrapped_doc)
+
+    assert templates.failure_prefix == failure_prefix
+    assert templates.success == success
+
+
+def test_templates_for_callable_without_name():
+    callable_object = partial(function)
+
+    assert MessageTemplates.for_function('function', callable_object, '').success == f'The function "{callable_object!r}" completed successfully.'
+
+
+def test_templates_are_built_when_function_is_decorated():
+    def function(number):
+        return 1 / number
+
+    escaped = escape(ZeroDivisionError, doc='division')(function)
+
+    assert escaped.args[-1] == MessageTemplates.for_function('function', function, ' (division)')
+
+
+def test_suppressed_exception_in_callable_without_name():
+    logger = MemoryLogger()
+    callable_object = partial(int, 'kek')
+
+    assert escape(ValueError, logger=logger)(callable_object)() is None
+    assert logger.data.exception[0].message == f'When executing function "{callable_object!r}", the exception "ValueError" ("invalid literal for int() with base 10: \'kek\'") was suppressed.'
+
+
+@pytest.mark.parametrize(
+    ('counter', 'description'),
+    [
+        (Counter(), ''),
+        (Counter({'ValueError': 1}), '"ValueError" (1)'),
+        (Counter({'KeyError': 1, 'ValueError': 3}), '"ValueError" (3), "KeyError" (1)'),
+    ],
+)
+def test_describe_counts(counter, description):
+    assert describe_counts(counter) == description
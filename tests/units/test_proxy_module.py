@@ -1,13 +1,17 @@
 import asyncio
 from inspect import isgeneratorfunction, isgenerator, iscoroutinefunction, iscoroutine
 from functools import partial
+from threading import Thread, Event, Semaphore, Lock
+from contextvars import ContextVar
+from time import sleep
+from traceback import walk_tb
 
 import pytest
 import full_match
 from emptylog import MemoryLogger
 
 from escape import escape  # type: ignore[attr-defined]
-from escape.errors import SetDefaultReturnValueForContextManagerError, SetDefaultReturnValueForGeneratorFunctionError
+from escape.errors import SetDefaultReturnValueForContextManagerError, SetDefaultReturnValueForGeneratorFunctionError, ConcurrencyLimitExceededError, CallTimeoutError
 
 
 @pytest.mark.parametrize(
@@ -5550,3 +5554,935 @@ def test_logging_with_docs_for_basic_logic_of_context_manager_and_success_when_s
 
     assert len(logger.data) == 1
     assert logger.data.info[0].message == 'The code block (some doc) was executed successfully.'
+
+
+def test_default_factory_is_called_only_on_failure():
+    calls = []
+
+    def factory():
+        calls.append(True)
+        return {}
+
+    @escape(ValueError, default_factory=factory)
+    def function(flag):
+        if flag:
+            raise ValueError
+        return 'kek'
+
+    assert function(False) == 'kek'
+    assert calls == []
+
+    first_default = function(True)
+    second_default = function(True)
+
+    assert first_default == {}
+    assert second_default == {}
+    assert first_default is not second_default
+    assert len(calls) == 2
+
+
+def test_default_factory_for_coroutine_function():
+    @escape(ValueError, default_factory=list)
+    async def function():
+        raise ValueError
+
+    first_default = asyncio.run(function())
+    second_default = asyncio.run(function())
+
+    assert first_default == []
+    assert first_default is not second_default
+
+
+@pytest.mark.parametrize(
+    'factory',
+    [
+        lambda exception: type(exception).__name__,
+        lambda exception, prefix='': prefix + type(exception).__name__,
+    ],
+)
+def test_default_factory_receives_exception(factory):
+    @escape(ValueError, ZeroDivisionError, default_factory=factory)
+    def function():
+        raise ZeroDivisionError
+
+    @escape(ValueError, ZeroDivisionError, default_factory=factory)
+    async def async_function():
+        raise ValueError
+
+    assert function() == 'ZeroDivisionError'
+    assert asyncio.run(async_function()) == 'ValueError'
+
+
+def test_default_factory_is_not_called_when_exception_is_not_suppressed():
+    calls = []
+
+    @escape(ValueError, default_factory=lambda: calls.append(True))
+    def function():
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError):
+        function()
+
+    assert calls == []
+
+
+def test_default_factory_with_baked_escaper():
+    escaper = escape.bake(ValueError, default_factory=dict)
+
+    @escaper
+    def function():
+        raise ValueError
+
+    assert function() == {}
+
+
+def test_set_default_and_default_factory_at_the_same_time():
+    with pytest.raises(ValueError, match=full_match('You cannot set both a default value and a default factory.')):
+        escape(ValueError, default=1, default_factory=dict)
+
+
+def test_set_default_factory_for_generator_function():
+    with pytest.raises(SetDefaultReturnValueForGeneratorFunctionError, match=full_match('You cannot set the default return value for the generator function. This is only possible for normal and coroutine functions.')):
+        @escape(..., default_factory=dict)
+        def function():
+            yield
+
+
+def test_set_default_factory_for_context_manager():
+    with pytest.raises(SetDefaultReturnValueForContextManagerError, match=full_match('You cannot set a default value for the context manager. This is only possible for the decorator.')):
+        with escape(default_factory=dict):
+            ...
+
+
+def test_defaults_by_exception_type_for_usual_function():
+    @escape({ValueError: 1, KeyError: 2, LookupError: 3})
+    def function(exception):
+        raise exception
+
+    assert function(ValueError) == 1
+    assert function(KeyError) == 2
+    assert function(IndexError) == 3
+
+    with pytest.raises(ZeroDivisionError):
+        function(ZeroDivisionError)
+
+
+def test_defaults_by_exception_type_for_coroutine_function():
+    @escape({ValueError: 1, ...: 2})
+    async def function(exception):
+        raise exception
+
+    assert asyncio.run(function(ValueError)) == 1
+    assert asyncio.run(function(ZeroDivisionError)) == 2
+
+    with pytest.raises(GeneratorExit):
+        asyncio.run(function(GeneratorExit))
+
+
+def test_defaults_by_exception_type_with_ellipsis_and_explicit_exception():
+    @escape({Exception: 'explicit', ...: 'ellipsis'})
+    def function():
+        raise ValueError
+
+    assert function() == 'explicit'
+
+
+def test_defaults_by_exception_type_resolution_is_cached():
+    class SomeError(ValueError):
+        pass
+
+    wrapper = escape({ValueError: 1})
+
+    @wrapper
+    def function():
+        raise SomeError
+
+    assert function() == 1
+    assert wrapper.resolved_defaults_cache == {SomeError: 1}
+
+
+def test_defaults_by_exception_type_and_logging():
+    logger = MemoryLogger()
+
+    @escape({ValueError: 1}, logger=logger)
+    def function():
+        raise ValueError('message')
+
+    assert function() == 1
+    assert len(logger.data) == 1
+    assert logger.data.exception[0].message == 'When executing function "function", the exception "ValueError" ("message") was suppressed.'
+
+
+@pytest.mark.parametrize(
+    'defaults',
+    [
+        {ValueError: None},
+        {...: None},
+    ],
+)
+def test_defaults_by_exception_type_with_none_values_for_generator_function_and_context_manager(defaults):
+    @escape(defaults)
+    def function():
+        yield 1
+        raise ValueError
+
+    with escape(defaults):
+        raise ValueError
+
+    assert list(function()) == [1]
+
+
+def test_defaults_by_exception_type_with_not_none_values_for_generator_function_and_context_manager():
+    with pytest.raises(SetDefaultReturnValueForGeneratorFunctionError, match=full_match('You cannot set the default return value for the generator function. This is only possible for normal and coroutine functions.')):
+        @escape({ValueError: 1})
+        def function():
+            yield
+
+    with pytest.raises(SetDefaultReturnValueForContextManagerError, match=full_match('You cannot set a default value for the context manager. This is only possible for the decorator.')):
+        with escape({ValueError: 1}):
+            ...
+
+
+@pytest.mark.parametrize(
+    'arguments',
+    [
+        ({'kek': 1},),
+        ({ValueError: 1}, ValueError),
+        ({ValueError: 1}, {KeyError: 2}),
+    ],
+)
+def test_wrong_defaults_by_exception_type(arguments):
+    with pytest.raises(ValueError, match=full_match('You are using the decorator for the wrong purpose.')):
+        escape(*arguments)
+
+
+@pytest.mark.parametrize(
+    'extra_arguments',
+    [
+        {'default': 1},
+        {'default_factory': dict},
+    ],
+)
+def test_defaults_by_exception_type_and_default_at_the_same_time(extra_arguments):
+    with pytest.raises(ValueError, match=full_match('You cannot set a default value when the defaults are passed as a dictionary.')):
+        escape({ValueError: 1}, **extra_arguments)
+
+
+def test_max_concurrency_for_usual_function():
+    logger = MemoryLogger()
+    started = Event()
+    release = Event()
+    results = []
+
+    @escape(ValueError, default='shed', max_concurrency=1, logger=logger)
+    def function():
+        started.set()
+        release.wait()
+        return 'kek'
+
+    thread = Thread(target=lambda: results.append(function()))
+    thread.start()
+    started.wait()
+
+    assert function() == 'shed'
+
+    release.set()
+    thread.join()
+
+    assert results == ['kek']
+    assert function() == 'kek'
+
+    assert len(logger.data) == 1
+    assert logger.data.exception[0].message == 'When executing function "function", the exception "ConcurrencyLimitExceededError" ("The maximum number of concurrent calls (1) has been reached.") was suppressed.'
+
+
+def test_max_concurrency_for_usual_function_with_waiting_timeout():
+    started = Event()
+    release = Event()
+    results = []
+
+    @escape(default='shed', max_concurrency=1, max_concurrency_timeout=0.01)
+    def function():
+        started.set()
+        release.wait()
+        return 'kek'
+
+    thread = Thread(target=lambda: results.append(function()))
+    thread.start()
+    started.wait()
+
+    assert function() == 'shed'
+
+    release.set()
+    thread.join()
+
+    assert results == ['kek']
+
+
+def test_max_concurrency_for_usual_function_releases_slot_after_exception():
+    @escape(ValueError, default='kek', max_concurrency=1)
+    def function():
+        raise ValueError
+
+    assert function() == 'kek'
+    assert function() == 'kek'
+
+    @escape(ValueError, max_concurrency=1)
+    def another_function(exception):
+        raise exception
+
+    with pytest.raises(ZeroDivisionError):
+        another_function(ZeroDivisionError)
+
+    assert another_function(ValueError) is None
+
+
+def test_max_concurrency_for_coroutine_function():
+    logger = MemoryLogger()
+
+    @escape(default='shed', max_concurrency=2, logger=logger)
+    async def function():
+        await asyncio.sleep(0.01)
+        return 'kek'
+
+    async def main():
+        return await asyncio.gather(*(function() for _ in range(3)))
+
+    assert asyncio.run(main()) == ['kek', 'kek', 'shed']
+    assert asyncio.run(main()) == ['kek', 'kek', 'shed']
+
+    assert len(logger.data) == 2
+    assert logger.data.exception[0].message == 'When executing coroutine function "function", the exception "ConcurrencyLimitExceededError" ("The maximum number of concurrent calls (2) has been reached.") was suppressed.'
+
+
+def test_max_concurrency_for_coroutine_function_with_waiting_timeout():
+    @escape(default='shed', max_concurrency=1, max_concurrency_timeout=1)
+    async def function():
+        await asyncio.sleep(0.001)
+        return 'kek'
+
+    @escape(default='shed', max_concurrency=1, max_concurrency_timeout=0.001)
+    async def slow_function():
+        await asyncio.sleep(0.1)
+        return 'kek'
+
+    async def main(function):
+        return await asyncio.gather(*(function() for _ in range(3)))
+
+    assert asyncio.run(main(function)) == ['kek', 'kek', 'kek']
+    assert asyncio.run(main(slow_function)) == ['kek', 'shed', 'shed']
+
+
+@pytest.mark.parametrize(
+    'arguments',
+    [
+        {'max_concurrency': 0},
+        {'max_concurrency': -1},
+        {'max_concurrency': 1.5},
+        {'max_concurrency': True},
+    ],
+)
+def test_wrong_max_concurrency(arguments):
+    with pytest.raises(ValueError, match=full_match('The maximum number of concurrent calls must be a positive integer.')):
+        escape(**arguments)
+
+
+def test_max_concurrency_timeout_without_max_concurrency():
+    with pytest.raises(ValueError, match=full_match('You cannot set a timeout for waiting for a free slot without setting the maximum number of concurrent calls.')):
+        escape(max_concurrency_timeout=1)
+
+
+def test_max_concurrency_for_generator_function_and_context_manager():
+    with pytest.raises(ValueError, match=full_match('You cannot limit the concurrency for the generator function. This is only possible for normal and coroutine functions.')):
+        @escape(max_concurrency=1)
+        def function():
+            yield
+
+    with pytest.raises(ValueError, match=full_match('You cannot limit the concurrency for the context manager. This is only possible for the decorator.')):
+        with escape(max_concurrency=1):
+            ...
+
+
+def test_timeout_for_usual_function():
+    logger = MemoryLogger()
+    release = Event()
+
+    @escape(ValueError, default='expired', timeout=0.01, logger=logger)
+    def function(a, b=1):
+        release.wait()
+        return a + b
+
+    assert function(1, b=2) == 'expired'
+    release.set()
+    assert function(1, b=2) == 3
+
+    assert len(logger.data) == 1
+    assert logger.data.exception[0].message == 'When executing function "function", the exception "CallTimeoutError" ("The call did not complete within 0.01 seconds.") was suppressed.'
+
+
+def test_hung_function_with_timeout_does_not_starve_other_functions():
+    release = Event()
+
+    @escape(timeout=0.001)
+    def hung_function():
+        release.wait()
+
+    @escape(default='fallback', timeout=1)
+    def fast_function():
+        return 'real'
+
+    try:
+        for _ in range(64):
+            hung_function()
+
+        assert fast_function() == 'real'
+    finally:
+        release.set()
+
+
+def test_timeout_and_max_concurrency_limit_real_calls_of_usual_function():
+    lock = Lock()
+    active = []
+    peak = []
+    release = Event()
+
+    @escape(default='fallback', max_concurrency=2, timeout=0.001)
+    def function():
+        with lock:
+            active.append(None)
+            peak.append(len(active))
+        release.wait(0.05)
+        with lock:
+            active.pop()
+
+    threads = [Thread(target=lambda: [function() for _ in range(5)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    release.set()
+
+    assert 1 <= max(peak) <= 2
+
+
+def test_timeout_and_max_concurrency_release_slot_when_submission_fails():
+    @escape(ValueError, max_concurrency=1, timeout=1)
+    def function():
+        return 'kek'
+
+    _, _, call, _, _ = function.args
+    executor, limiter = call.args[:2]
+
+    executor.shutdown()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            function()
+
+    assert limiter.semaphore.acquire(blocking=False)
+
+
+def test_timeout_for_usual_function_keeps_context_variables():
+    variable = ContextVar('variable')
+    variable.set('kek')
+
+    @escape(timeout=1)
+    def function():
+        return variable.get()
+
+    assert function() == 'kek'
+
+
+def test_timeout_for_usual_function_and_exceptions():
+    @escape(ValueError, default='kek', timeout=1)
+    def function(exception):
+        raise exception
+
+    assert function(ValueError) == 'kek'
+
+    with pytest.raises(TimeoutError):
+        function(TimeoutError)
+
+
+def test_timeout_for_coroutine_function():
+    logger = MemoryLogger()
+    cancelled = []
+
+    @escape(ValueError, default='expired', timeout=0.01, logger=logger)
+    async def function(delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return 'kek'
+
+    assert asyncio.run(function(1)) == 'expired'
+    assert cancelled == [True]
+    assert asyncio.run(function(0)) == 'kek'
+
+    assert len(logger.data) == 1
+    assert logger.data.exception[0].message == 'When executing coroutine function "function", the exception "CallTimeoutError" ("The call did not complete within 0.01 seconds.") was suppressed.'
+
+
+def test_timeout_for_coroutine_function_and_exceptions():
+    @escape(ValueError, default='kek', timeout=1)
+    async def function(exception):
+        raise exception
+
+    assert asyncio.run(function(ValueError)) == 'kek'
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(function(asyncio.TimeoutError))
+
+
+def test_timeout_for_coroutine_function_is_cancelled_from_outside():
+    @escape(timeout=1)
+    async def function():
+        await asyncio.sleep(1)
+
+    async def main():
+        task = asyncio.ensure_future(function())
+        await asyncio.sleep(0.001)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    'timeout',
+    [
+        0,
+        -1,
+        True,
+        'kek',
+    ],
+)
+def test_wrong_timeout(timeout):
+    with pytest.raises(ValueError, match=full_match('The timeout must be a positive number.')):
+        escape(timeout=timeout)
+
+
+def test_timeout_for_generator_function_and_context_manager():
+    with pytest.raises(ValueError, match=full_match('You cannot set a timeout for the generator function. This is only possible for normal and coroutine functions.')):
+        @escape(timeout=1)
+        def function():
+            yield
+
+    with pytest.raises(ValueError, match=full_match('You cannot set a timeout for the context manager. This is only possible for the decorator.')):
+        with escape(timeout=1):
+            ...
+
+
+def test_hedging_for_coroutine_function_when_first_attempt_is_slow():
+    attempts = []
+    cancelled = []
+
+    @escape(hedge_after=0.01)
+    async def function(a, b=1):
+        attempts.append(a + b)
+        if len(attempts) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return 'first'
+        return 'second'
+
+    async def main():
+        result = await function(1, b=2)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == 'second'
+    assert attempts == [3, 3]
+    assert cancelled == [True]
+
+
+def test_hedging_for_coroutine_function_when_first_attempt_is_fast():
+    attempts = []
+
+    @escape(hedge_after=1)
+    async def function():
+        attempts.append(True)
+        return 'kek'
+
+    assert asyncio.run(function()) == 'kek'
+    assert attempts == [True]
+
+
+def test_hedging_for_coroutine_function_when_hedged_attempt_fails():
+    attempts = []
+
+    @escape(hedge_after=0.01, default='default')
+    async def function():
+        attempts.append(True)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.05)
+            return 'first'
+        raise ValueError
+
+    assert asyncio.run(function()) == 'first'
+    assert len(attempts) == 2
+
+
+def test_hedging_for_coroutine_function_when_all_attempts_fail():
+    logger = MemoryLogger()
+    attempts = []
+
+    @escape(ValueError, hedge_after=0.01, default='default', logger=logger)
+    async def function():
+        attempts.append(True)
+        await asyncio.sleep(0.02)
+        raise ValueError('message')
+
+    assert asyncio.run(function()) == 'default'
+    assert len(attempts) == 2
+
+    assert len(logger.data) == 1
+    assert logger.data.exception[0].message == 'When executing coroutine function "function", the exception "ValueError" ("message") was suppressed.'
+
+
+def test_hedging_for_coroutine_function_when_first_attempt_fails_before_delay():
+    attempts = []
+
+    @escape(ValueError, hedge_after=1)
+    async def function():
+        attempts.append(True)
+        raise ValueError
+
+    @escape(ValueError, hedge_after=1)
+    async def another_function():
+        raise ZeroDivisionError
+
+    assert asyncio.run(function()) is None
+    assert attempts == [True]
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(another_function())
+
+
+def test_hedging_with_timeout():
+    @escape(hedge_after=0.001, timeout=0.01, default='expired')
+    async def function():
+        await asyncio.sleep(1)
+
+    assert asyncio.run(function()) == 'expired'
+
+
+@pytest.mark.parametrize(
+    'hedge_after',
+    [
+        -1,
+        True,
+        'kek',
+    ],
+)
+def test_wrong_hedging_delay(hedge_after):
+    with pytest.raises(ValueError, match=full_match('The hedging delay must be a non-negative number.')):
+        escape(hedge_after=hedge_after)
+
+
+def test_hedging_for_not_coroutine_function_and_context_manager():
+    with pytest.raises(ValueError, match=full_match('You cannot hedge calls of the function. This is only possible for coroutine functions.')):
+        @escape(hedge_after=1)
+        def function():
+            pass
+
+    with pytest.raises(ValueError, match=full_match('You cannot hedge calls of the function. This is only possible for coroutine functions.')):
+        @escape(hedge_after=1)
+        def generator_function():
+            yield
+
+    with pytest.raises(ValueError, match=full_match('You cannot hedge calls inside the context manager. This is only possible for coroutine functions.')):
+        with escape(hedge_after=1):
+            ...
+
+
+def test_single_flight_for_coroutine_function():
+    logger = MemoryLogger()
+    calls = []
+
+    @escape(ValueError, default='default', single_flight=True, logger=logger)
+    async def function(a, b=1):
+        calls.append((a, b))
+        await asyncio.sleep(0.01)
+        if a == 'error':
+            raise ValueError
+        return a
+
+    async def main():
+        return await asyncio.gather(
+            function(1),
+            function(1),
+            function(1, b=1),
+            function(2),
+            function('error'),
+            function('error'),
+        )
+
+    assert asyncio.run(main()) == [1, 1, 1, 2, 'default', 'default']
+    assert calls == [(1, 1), (1, 1), (2, 1), ('error', 1)]
+    assert len(logger.data) == 1
+
+    assert asyncio.run(function(1)) == 1
+    assert len(calls) == 5
+
+
+def test_single_flight_for_coroutine_function_with_unhashable_arguments():
+    calls = []
+
+    @escape(single_flight=True)
+    async def function(a):
+        calls.append(a)
+        await asyncio.sleep(0.01)
+        return len(a)
+
+    async def main():
+        return await asyncio.gather(function([1]), function([1]))
+
+    assert asyncio.run(main()) == [1, 1]
+    assert len(calls) == 2
+
+
+def test_single_flight_for_coroutine_function_when_one_caller_is_cancelled():
+    @escape(single_flight=True)
+    async def function():
+        await asyncio.sleep(0.01)
+        return 'kek'
+
+    async def main():
+        first = asyncio.ensure_future(function())
+        second = asyncio.ensure_future(function())
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 'kek'
+
+
+def count_flight_followers(monkeypatch):
+    followers = Semaphore(0)
+
+    class CountingEvent(Event):
+        def wait(self, timeout=None):
+            followers.release()
+            return super().wait(timeout)
+
+    monkeypatch.setattr('escape.single_flight.Event', CountingEvent)
+    return followers
+
+
+def test_single_flight_for_usual_function(monkeypatch):
+    followers = count_flight_followers(monkeypatch)
+    started = Event()
+    release = Event()
+    calls = []
+    results = []
+
+    @escape(ValueError, default='default', single_flight=True)
+    def function(a):
+        calls.append(a)
+        started.set()
+        release.wait()
+        return a
+
+    threads = [Thread(target=lambda: results.append(function(1))) for _ in range(3)]
+
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for _ in threads[1:]:
+        assert followers.acquire(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1, 1, 1]
+    assert calls == [1]
+
+    assert function(1) == 1
+    assert calls == [1, 1]
+
+
+def test_single_flight_for_usual_function_and_not_suppressed_exception(monkeypatch):
+    followers = count_flight_followers(monkeypatch)
+    started = Event()
+    release = Event()
+    errors = []
+
+    @escape(ValueError, single_flight=True)
+    def function():
+        started.set()
+        release.wait()
+        raise ZeroDivisionError
+
+    def run():
+        try:
+            function()
+        except ZeroDivisionError as e:
+            errors.append(e)
+
+    threads = [Thread(target=run) for _ in range(2)]
+    threads[0].start()
+    started.wait()
+    threads[1].start()
+    assert followers.acquire(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 2
+
+
+def test_single_flight_for_generator_function_and_context_manager():
+    with pytest.raises(ValueError, match=full_match('You cannot deduplicate calls of the generator function. This is only possible for normal and coroutine functions.')):
+        @escape(single_flight=True)
+        def function():
+            yield
+
+    with pytest.raises(ValueError, match=full_match('You cannot deduplicate calls inside the context manager. This is only possible for the decorator.')):
+        with escape(single_flight=True):
+            ...
+
+
+@pytest.mark.parametrize(
+    ('extra_arguments', 'message'),
+    [
+        ({'timeout': 1}, 'When the defaults are passed as a dictionary together with a timeout, the dictionary must contain a default for "CallTimeoutError".'),
+        ({'max_concurrency': 1}, 'When the defaults are passed as a dictionary together with the maximum number of concurrent calls, the dictionary must contain a default for "ConcurrencyLimitExceededError".'),
+    ],
+)
+def test_defaults_by_exception_type_without_internal_errors(extra_arguments, message):
+    with pytest.raises(ValueError, match=full_match(message)):
+        escape({ValueError: 1}, **extra_arguments)
+
+
+def test_defaults_by_exception_type_for_unlisted_exception():
+    assert escape({ValueError: 1}).get_default(KeyError()) is None
+
+
+def test_defaults_by_exception_type_and_internal_errors():
+    @escape({ValueError: 1, CallTimeoutError: 2}, timeout=0.01)
+    def function():
+        sleep(0.1)
+
+    @escape({TimeoutError: 3, ConcurrencyLimitExceededError: 4}, timeout=0.01, max_concurrency=1)
+    def other_function():
+        sleep(0.1)
+
+    @escape({...: 5}, timeout=0.01, max_concurrency=1)
+    def function_with_ellipsis():
+        sleep(0.1)
+
+    assert function() == 2
+    assert other_function() == 3
+    assert function_with_ellipsis() == 5
+
+
+def test_single_flight_for_usual_function_with_unhashable_arguments():
+    calls = []
+
+    @escape(single_flight=True)
+    def function(a):
+        calls.append(a)
+        return len(a)
+
+    assert function([1]) == 1
+    assert function([1]) == 1
+    assert len(calls) == 2
+
+
+def test_not_suppressed_exceptions_are_reraised_without_extra_traceback_entries():
+    def count_wrapper_frames(exception):
+        return sum(frame.f_code.co_filename.endswith('wrapper.py') for frame, _ in walk_tb(exception.__traceback__))
+
+    @escape(ValueError)
+    @escape(KeyError)
+    def function():
+        raise ZeroDivisionError
+
+    @escape(ValueError)
+    @escape(KeyError)
+    async def async_function():
+        raise ZeroDivisionError
+
+    @escape(ValueError)
+    @escape(KeyError)
+    def generator_function():
+        yield
+        raise ZeroDivisionError
+
+    def callback():
+        raise ZeroDivisionError
+
+    @escape(ValueError, before=callback)
+    def function_with_callback():
+        pass  # pragma: no cover
+
+    with pytest.raises(ZeroDivisionError) as exception_info:
+        function()
+    assert count_wrapper_frames(exception_info.value) == 2
+
+    with pytest.raises(ZeroDivisionError) as exception_info:
+        asyncio.run(async_function())
+    assert count_wrapper_frames(exception_info.value) == 2
+
+    with pytest.raises(ZeroDivisionError) as exception_info:
+        list(generator_function())
+    assert count_wrapper_frames(exception_info.value) == 2
+
+    with pytest.raises(ZeroDivisionError) as exception_info:
+        function_with_callback()
+    assert count_wrapper_frames(exception_info.value) == 2
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'expected_exceptions'),
+    [
+        ((ValueError, ValueError), (ValueError,)),
+        ((ValueError, Exception, ValueError, Exception), (Exception,)),
+        ((ZeroDivisionError, ValueError), (ValueError, ZeroDivisionError)),
+        ((ValueError, ZeroDivisionError), (ValueError, ZeroDivisionError)),
+        ((ArithmeticError, ZeroDivisionError, KeyError, LookupError), (ArithmeticError, LookupError)),
+        (({KeyError: 1, LookupError: 2},), (LookupError,)),
+        ((), ()),
+    ],
+)
+def test_exceptions_are_normalized(arguments, expected_exceptions):
+    assert escape(*arguments).exceptions == expected_exceptions
+
+
+def test_exceptions_of_baked_escaper_are_normalized():
+    escaper = escape.bake(ValueError, Exception)
+
+    assert escaper(ValueError, KeyError).exceptions == (Exception,)
+
+
+def test_exceptions_with_ellipsis_are_normalized():
+    assert escape(ValueError, ...).exceptions == escape(...).exceptions
+    assert len(set(escape(...).exceptions)) == len(escape(...).exceptions)
+
+
+def test_exceptions_with_internal_errors_are_normalized():
+    assert escape(Exception, max_concurrency=1, timeout=1).exceptions == (Exception,)
+
+
+def test_context_manager_logs_suppressed_exception_once():
+    class SomeError(ValueError, KeyError):
+        pass
+
+    logger = MemoryLogger()
+
+    with escape(KeyError, ValueError, Exception, logger=logger):
+        raise SomeError
+
+    with escape(KeyError, ValueError, logger=logger):
+        raise SomeError
+
+    assert len(logger.data) == 2
+    assert len(logger.data.exception) == 2
@@ -0,0 +1,203 @@
+import asyncio
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.wrapper import Wrapper
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    readings = []
+    monkeypatch.setattr('escape.slow_calls.monotonic', lambda: readings.pop(0))
+    return readings
+
+
+def test_slow_function_is_reported(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 10.75))
+
+    @escape(ValueError, slow_threshold=0.5, logger=logger, doc='database')
+    def function():
+        return 1
+
+    assert function() == 1
+    assert len(logger.data) == 1
+    assert logger.data.warning[0].message == 'The function "function" (database) took 0.750 seconds, which is longer than the threshold of 0.5 seconds.'
+    assert clock == []
+
+
+def test_fast_function_is_not_reported(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 10.25))
+
+    @escape(ValueError, slow_threshold=0.5, logger=logger)
+    def function():
+        return 1
+
+    assert function() == 1
+    assert len(logger.data) == 0
+
+
+def test_slow_failed_function_is_reported(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 12.0, 20.0, 22.0))
+
+    @escape(ValueError, default=2, slow_threshold=1, logger=logger)
+    def function(exception):
+        raise exception('oh!')
+
+    assert function(ValueError) == 2
+    with pytest.raises(TypeError):
+        function(TypeError)
+
+    assert logger.data.warning[0].message == 'The function "function" took 2.000 seconds, which is longer than the threshold of 1 seconds.'
+    assert logger.data.warning[1].message == 'The function "function" took 2.000 seconds, which is longer than the threshold of 1 seconds.'
+    assert logger.data.exception[0].message == 'When executing function "function", the exception "ValueError" ("oh!") was suppressed.'
+    assert logger.data.error[0].message == 'When executing function "function", the exception "TypeError" ("oh!") was not suppressed.'
+
+
+def test_slow_coroutine_function_is_reported(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 11.0, 20.0, 20.1))
+
+    @escape(ValueError, slow_threshold=0.5, logger=logger)
+    async def function():
+        return 1
+
+    assert asyncio.run(function()) == 1
+    assert asyncio.run(function()) == 1
+    assert len(logger.data) == 1
+    assert logger.data.warning[0].message == 'The coroutine function "function" took 1.000 seconds, which is longer than the threshold of 0.5 seconds.'
+
+
+def test_slow_generator_function_is_reported(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 10.25, 20.0, 20.5, 30.0, 30.25))
+
+    @escape(ValueError, slow_threshold=0.5, logger=logger)
+    def function():
+        yield 1
+        yield 2
+        return 3
+
+    assert list(function()) == [1, 2]
+    assert clock == []
+    assert logger.data.warning[0].message == 'The generator function "function" took 1.000 seconds, which is longer than the threshold of 0.5 seconds.'
+
+
+def test_time_of_consumer_is_not_counted_for_generator_function(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 10.125, 20.0, 20.125, 30.0, 30.125))
+
+    @escape(ValueError, slow_threshold=0.5, logger=logger)
+    def function():
+        yield 1
+        yield 2
+
+    assert list(function()) == [1, 2]
+    assert clock == []
+    assert len(logger.data) == 0
+
+
+def test_send_and_throw_into_slow_generator_function(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 10.5, 20.0, 20.5, 30.0, 30.5))
+    received = []
+
+    @escape(ValueError, slow_threshold=1, logger=logger)
+    def function():
+        received.append((yield 1))
+        try:
+            yield 2
+        except ZeroDivisionError as error:
+            received.append(error)
+        return 3
+
+    generator = function()
+
+    assert next(generator) == 1
+    assert generator.send('kek') == 2
+    with pytest.raises(StopIteration):
+        generator.throw(ZeroDivisionError)
+
+    assert received[0] == 'kek'
+    assert isinstance(received[1], ZeroDivisionError)
+    assert clock == []
+    assert logger.data.warning[0].message == 'The generator function "function" took 1.500 seconds, which is longer than the threshold of 1 seconds.'
+
+
+def test_closed_slow_generator_function_is_reported(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 10.5, 20.0, 20.75))
+    closed = []
+
+    @escape(ValueError, slow_threshold=1, logger=logger)
+    def function():
+        try:
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    generator = function()
+
+    assert next(generator) == 1
+    generator.close()
+
+    assert closed == [True]
+    assert clock == []
+    assert logger.data.warning[0].message == 'The generator function "function" took 1.250 seconds, which is longer than the threshold of 1 seconds.'
+
+
+def test_real_clock():
+    logger = MemoryLogger()
+
+    @escape(slow_threshold=1000, logger=logger)
+    def function():
+        return 1
+
+    assert function() == 1
+    assert len(logger.data) == 0
+
+
+def test_baked_slow_threshold(clock):
+    logger = MemoryLogger()
+    clock.extend((10.0, 11.0))
+    escaper = escape.bake(ValueError, slow_threshold=0.5, logger=logger)
+
+    @escaper
+    def function():
+        return 1
+
+    assert function() == 1
+    assert len(logger.data.warning) == 1
+
+
+def test_functions_with_slow_threshold_are_not_flattened():
+    def function():
+        return 1
+
+    assert escape(ValueError)(escape(KeyError, slow_threshold=1)(function)).func is Wrapper.run_function
+    assert escape(ValueError, slow_threshold=1)(escape(KeyError)(function)).func is Wrapper.run_function
+
+
+def test_slow_threshold_for_context_manager():
+    with pytest.raises(ValueError, match=full_match('You cannot set a slow call threshold for the context manager. This is only possible for the decorator.')), escape(slow_threshold=1):
+        pass  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    'slow_threshold',
+    [
+        0,
+        -1,
+        True,
+        'kek',
+    ],
+)
+def test_wrong_slow_threshold(slow_threshold):
+    with pytest.raises(ValueError, match=full_match('The slow call threshold must be a positive number.')):
+        escape(slow_threshold=slow_threshold)
@@ -0,0 +1,296 @@
+import asyncio
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, get_all_start_methods
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+import full_match
+
+import escape
+from escape.protocols import StatisticsProtocol
+from escape.statistics import SharedStatistics, StatisticsSlot, forget_rows, main
+
+
+@pytest.fixture
+def statistics():
+    statistics = SharedStatistics.create(['db', 'http'])
+    yield statistics
+    statistics.close()
+    statistics.unlink()
+
+
+def escaped_division(slot, numbers):
+    @escape(ZeroDivisionError, statistics=slot)
+    def function(number):
+        return 1 / number
+
+    for number in numbers:
+        function(number)
+
+
+def record_successes(statistics, number):
+    slot = statistics.slot('db')
+    for _ in range(number):
+        slot.record_success()
+
+
+def test_new_statistics_are_empty(statistics):
+    assert statistics.policies == ['db', 'http']
+    assert statistics.totals() == {
+        'db': {'success': 0, 'suppressed': 0, 'not_suppressed': 0},
+        'http': {'success': 0, 'suppressed': 0, 'not_suppressed': 0},
+    }
+
+
+def test_slot_is_statistics_protocol(statistics):
+    assert isinstance(statistics.slot('db'), StatisticsSlot)
+    assert isinstance(statistics.slot('db'), StatisticsProtocol)
+
+
+def test_record_outcomes_of_functions_and_context_manager(statistics):
+    slot = statistics.slot('http')
+
+    @escape(ValueError, statistics=slot)
+    def function(exception):
+        if exception is not None:
+            raise exception
+
+    @escape(ValueError, statistics=slot)
+    async def async_function(exception):
+        if exception is not None:
+            raise exception
+
+    @escape(ValueError, statistics=slot)
+    def generator_function(exception):
+        yield
+        if exception is not None:
+            raise exception
+
+    function(None)
+    function(ValueError)
+    with pytest.raises(ZeroDivisionError):
+        function(ZeroDivisionError)
+    asyncio.run(async_function(None))
+    asyncio.run(async_function(ValueError))
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(async_function(ZeroDivisionError))
+    list(generator_function(None))
+    list(generator_function(ValueError))
+    with pytest.raises(ZeroDivisionError):
+        list(generator_function(ZeroDivisionError))
+
+    with escape(ValueError, statistics=slot):
+        raise ValueError
+    with escape(ValueError, statistics=slot):
+        pass
+    with pytest.raises(ZeroDivisionError), escape(ValueError, statistics=slot):
+        raise ZeroDivisionError
+
+    assert statistics.totals()['http'] == {'success': 4, 'suppressed': 4, 'not_suppressed': 4}
+    assert statistics.totals()['db'] == {'success': 0, 'suppressed': 0, 'not_suppressed': 0}
+
+
+def test_statistics_with_baked_escaper(statistics):
+    escaper = escape.bake(ValueError, statistics=statistics.slot('db'))
+
+    with escaper:
+        raise ValueError
+
+    assert statistics.totals()['db']['suppressed'] == 1
+
+
+@pytest.mark.parametrize(
+    'start_method',
+    [
+        pytest.param('fork', marks=pytest.mark.skipif('fork' not in get_all_start_methods(), reason='The "fork" start method is not available on this platform.')),
+        'spawn',
+    ],
+)
+def test_statistics_are_shared_between_processes(start_method):
+    context = get_context(start_method)
+    statistics = SharedStatistics.create(['db'])
+    processes = [context.Process(target=escaped_division, args=(statistics.slot('db'), [1, 0, 2])) for _ in range(3)]
+
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert statistics.totals()['db'] == {'success': 6, 'suppressed': 3, 'not_suppressed': 0}
+
+    statistics.close()
+    statistics.unlink()
+
+
+@pytest.mark.parametrize(
+    'start_method',
+    [
+        pytest.param('fork', marks=pytest.mark.skipif('fork' not in get_all_start_methods(), reason='The "fork" start method is not available on this platform.')),
+        'spawn',
+    ],
+)
+def test_no_increments_are_lost_in_process_pool(statistics, start_method):
+    with ProcessPoolExecutor(max_workers=4, mp_context=get_context(start_method)) as executor:
+        for future in [executor.submit(record_successes, statistics, 20000) for _ in range(8)]:
+            future.result()
+
+    assert statistics.totals()['db']['success'] == 160000
+
+
+def test_forked_process_claims_its_own_row(statistics):
+    slot = statistics.slot('db')
+    slot.record_success()
+    counters = statistics.counters
+    lock = statistics.lock
+
+    forget_rows()
+
+    assert statistics.counters is None
+    assert statistics.lock is not lock
+
+    slot.record_success()
+
+    assert statistics.counters is not None
+    assert statistics.counters is not counters
+    assert statistics.totals()['db']['success'] == 2
+
+    counters = statistics.counters
+
+    assert statistics.claim_row() is counters
+
+
+def test_all_rows_are_used(statistics, monkeypatch):
+    monkeypatch.setattr('escape.statistics.try_lock_byte', lambda descriptor, position: False)
+
+    with pytest.raises(RuntimeError, match=full_match(f'All 256 rows of the shared memory segment "{statistics.name}" are used by other processes.')):
+        statistics.slot('db').record_success()
+
+    assert statistics.descriptor == -1
+
+
+def test_attach_by_name(statistics):
+    escaped_division(statistics.slot('db'), [0])
+
+    attached = SharedStatistics.attach(statistics.name)
+    escaped_division(attached.slot('db'), [1])
+
+    assert attached.policies == ['db', 'http']
+    assert attached.totals() == statistics.totals()
+    assert statistics.totals()['db'] == {'success': 1, 'suppressed': 1, 'not_suppressed': 0}
+
+    attached.close()
+    attached.close()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='The resource tracker is used only on POSIX systems.')
+@pytest.mark.parametrize(
+    ('parent', 'unregistered'),
+    [
+        (None, True),
+        (object(), False),
+    ],
+)
+def test_attach_unregisters_segment_only_outside_of_multiprocessing_children(statistics, monkeypatch, parent, unregistered):
+    calls = []
+    monkeypatch.setattr('escape.statistics.resource_tracker.unregister', lambda name, rtype: calls.append((name, rtype)))
+    monkeypatch.setattr('escape.statistics.parent_process', lambda: parent)
+
+    SharedStatistics.attach(statistics.name).close()
+
+    assert bool(calls) is unregistered
+
+
+def test_rows_file_is_removed_with_segment():
+    statistics = SharedStatistics.create(['db'])
+    statistics.slot('db').record_success()
+    path = statistics.rows_path
+
+    assert os.path.exists(path)
+
+    statistics.close()
+    statistics.unlink()
+
+    assert not os.path.exists(path)
+
+
+def test_pickle_slot(statistics):
+    slot = pickle.loads(pickle.dumps(statistics.slot('http')))
+
+    slot.record_not_suppressed()
+
+    assert slot.statistics is statistics
+    assert statistics.totals()['http']['not_suppressed'] == 1
+
+
+def test_repeated_unpickling_attaches_once_per_process(statistics, monkeypatch):
+    data = pickle.dumps(escape(ValueError, statistics=statistics.slot('db')))
+    monkeypatch.setattr('escape.statistics.attached', {})
+
+    policies = [pickle.loads(data) for _ in range(200)]
+    attached = policies[0].statistics.statistics
+
+    assert attached is not statistics
+    assert all(policy.statistics.statistics is attached for policy in policies)
+
+    policies[0].statistics.record_success()
+
+    assert statistics.totals()['db']['success'] == 1
+
+    attached.close()
+
+    assert pickle.loads(data).statistics.statistics is not attached
+
+    pickle.loads(data).statistics.statistics.close()
+
+
+def test_command_line_interface(statistics, capsys):
+    statistics.slot('db').record_success()
+
+    main([statistics.name])
+
+    assert capsys.readouterr().out == 'db success=1 suppressed=0 not_suppressed=0\nhttp success=0 suppressed=0 not_suppressed=0\n'
+
+
+def test_unknown_policy(statistics):
+    with pytest.raises(KeyError, match=full_match("'The policy \"kek\" is not registered.'")):
+        statistics.slot('kek')
+
+
+@pytest.mark.parametrize(
+    ('policies', 'message'),
+    [
+        (['db', 'db'], 'The names of the policies must be unique.'),
+        ([''], 'The name of a policy must contain from 1 to 64 bytes in UTF-8.'),
+        (['x' * 65], 'The name of a policy must contain from 1 to 64 bytes in UTF-8.'),
+    ],
+)
+def test_wrong_policies(policies, message):
+    with pytest.raises(ValueError, match=full_match(message)):
+        SharedStatistics.create(policies)
+
+
+@pytest.mark.parametrize(
+    'max_processes',
+    [
+        0,
+        -1,
+        1.5,
+        True,
+    ],
+)
+def test_wrong_max_processes(max_processes):
+    with pytest.raises(ValueError, match=full_match('The maximum number of processes must be a positive integer.')):
+        SharedStatistics.create(['db'], max_processes=max_processes)
+
+
+def test_wrong_shared_memory_segment():
+    memory = SharedMemory(create=True, size=64)
+
+    try:
+        with pytest.raises(ValueError, match=full_match(f'The shared memory segment "{memory.name}" does not contain escape statistics.')):
+            SharedStatistics(memory)
+    finally:
+        memory.close()
+        memory.unlink()
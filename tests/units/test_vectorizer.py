@@ -0,0 +1,173 @@
+import sys
+from math import isnan
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.vectorizer import Vectorizer, VectorizedResult
+
+
+numpy = pytest.importorskip('numpy')
+
+
+def reciprocal(number):
+    if number == 13:
+        raise ValueError('unlucky')
+    return 1 / number
+
+
+def test_vectorize_returns_vectorizer():
+    assert isinstance(escape.vectorize(reciprocal), Vectorizer)
+
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [
+        1,
+        3,
+        4096,
+    ],
+)
+def test_values_mask_and_histogram(chunk_size):
+    result = escape.vectorize(reciprocal, ZeroDivisionError, ValueError, chunk_size=chunk_size)(numpy.array([1, 0, 2, 13, 0, 4]))
+
+    assert isinstance(result, VectorizedResult)
+    assert result.values.dtype == numpy.float64
+    assert numpy.array_equal(result.values, [1.0, numpy.nan, 0.5, numpy.nan, numpy.nan, 0.25], equal_nan=True)
+    assert result.failed.tolist() == [False, True, False, True, True, False]
+    assert result.exceptions == {ZeroDivisionError: 2, ValueError: 1}
+
+
+def test_unpacking_of_result():
+    values, failed, exceptions = escape.vectorize(reciprocal)([2, 4])
+
+    assert values.tolist() == [0.5, 0.25]
+    assert not failed.any()
+    assert exceptions == {}
+
+
+def test_shape_is_kept():
+    values, failed, exceptions = escape.vectorize(reciprocal, ZeroDivisionError, chunk_size=2)(numpy.array([[1, 0, 2], [4, 5, 0]]))
+
+    assert values.shape == (2, 3)
+    assert failed.tolist() == [[False, True, False], [False, False, True]]
+    assert exceptions == {ZeroDivisionError: 2}
+
+
+def test_scalar_and_empty_arrays():
+    values, failed, _ = escape.vectorize(reciprocal)(numpy.float64(0))
+
+    assert values.shape == ()
+    assert isnan(values)
+    assert failed
+
+    values, failed, exceptions = escape.vectorize(reciprocal)(numpy.array([]))
+
+    assert values.shape == (0,)
+    assert failed.shape == (0,)
+    assert exceptions == {}
+
+
+def test_default_and_dtype():
+    values, _, _ = escape.vectorize(reciprocal, ZeroDivisionError, default=-1.0)([0, 1])
+
+    assert values.tolist() == [-1.0, 1.0]
+
+    values, _, _ = escape.vectorize(str, dtype=object)([1, 2])
+
+    assert values.tolist() == ['1', '2']
+
+
+@pytest.mark.parametrize(
+    'dtype',
+    [
+        int,
+        bool,
+        str,
+        'datetime64[s]',
+    ],
+)
+def test_dtype_that_cannot_hold_nan_requires_default(dtype):
+    with pytest.raises(ValueError, match=full_match(f'Failed elements cannot be filled with NaN in an array of type "{numpy.dtype(dtype)}", pass default or default_factory.')):
+        escape.vectorize(lambda number: 10 // number, ZeroDivisionError, dtype=dtype)
+
+
+def test_dtype_that_cannot_hold_nan_with_default():
+    assert escape.vectorize(lambda number: 10 // number, ZeroDivisionError, dtype=int, default=-1)(numpy.array([1, 0])).values.tolist() == [10, -1]
+    assert escape.vectorize(lambda number: 10 // number, ZeroDivisionError, dtype=int, default_factory=lambda: 0)(numpy.array([1, 0])).values.tolist() == [10, 0]
+    assert escape.vectorize(lambda number: 10 // number, ZeroDivisionError, dtype=complex)(numpy.array([2])).values.tolist() == [5]
+
+
+def test_default_factory():
+    values, _, _ = escape.vectorize(reciprocal, default_factory=lambda exception: 100.0 if isinstance(exception, ValueError) else -100.0)([13, 0])
+
+    assert values.tolist() == [100.0, -100.0]
+
+
+def test_not_suppressed_exception():
+    logger = MemoryLogger()
+
+    with pytest.raises(ZeroDivisionError, match=full_match('division by zero')):
+        escape.vectorize(reciprocal, ValueError, chunk_size=1, logger=logger, doc='some doc')([1, 0, 2])
+
+    assert logger.data.error[0].message == 'When executing function "reciprocal" (some doc), the exception "ZeroDivisionError" ("division by zero") was not suppressed.'
+
+
+def test_suppressed_exceptions_are_logged_once():
+    logger = MemoryLogger()
+
+    escape.vectorize(reciprocal, logger=logger, doc='some doc')([0, 13, 0, 1])
+
+    assert len(logger.data) == 1
+    assert logger.data.error[0].message == 'When executing function "reciprocal" (some doc) for 4 items, 3 exceptions were suppressed: "ZeroDivisionError" (2), "ValueError" (1).'
+
+
+def test_nothing_is_logged_without_exceptions():
+    logger = MemoryLogger()
+
+    escape.vectorize(reciprocal, logger=logger)([1, 2])
+
+    assert len(logger.data) == 0
+
+
+def test_own_error_log_message():
+    logger = MemoryLogger()
+
+    escape.vectorize(reciprocal, logger=logger, error_log_message='Oh my God!')([0, 0])
+
+    with pytest.raises(ZeroDivisionError):
+        escape.vectorize(reciprocal, ValueError, logger=logger, error_log_message='Oh my God!')([0])
+
+    assert len(logger.data) == 2
+    assert [record.message for record in logger.data.error] == ['Oh my God!', 'Oh my God!']
+
+
+def test_wrong_arguments():
+    with pytest.raises(ValueError, match=full_match('You are using the vectorizer for the wrong purpose.')):
+        escape.vectorize(reciprocal, 'kek')
+
+    with pytest.raises(ValueError, match=full_match('You cannot set both a default value and a default factory.')):
+        escape.vectorize(reciprocal, default=1.0, default_factory=float)
+
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [
+        0,
+        -1,
+        1.5,
+        True,
+    ],
+)
+def test_wrong_chunk_size(chunk_size):
+    with pytest.raises(ValueError, match=full_match('The chunk size must be a positive integer.')):
+        escape.vectorize(reciprocal, chunk_size=chunk_size)
+
+
+def test_numpy_is_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    with pytest.raises(ImportError, match=full_match('NumPy is required for escape.vectorize, install it with "pip install escaping[numpy]".')):
+        escape.vectorize(reciprocal)
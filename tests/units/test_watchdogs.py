@@ -0,0 +1,238 @@
+import asyncio
+import pickle
+from threading import Thread, Event, current_thread
+from time import sleep, monotonic
+
+import pytest
+import full_match
+from emptylog import MemoryLogger
+
+import escape
+from escape.watchdogs import Watchdog
+from escape.wrapper import Wrapper
+
+
+def wait_for(condition):
+    deadline = monotonic() + 5
+    while not condition() and monotonic() < deadline:
+        sleep(0.001)  # pragma: no cover
+
+
+def test_watchdog_returns_watchdog():
+    watchdog = escape.watchdog(1)  # type: ignore[attr-defined]
+
+    assert isinstance(watchdog, Watchdog)
+    assert watchdog.threshold == 1
+    assert watchdog.interval == 1
+
+
+def test_calls_are_registered_while_they_are_running():
+    watchdog = escape.watchdog(1, interval=0.5)  # type: ignore[attr-defined]
+    registered = []
+
+    @escape(ValueError, watchdog=watchdog, doc='database')
+    def function():
+        registered.extend(watchdog.calls.values())
+        raise ValueError
+
+    assert function() is None
+    assert watchdog.calls == {}
+    assert len(registered) == 1
+    assert registered[0][1:] == (current_thread().ident, None, 'function "function" (database)')
+
+
+def test_stuck_function_is_reported_once_with_stack():
+    logger = MemoryLogger()
+    watchdog = escape.watchdog(0.01, logger=logger)  # type: ignore[attr-defined]
+    release = Event()
+
+    @escape(watchdog=watchdog)
+    def stuck_function():
+        release.wait()
+
+    thread = Thread(target=stuck_function, name='worker')
+    thread.start()
+    wait_for(lambda: watchdog.calls)
+    sleep(0.02)
+
+    watchdog.check()
+    watchdog.check()
+    release.set()
+    thread.join()
+    watchdog.check()
+
+    assert len(logger.data) == 1
+    message = logger.data.warning[0].message
+    assert message.startswith('The function "stuck_function" has been running for ')
+    assert ' seconds, which is longer than the threshold of 0.01 seconds. The stack of the thread "worker":\n' in message
+    assert 'in stuck_function\n' in message
+    assert '    release.wait()\n' in message
+    assert watchdog.reported == set()
+
+
+def test_fast_function_is_not_reported():
+    logger = MemoryLogger()
+    watchdog = escape.watchdog(1000, logger=logger)  # type: ignore[attr-defined]
+    release = Event()
+
+    @escape(watchdog=watchdog)
+    def function():
+        release.wait()
+
+    thread = Thread(target=function)
+    thread.start()
+    wait_for(lambda: watchdog.calls)
+
+    watchdog.check()
+    release.set()
+    thread.join()
+
+    assert len(logger.data) == 0
+
+
+def test_stuck_coroutine_function_is_reported_with_task_stack():
+    logger = MemoryLogger()
+    watchdog = escape.watchdog(0.01, logger=logger)  # type: ignore[attr-defined]
+
+    @escape(watchdog=watchdog)
+    async def stuck_coroutine_function(release):
+        await release.wait()
+
+    async def main():
+        release = asyncio.Event()
+        task = asyncio.create_task(stuck_coroutine_function(release), name='fetcher')
+        await asyncio.sleep(0.02)
+        watchdog.check()
+        release.set()
+        await task
+
+    asyncio.run(main())
+
+    assert len(logger.data) == 1
+    message = logger.data.warning[0].message
+    assert message.startswith('The coroutine function "stuck_coroutine_function" has been running for ')
+    assert 'The stack of the task "fetcher":\n' in message
+    assert 'in run_coroutine_function\n' in message
+    assert 'in stuck_coroutine_function\n    await release.wait()\n' in message
+
+
+def test_background_thread_reports_stuck_calls():
+    logger = MemoryLogger()
+    release = Event()
+
+    with escape.watchdog(0.01, interval=0.01, logger=logger) as watchdog:  # type: ignore[attr-defined]
+        @escape(watchdog=watchdog)
+        def function():
+            release.wait()
+
+        thread = Thread(target=function)
+        thread.start()
+        wait_for(lambda: logger.data.warning)
+        release.set()
+        thread.join()
+
+    assert watchdog.thread is None
+    assert len(logger.data.warning) == 1
+
+
+def test_start_and_stop_are_idempotent():
+    watchdog = escape.watchdog(1)  # type: ignore[attr-defined]
+
+    assert watchdog.start() is watchdog
+    thread = watchdog.thread
+    assert watchdog.start().thread is thread
+    assert thread.daemon
+    assert thread.name == 'escape-watchdog'
+
+    watchdog.stop()
+    watchdog.stop()
+
+    assert not thread.is_alive()
+    assert watchdog.start().thread is not thread
+    watchdog.stop()
+
+
+def test_pickled_watchdog_is_the_same_object_in_the_same_process():
+    watchdog = escape.watchdog(1, logger=MemoryLogger())  # type: ignore[attr-defined]
+
+    assert pickle.loads(pickle.dumps(watchdog)) is watchdog
+    assert watchdog.thread is None
+
+
+@pytest.mark.parametrize('running', [True, False])
+def test_pickled_watchdog_is_recreated_in_another_process(monkeypatch, running):
+    watchdog = escape.watchdog(1, interval=0.5, logger=MemoryLogger())  # type: ignore[attr-defined]
+    if running:
+        watchdog.start()
+    data = pickle.dumps(watchdog)
+    monkeypatch.setattr('escape.watchdogs.getpid', lambda: -1)
+
+    copy = pickle.loads(data)
+
+    assert copy is not watchdog
+    assert (copy.threshold, copy.interval, copy.identifier) == (1, 0.5, watchdog.identifier)
+    assert (copy.thread is not None) is running
+    assert pickle.loads(data) is copy
+
+    copy.stop()
+    watchdog.stop()
+
+
+def test_policy_with_watchdog_can_be_pickled():
+    watchdog = escape.watchdog(1)  # type: ignore[attr-defined]
+
+    policy = pickle.loads(pickle.dumps(escape(ValueError, watchdog=watchdog)))
+
+    assert policy.watchdog is watchdog
+    assert policy(lambda: 1)() == 1
+
+
+def test_functions_with_watchdog_are_not_flattened():
+    watchdog = escape.watchdog(1)  # type: ignore[attr-defined]
+
+    def function():
+        return 1
+
+    assert escape(ValueError)(escape(KeyError, watchdog=watchdog)(function)).func is Wrapper.run_function
+    assert escape(ValueError, watchdog=watchdog)(escape(KeyError)(function)).func is Wrapper.run_function
+
+
+def test_watchdog_for_generator_function():
+    def function():
+        yield 1  # pragma: no cover
+
+    with pytest.raises(ValueError, match=full_match('You cannot watch calls of the generator function. This is only possible for normal and coroutine functions.')):
+        escape(watchdog=escape.watchdog(1))(function)  # type: ignore[attr-defined]
+
+
+def test_watchdog_for_context_manager():
+    with pytest.raises(ValueError, match=full_match('You cannot watch calls inside the context manager. This is only possible for the decorator.')), escape(watchdog=escape.watchdog(1)):  # type: ignore[attr-defined]
+        pass  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    'threshold',
+    [
+        0,
+        -1,
+        True,
+        'kek',
+    ],
+)
+def test_wrong_threshold(threshold):
+    with pytest.raises(ValueError, match=full_match('The watchdog threshold must be a positive number.')):
+        escape.watchdog(threshold)  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    'interval',
+    [
+        0,
+        -1,
+        True,
+        'kek',
+    ],
+)
+def test_wrong_interval(interval):
+    with pytest.raises(ValueError, match=full_match('The watchdog interval must be a positive number.')):
+        escape.watchdog(1, interval=interval)  # type: ignore[attr-defined]